@@ -0,0 +1,103 @@
+"""Decode time and peak memory of DOAJ search pages per JSON mode.
+
+Pages are synthetic fixtures shaped like recorded API responses (see
+``doaj_pages``). Each mode hands out the records one at a time, as
+parse_search consumes them; "parse_search" rows run the spider callback
+itself (records become items, no requests are sent). Peak is traced
+separately from the timing.
+
+    python -m benchmarks.bench_doaj_json [--records 100 1000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from scrapy import Request
+from scrapy.http import TextResponse
+from scrapy.utils.test import get_crawler
+
+from benchmarks.doaj_pages import make_page
+from jurnal_scraping import doaj_json
+from jurnal_scraping.spiders.doaj_kesehatan_id import DoajKesehatanIndonesiaSpider
+
+
+def stdlib_records(body):
+    for record in json.loads(body)["results"]:
+        yield record
+
+
+def members_records(body, streaming):
+    for key, value in doaj_json.iter_members(body, streaming=streaming):
+        if key == "results":
+            yield value
+
+
+def make_parse_search(streaming):
+    crawler = get_crawler(
+        DoajKesehatanIndonesiaSpider,
+        {"DOAJ_JSON_STREAMING": streaming, "LANDING_RULES_ENABLED": False},
+    )
+    spider = crawler._create_spider()
+
+    def run(body):
+        # A page past the window: no follow-up requests, only items.
+        spider._local_seen_ids = set()
+        request = Request(
+            "https://doaj.org/api/v2/search/articles/gizi?page=50",
+            meta={"query": "gizi", "page": 50, "last_page": 50},
+        )
+        return spider.parse_search(TextResponse(request.url, body=body, request=request))
+
+    return run
+
+
+def measure(consume, body, repeat):
+    gc.collect()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in consume(body):
+            pass
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    for _ in consume(body):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sorted(timings)[len(timings) // 2], peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    modes = [
+        ("json.loads (stdlib)", stdlib_records),
+        (
+            f"doaj_json.loads ({'orjson' if doaj_json.orjson else 'stdlib'})",
+            lambda body: members_records(body, False),
+        ),
+        ("doaj_json streaming", lambda body: members_records(body, True)),
+        ("parse_search", make_parse_search(False)),
+        ("parse_search streaming", make_parse_search(True)),
+    ]
+    print(f"{'mode':<28} {'records':>7} {'page KB':>8} {'ms':>8} {'peak MB':>8}")
+    for records in args.records:
+        body = make_page(1, records, page_size=records)
+        for name, consume in modes:
+            seconds, peak = measure(consume, body, args.repeat)
+            print(
+                f"{name:<28} {records:>7} {len(body) / 1024:>8.0f} "
+                f"{seconds * 1000:>8.2f} {peak / 2**20:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Memory and build time of the dedup key stores at 1M keys.
+
+Peak is the largest traced allocation while building the store; size is what
+stays allocated once it is built. "str set x2" is the original layout (key
+strings in the pipeline's set plus the copy handed to the spider).
+
+    python -m benchmarks.bench_keyset_memory [--keys 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from array import array
+from itertools import chain
+
+from jurnal_scraping.keyset import BloomFilter, DigestSet
+from jurnal_scraping.resume_index import key_digest
+
+
+def make_keys(count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"https://journal{rng.randrange(500)}.ac.id/index.php/j/article/download/"
+        f"{i}/{rng.randrange(10**5)}|judul artikel kesehatan nomor {i}"
+        for i in range(count)
+    ]
+
+
+def measure(build):
+    # Timed and traced separately: tracing slows allocations down a lot.
+    gc.collect()
+    started = time.perf_counter()
+    store = build()
+    elapsed = time.perf_counter() - started
+    del store
+    gc.collect()
+    tracemalloc.start()
+    store = build()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return elapsed, size, peak
+
+
+def build_added(digests):
+    store = DigestSet()
+    for digest in digests:
+        store.add(digest)
+    return store
+
+
+def build_rebuild_merge(digests):
+    # The previous DigestSet merge: re-sort every key on each merge.
+    keys, tail = array("Q"), set()
+    for digest in digests:
+        tail.add(digest)
+        if len(tail) > max(4096, len(keys) // 8):
+            keys = array("Q", sorted(set(chain(keys, tail))))
+            tail = set()
+    return array("Q", sorted(set(chain(keys, tail))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    digests = array("Q", (key_digest(k) for k in keys))
+    runs = [
+        ("str set x2", lambda: (set(keys), set(keys))),
+        ("int set", lambda: set(digests)),
+        ("DigestSet rebuild merge (previous)", lambda: build_rebuild_merge(digests)),
+        ("DigestSet.update (bulk load)", lambda: DigestSet(digests)),
+        ("DigestSet.add (one by one)", lambda: build_added(digests)),
+        ("BloomFilter fp=0.001", lambda: BloomFilter(args.keys, 0.001, digests)),
+    ]
+    print(f"{'store':<36} {'seconds':>8} {'size MB':>8} {'peak MB':>8}")
+    for name, build in runs:
+        elapsed, size, peak = measure(build)
+        print(f"{name:<36} {elapsed:>8.2f} {size / 2**20:>8.1f} {peak / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Reactor latency and throughput of language detection per executor.
+
+Detects the same synthetic abstracts inline (on the reactor thread, as with
+LANGDETECT_WORKERS=0) and through DetectionPool with 1, 2, 4 and 8 thread and
+process workers, while a 10 ms LoopingCall measures how late the reactor
+runs it. Every text needs a real langdetect call (no cache, no pre-check).
+
+    python -m benchmarks.bench_langdetect_pool [--texts 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from twisted.internet import defer, reactor, task
+
+from jurnal_scraping.langid import DetectionPool, LanguageDetector
+
+_WORDS = (
+    "pasien rumah sakit gizi balita puskesmas perawat obat terapi klinis "
+    "patient hospital nutrition children nurse drug therapy clinical outcome "
+    "prevalensi risiko faktor analisis data sampel responden kuesioner"
+).split()
+
+
+def make_texts(count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_WORDS) for _ in range(120)) + f" {i}" for i in range(count)]
+
+
+class LagProbe:
+    """Records how late a 10 ms LoopingCall fires."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: list[float] = []
+        self._last = None
+        self._loop = task.LoopingCall(self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.lags.append(max(0.0, now - self._last - self.interval))
+        self._last = now
+
+    def start(self):
+        self._loop.start(self.interval)
+
+    def stop(self) -> tuple[float, float]:
+        self._loop.stop()
+        lags = sorted(self.lags) or [0.0]
+        return lags[int(len(lags) * 0.99) - 1 if len(lags) > 1 else 0] * 1000, lags[-1] * 1000
+
+
+@defer.inlineCallbacks
+def run_inline(texts):
+    detector = LanguageDetector(cache_size=0, preclassify=False)
+
+    def work():
+        for text in texts:
+            detector.detect(text)
+            yield None
+
+    yield task.cooperate(work()).whenDone()
+
+
+@defer.inlineCallbacks
+def run_pool(texts, workers, use_processes):
+    detector = LanguageDetector(cache_size=0, preclassify=False)
+    pool = DetectionPool(detector, workers=workers, use_processes=use_processes)
+    if use_processes:
+        # Start the workers before timing (spawned interpreters import langdetect).
+        yield defer.gatherResults([pool.detect(b"warm%d" % i, "warm up") for i in range(workers)])
+    yield defer.gatherResults([pool.detect(str(i).encode(), t) for i, t in enumerate(texts)])
+    pool.close()
+
+
+@defer.inlineCallbacks
+def main(args):
+    texts = make_texts(args.texts)
+    runs = [("inline", 0, lambda: run_inline(texts))]
+    for kind, use_processes in (("thread", False), ("process", True)):
+        for workers in (1, 2, 4, 8):
+            runs.append(
+                (kind, workers, lambda w=workers, p=use_processes: run_pool(texts, w, p))
+            )
+
+    print(f"{'executor':<8} {'workers':>7} {'items/s':>9} {'p99 lag ms':>11} {'max lag ms':>11}")
+    for kind, workers, run in runs:
+        probe = LagProbe()
+        probe.start()
+        started = time.perf_counter()
+        yield run()
+        elapsed = time.perf_counter() - started
+        p99, worst = probe.stop()
+        print(f"{kind:<8} {workers:>7} {len(texts) / elapsed:>9.1f} {p99:>11.1f} {worst:>11.1f}")
+    reactor.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=400)
+    reactor.callWhenRunning(main, parser.parse_args())
+    reactor.run()
@@ -0,0 +1,127 @@
+"""Load time and size of the CSV index vs the Parquet export at 100k rows.
+
+Rows carry the CsvAppendPipeline columns with abstracts of about 200 words.
+The CSV is written as CsvAppendPipeline writes it; the Parquet dataset as
+ParquetAppendPipeline does (parts of PARQUET_PART_ROWS rows in row groups
+of PARQUET_ROW_GROUP_ROWS), then once more after ``compact``. Load times
+are the median of ``--repeat`` full reads.
+
+    python -m benchmarks.bench_parquet_export [--rows 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from jurnal_scraping.parquet_store import ParquetPartWriter, compact, require_pyarrow
+from jurnal_scraping.pipelines import CsvAppendPipeline
+
+_WORDS = (
+    "penelitian ini bertujuan untuk mengetahui hubungan antara pengetahuan sikap "
+    "responden sampel metode analisis hasil menunjukkan terdapat pengaruh signifikan "
+    "kesehatan gizi balita stunting puskesmas ibu hamil pasien rumah sakit data"
+).split()
+FIELDS = CsvAppendPipeline.fieldnames
+
+
+def make_rows(count: int, seed: int = 1) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "journal_title": f"Jurnal Kesehatan {i % 400}",
+            "title": f"Judul artikel kesehatan nomor {i}",
+            "authors": "; ".join(f"Penulis {rng.randrange(10**5)}" for _ in range(3)),
+            "affiliation": f"Universitas {rng.randrange(300)}",
+            "abstract": " ".join(rng.choice(_WORDS) for _ in range(200)),
+            "pdf_url": f"https://journal{i % 400}.ac.id/index.php/j/article/download/{i}/1",
+            "pdf_local_path": f"pdfs/{i:040x}.pdf",
+            "source_url": f"https://doaj.org/article/{i:032x}",
+        }
+        for i in range(count)
+    ]
+
+
+def write_csv(path: Path, rows) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_parquet(directory: Path, rows) -> None:
+    writer = ParquetPartWriter(str(directory), FIELDS)
+    for row in rows:
+        writer.write(row)
+    writer.close()
+
+
+def size_mb(path: Path) -> float:
+    files = [path] if path.is_file() else list(path.glob("*.parquet"))
+    return sum(p.stat().st_size for p in files) / 2**20
+
+
+def median_seconds(load, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    require_pyarrow()
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    def read_dicts(path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    rows = make_rows(args.rows)
+    no_abstract = [name for name in FIELDS if name != "abstract"]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, parquet_dir = Path(tmp) / "index.csv", Path(tmp) / "export.parquet"
+        write_csv(csv_path, rows)
+        write_parquet(parquet_dir, rows)
+        parts = len(list(parquet_dir.glob("*.parquet")))
+
+        runs = [
+            ("csv.DictReader", csv_path, lambda: read_dicts(csv_path)),
+            ("pyarrow.csv.read_csv", csv_path, lambda: pa_csv.read_csv(csv_path)),
+            (f"parquet, {parts} parts", parquet_dir, lambda: pq.read_table(parquet_dir)),
+            (
+                f"parquet, {parts} parts, no abstract",
+                parquet_dir,
+                lambda: pq.read_table(parquet_dir, columns=no_abstract),
+            ),
+        ]
+        print(f"{'load':<34} {'rows':>7} {'MB':>7} {'seconds':>8}")
+        for name, path, load in runs:
+            seconds = median_seconds(load, args.repeat)
+            print(f"{name:<34} {len(rows):>7} {size_mb(path):>7.1f} {seconds:>8.3f}")
+
+        compact(str(parquet_dir))
+        for name, load in [
+            ("parquet, compacted", lambda: pq.read_table(parquet_dir)),
+            (
+                "parquet, compacted, no abstract",
+                lambda: pq.read_table(parquet_dir, columns=no_abstract),
+            ),
+        ]:
+            seconds = median_seconds(load, args.repeat)
+            print(f"{name:<34} {len(rows):>7} {size_mb(parquet_dir):>7.1f} {seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
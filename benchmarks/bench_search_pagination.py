@@ -0,0 +1,112 @@
+"""Search pages per second by SEARCH_PAGE_WINDOW against a local DOAJ stub.
+
+A threaded HTTP server replays synthetic DOAJ search pages (see
+``doaj_pages``) for one query, answering each after ``--latency`` seconds
+like a remote API would. The spider crawls all pages once per window size,
+with up to 8 concurrent requests to the stub (CONCURRENT_REQUESTS_PER_DOMAIN).
+
+    python -m benchmarks.bench_search_pagination [--pages 40] [--latency 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from scrapy.crawler import CrawlerProcess
+from twisted.internet import defer, reactor
+
+from benchmarks.doaj_pages import make_page
+from jurnal_scraping.spiders.doaj_kesehatan_id import DoajKesehatanIndonesiaSpider
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, pages: int, latency: float):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency = latency
+        self.total = pages * DoajKesehatanIndonesiaSpider.page_size
+        self._pages: dict[int, bytes] = {}
+
+    def page(self, number: int) -> bytes:
+        if number not in self._pages:
+            self._pages[number] = make_page(number, self.total)
+        return self._pages[number]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        page = int(parse_qs(urlsplit(self.path).query).get("page", ["1"])[0])
+        body = self.server.page(page)
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubSearchSpider(DoajKesehatanIndonesiaSpider):
+    name = "bench_search"
+    allowed_domains = None
+    keyword_queries = ("gizi",)
+    stub_url = ""
+
+    def _make_search_request(self, query, page, last_page=None):
+        request = super()._make_search_request(query, page, last_page)
+        return request.replace(url=f"{self.stub_url}/?{urlsplit(request.url).query}")
+
+    def _handle_record(self, record, seen_ids):
+        return ()  # only paging is measured
+
+
+SETTINGS = {
+    "CONCURRENT_REQUESTS": 16,
+    "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
+    "DOWNLOAD_DELAY": 0,
+    "HTTPPROXY_ENABLED": False,
+    "ROBOTSTXT_OBEY": False,
+    "TELNETCONSOLE_ENABLED": False,
+    "LANDING_RULES_ENABLED": False,
+    "LOG_LEVEL": "WARNING",
+}
+
+
+@defer.inlineCallbacks
+def main(process, server):
+    print(f"{'window':>6} {'pages':>6} {'seconds':>8} {'pages/s':>8}")
+    for window in (1, 2, 4, 8):
+        spidercls = type(
+            f"StubSearchSpider{window}",
+            (StubSearchSpider,),
+            {"custom_settings": {**StubSearchSpider.custom_settings, "SEARCH_PAGE_WINDOW": window}},
+        )
+        crawler = process.create_crawler(spidercls)
+        started = time.perf_counter()
+        yield process.crawl(crawler, stub_url=f"http://127.0.0.1:{server.server_address[1]}")
+        elapsed = time.perf_counter() - started
+        pages = crawler.stats.get_value("response_received_count", 0)
+        print(f"{window:>6} {pages:>6} {elapsed:>8.2f} {pages / elapsed:>8.1f}")
+    reactor.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    server = StubServer(args.pages, args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    process = CrawlerProcess(SETTINGS)
+    reactor.callWhenRunning(main, process, server)
+    process.start(stop_after_crawl=False)
@@ -0,0 +1,76 @@
+"""Synthetic DOAJ search pages shaped like recorded API responses.
+
+Shared by the search benchmarks. Records carry the fields the spider reads
+(bibjson title/abstract/author/journal/link) plus the bulk a real record
+has (identifiers, keywords, subjects), so page sizes are realistic (~2 KB
+per record).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+
+_WORDS = (
+    "pasien rumah sakit gizi balita puskesmas perawat obat terapi klinis "
+    "prevalensi risiko faktor analisis data sampel responden kuesioner "
+    "hubungan pengetahuan sikap ibu hamil anemia stunting diabetes hipertensi"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def make_record(n: int, rng: random.Random) -> dict:
+    journal = rng.randrange(300)
+    return {
+        "id": f"{n:032x}",
+        "last_updated": "2024-05-01T10:00:00Z",
+        "created_date": "2023-11-20T08:30:00Z",
+        "bibjson": {
+            "title": f"Hubungan {_text(rng, 8)} nomor {n}",
+            "abstract": _text(rng, 180),
+            "year": str(2015 + n % 10),
+            "author": [
+                {"name": f"Penulis {n}-{a}", "affiliation": f"Universitas {rng.randrange(80)}"}
+                for a in range(1 + n % 4)
+            ],
+            "journal": {
+                "title": f"Jurnal Kesehatan {journal}",
+                "country": "ID",
+                "language": ["ID", "EN"],
+                "issns": [f"{journal:04d}-{n % 9999:04d}"],
+                "publisher": f"Universitas {journal % 80}",
+            },
+            "identifier": [{"type": "doi", "id": f"10.12345/jk.v{n % 20}i{n % 4}.{n}"}],
+            "keywords": [_text(rng, 2) for _ in range(5)],
+            "subject": [{"scheme": "LCC", "term": "Medicine", "code": "R"}],
+            "link": [
+                {
+                    "type": "fulltext",
+                    "content_type": "PDF",
+                    "url": f"https://ojs{journal}.example.ac.id/index.php/jk/article/"
+                    f"download/{n}/{n + 7}.pdf",
+                }
+            ],
+        },
+    }
+
+
+def make_page(page: int, total: int, page_size: int = 100, seed: int = 1) -> bytes:
+    """One search page of ``total`` records, encoded like the DOAJ API."""
+    rng = random.Random(seed * 1_000_003 + page)
+    last_page = max(1, math.ceil(total / page_size))
+    first = (page - 1) * page_size
+    count = max(0, min(page_size, total - first)) if page <= last_page else 0
+    payload = {
+        "timestamp": "2024-05-01T10:00:00.000000Z",
+        "page": page,
+        "pageSize": page_size,
+        "query": "gizi",
+        "total": total,
+        "results": [make_record(first + i, rng) for i in range(count)],
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from jurnal_scraping import parquet_store
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self) -> str:
+        return "[options]"
+
+    def short_desc(self) -> str:
+        return "Merge the Parquet export's part files into one with large row groups"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument(
+            "--dir",
+            dest="directory",
+            help="dataset directory (default: PARQUET_OUTPUT_DIR setting)",
+        )
+        parser.add_argument(
+            "--row-group-rows",
+            dest="row_group_rows",
+            type=int,
+            help="rows per row group in the merged file (default: PARQUET_COMPACT_ROW_GROUP_ROWS)",
+        )
+
+    def run(self, args, opts):
+        settings = self.settings
+        directory = opts.directory or settings.get(
+            "PARQUET_OUTPUT_DIR", "jurnal_kesehatan_indonesia.parquet"
+        )
+        row_group_rows = opts.row_group_rows or settings.getint(
+            "PARQUET_COMPACT_ROW_GROUP_ROWS", 100_000
+        )
+        try:
+            parts, rows = parquet_store.compact(directory, row_group_rows=row_group_rows)
+        except ImportError as e:
+            raise UsageError(str(e), print_help=False)
+        if not parts:
+            print(f"Nothing to compact in {directory} ({rows} rows)")
+        else:
+            print(f"Merged {parts} part files ({rows} rows) in {directory}")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import csv
+import os
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from jurnal_scraping.pipelines import CsvAppendPipeline
+from jurnal_scraping.sqlite_store import ArticleStore
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self) -> str:
+        return "[options]"
+
+    def short_desc(self) -> str:
+        return "Export the SQLite article store as a CSV index"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--db", dest="db_path", help="SQLite file (default: SQLITE_PATH)")
+        parser.add_argument(
+            "-o", "--output", dest="csv_path", required=True, help="CSV file to write"
+        )
+
+    def run(self, args, opts):
+        db_path = opts.db_path or self.settings.get(
+            "SQLITE_PATH", "jurnal_kesehatan_indonesia.sqlite3"
+        )
+        if not os.path.exists(db_path):
+            raise UsageError(f"SQLite file not found: {db_path}", print_help=False)
+
+        fieldnames = CsvAppendPipeline.fieldnames
+        store = ArticleStore(db_path)
+        rows = 0
+        try:
+            with open(opts.csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                for row in store.iter_rows(fieldnames):
+                    writer.writerow(row)
+                    rows += 1
+        finally:
+            store.close()
+        print(f"Exported {rows} articles from {db_path} to {opts.csv_path}")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import csv
+import os
+from pathlib import Path
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from jurnal_scraping.sqlite_store import ArticleStore
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self) -> str:
+        return "[options]"
+
+    def short_desc(self) -> str:
+        return "Import the CSV index into the SQLite article store"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--csv", dest="csv_path", help="CSV to read (default: CSV_OUTPUT)")
+        parser.add_argument("--db", dest="db_path", help="SQLite file (default: SQLITE_PATH)")
+
+    def run(self, args, opts):
+        settings = self.settings
+        csv_path = opts.csv_path or settings.get("CSV_OUTPUT", "jurnal_kesehatan_indonesia.csv")
+        db_path = opts.db_path or settings.get("SQLITE_PATH", "jurnal_kesehatan_indonesia.sqlite3")
+        store_root = Path(settings.get("FILES_STORE") or "downloaded_pdfs")
+        batch_rows = max(1, settings.getint("SQLITE_BATCH_ROWS", 100))
+        if not os.path.exists(csv_path):
+            raise UsageError(f"CSV not found: {csv_path}", print_help=False)
+
+        store = ArticleStore(db_path)
+        rows = 0
+        inserted = 0
+        batch: list[dict[str, str]] = []
+        try:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f):
+                    pdf_local_path = (row.get("pdf_local_path") or "").strip()
+                    row["downloaded"] = (
+                        bool(pdf_local_path) and (store_root / pdf_local_path).is_file()
+                    )
+                    batch.append(row)
+                    rows += 1
+                    if len(batch) >= batch_rows:
+                        inserted += store.add_rows(batch)
+                        batch = []
+            inserted += store.add_rows(batch)
+        finally:
+            store.close()
+        print(f"Imported {inserted} new articles from {rows} CSV rows into {db_path}")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional, faster backend
+    orjson = None
+
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def loads(body: bytes) -> Any:
+    """Decode a whole JSON document, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def iter_members(
+    body: bytes, *, streaming: bool = False, array_key: str = "results"
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(key, value)`` for each top-level member of a JSON object.
+
+    Elements of ``array_key`` are yielded one by one as ``(array_key, element)``.
+    In streaming mode the body is walked member by member, so no dict tree
+    for the whole page is built and each element is handed out as soon as it
+    is decoded; otherwise the document is decoded at once (see ``loads``).
+    Malformed input raises ``ValueError``.
+    """
+    if not streaming:
+        payload = loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("top-level JSON value is not an object")
+        for key, value in payload.items():
+            if key == array_key and isinstance(value, list):
+                for element in value:
+                    yield key, element
+            else:
+                yield key, value
+        return
+
+    text = body.decode("utf-8")
+    idx = _skip_ws(text, 0)
+    idx = _expect(text, idx, "{")
+    idx = _skip_ws(text, idx)
+    if text.startswith("}", idx):
+        return
+
+    while True:
+        key, idx = _DECODER.raw_decode(text, idx)
+        if not isinstance(key, str):
+            raise ValueError(f"expected object key at offset {idx}")
+        idx = _expect(text, _skip_ws(text, idx), ":")
+        idx = _skip_ws(text, idx)
+
+        if key == array_key and text.startswith("[", idx):
+            idx = _skip_ws(text, idx + 1)
+            if text.startswith("]", idx):
+                idx += 1
+            else:
+                while True:
+                    element, idx = _DECODER.raw_decode(text, idx)
+                    yield key, element
+                    idx = _skip_ws(text, idx)
+                    if text.startswith("]", idx):
+                        idx += 1
+                        break
+                    idx = _skip_ws(text, _expect(text, idx, ","))
+        else:
+            value, idx = _DECODER.raw_decode(text, idx)
+            yield key, value
+
+        idx = _skip_ws(text, idx)
+        if text.startswith("}", idx):
+            return
+        idx = _skip_ws(text, _expect(text, idx, ","))
+
+
+def _skip_ws(text: str, idx: int) -> int:
+    return _WS.match(text, idx).end()
+
+
+def _expect(text: str, idx: int, char: str) -> int:
+    if not text.startswith(char, idx):
+        raise ValueError(f"expected {char!r} at offset {idx}")
+    return idx + 1
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+
+from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler, ScrapyAgent
+
+try:
+    from scrapy.core.downloader.handlers.http11 import _ResponseReader
+except ImportError:  # private; spooling is disabled without it
+    _ResponseReader = None
+
+logger = logging.getLogger(__name__)
+
+
+# Request meta key holding a dict with the spool ``path``. The dict is shared by
+# redirected/retried copies of the request, so the pipeline sees what the
+# handler filled in: ``size``, ``md5`` and ``sha256`` once the body is complete.
+SPOOL_META_KEY = "pdf_spool"
+
+# Request meta key holding a dict, also shared by retried copies, in which the
+# handler keeps ``cancel`` while the request is in flight: calling it aborts the
+# transfer (a CancelledError, which is not retried), e.g. from a timer.
+TRANSFER_META_KEY = "download_transfer"
+
+# Bytes of the body kept in memory and returned as ``response.body``.
+SPOOL_HEAD_BYTES = 1024
+
+_CONTENT_RANGE = re.compile(rb"bytes\s+(\d+)-\d+/(\d+|\*)")
+
+
+def resume_info_path(spool_path: str) -> str:
+    """Sidecar holding the validator a partial spool file can be resumed with."""
+    return spool_path + ".json"
+
+
+def content_range_start(headers) -> int | None:
+    """Start offset of a ``206`` response's ``Content-Range``, if present."""
+    match = _CONTENT_RANGE.match((headers.get(b"Content-Range") or b"").strip())
+    return int(match.group(1)) if match else None
+
+
+def _resume_validator(spool_path: str) -> tuple[int, str] | None:
+    """``(offset, If-Range validator)`` for a resumable partial file, else None."""
+    try:
+        offset = os.path.getsize(spool_path)
+        with open(resume_info_path(spool_path), "r", encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    etag = info.get("etag") or ""
+    # If-Range needs a strong validator; weak ETags cannot be used.
+    validator = etag if etag and not etag.startswith("W/") else info.get("last_modified")
+    if not offset or not validator:
+        return None
+    return offset, validator
+
+
+def _save_resume_info(spool_path: str, headers) -> None:
+    """Remember validators when the server can resume this body, else forget them."""
+    path = resume_info_path(spool_path)
+    etag = (headers.get(b"ETag") or b"").decode("latin-1")
+    last_modified = (headers.get(b"Last-Modified") or b"").decode("latin-1")
+    accepts_ranges = b"bytes" in (headers.get(b"Accept-Ranges") or b"").lower()
+    if not accepts_ranges or not (etag or last_modified):
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"etag": etag, "last_modified": last_modified}, f)
+
+
+class _SpoolBuffer:
+    """File-backed stand-in for the response reader's ``BytesIO`` body buffer.
+
+    Chunks go straight to disk while the MD5/SHA-256 digests are updated, so
+    only the first ``SPOOL_HEAD_BYTES`` stay in memory. ``getvalue`` (called
+    once the body is complete) closes the file and returns that head.
+
+    With ``offset`` > 0 (a ``206`` resuming a partial file) the chunks are
+    appended and the digests/head are first fed from the bytes already there.
+    """
+
+    def __init__(self, spool: dict, offset: int = 0):
+        self.spool = spool
+        for key in ("size", "md5", "sha256"):
+            spool.pop(key, None)
+        parent = os.path.dirname(spool["path"])
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._head = bytearray()
+        self._size = 0
+        self._md5 = hashlib.md5()
+        self._sha256 = hashlib.sha256()
+        if offset:
+            self._file = open(spool["path"], "r+b")
+            self._file.truncate(offset)
+            while chunk := self._file.read(1 << 20):
+                self._update(chunk)
+            self._file.seek(offset)
+        else:
+            self._file = open(spool["path"], "wb")
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._update(data)
+
+    def _update(self, data: bytes) -> None:
+        self._md5.update(data)
+        self._sha256.update(data)
+        self._size += len(data)
+        if len(self._head) < SPOOL_HEAD_BYTES:
+            self._head += data[: SPOOL_HEAD_BYTES - len(self._head)]
+
+    def truncate(self, size: int = 0) -> None:
+        # Called when the download exceeds DOWNLOAD_MAXSIZE.
+        self.close()
+        self._remove()
+
+    def getvalue(self) -> bytes:
+        self.close()
+        if not self._size:
+            # An empty body leaves nothing worth keeping or resuming.
+            self._remove()
+        self.spool.update(
+            size=self._size, md5=self._md5.hexdigest(), sha256=self._sha256.hexdigest()
+        )
+        return bytes(self._head)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def _remove(self) -> None:
+        for path in (self.spool["path"], resume_info_path(self.spool["path"])):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _can_spool() -> bool:
+    """Whether this Scrapy version has the private hooks ``_SpoolingAgent`` uses.
+
+    It overrides ``ScrapyAgent._cb_bodyready`` and swaps the response
+    reader's ``_bodybuf``, waiting on its ``_finished`` Deferred.
+    """
+    if _ResponseReader is None:
+        return False
+    reader_attrs = _ResponseReader.__init__.__code__.co_names
+    return (
+        callable(getattr(ScrapyAgent, "_cb_bodyready", None))
+        and callable(getattr(ScrapyAgent, "_headers_from_twisted_response", None))
+        and "_bodybuf" in reader_attrs
+        and "_finished" in reader_attrs
+    )
+
+
+class _SpoolingAgent(ScrapyAgent):
+    def _cb_bodyready(self, txresponse, request):
+        spool = request.meta.get(SPOOL_META_KEY)
+        # Redirect/error bodies stay in memory and leave a partial file alone.
+        if spool and spool.get("path") and txresponse.code in (200, 206):
+            headers = self._headers_from_twisted_response(txresponse)
+            offset = 0
+            if txresponse.code == 206:
+                offset = content_range_start(headers)
+                if offset is None or offset != spool.get("resume_from"):
+                    # Not the range we asked for; the pipeline rejects this body.
+                    spool["invalid"] = "range_mismatch"
+                    offset = 0
+            _save_resume_info(spool["path"], headers)
+            deliver_body = txresponse.deliverBody
+
+            def deliver_spooled(protocol):
+                if not hasattr(protocol, "_bodybuf") or not hasattr(protocol, "_finished"):
+                    # Unknown reader: keep the body in memory, as without spooling.
+                    deliver_body(protocol)
+                    return
+                buffer = _SpoolBuffer(spool, offset)
+                protocol._bodybuf = buffer
+                protocol._finished.addBoth(lambda result: (buffer.close(), result)[1])
+                deliver_body(protocol)
+
+            txresponse.deliverBody = deliver_spooled
+        return super()._cb_bodyready(txresponse, request)
+
+
+class SpoolingDownloadHandler(HTTP11DownloadHandler):
+    """HTTP(S) handler that can stream response bodies to a file.
+
+    Requests carrying ``meta["pdf_spool"] = {"path": ...}`` are written to that
+    path as they arrive instead of being buffered in memory; ``response.body``
+    then only holds the first bytes of the file. Other requests are handled
+    exactly like the default HTTP/1.1 handler.
+
+    Requests carrying ``meta["download_transfer"] = {}`` can be cut off from
+    outside while in flight (see ``TRANSFER_META_KEY``).
+
+    If an earlier attempt left a partial file and the server advertised
+    ``Accept-Ranges: bytes`` with an ETag/Last-Modified, the request asks for
+    the rest with ``Range`` + ``If-Range``; a changed file comes back as a
+    full ``200`` and replaces the partial one.
+
+    Spooling relies on private Scrapy internals; if they are missing, every
+    request is handled by the default handler (bodies stay in memory).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spooling = _can_spool()
+        if not self.spooling:
+            logger.warning(
+                "This Scrapy version lacks the hooks needed to stream bodies to disk; "
+                "PDF_STREAM_TO_DISK downloads are kept in memory instead"
+            )
+
+    def download_request(self, request, spider):
+        d = self._download_request(request, spider)
+        transfer = request.meta.get(TRANSFER_META_KEY)
+        if transfer is not None:
+            transfer["cancel"] = d.cancel
+            d.addBoth(lambda result: (transfer.pop("cancel", None), result)[1])
+        return d
+
+    def _download_request(self, request, spider):
+        spool = request.meta.get(SPOOL_META_KEY)
+        if not spool or not self.spooling:
+            return super().download_request(request, spider)
+        spool.pop("invalid", None)
+        resume = _resume_validator(spool["path"])
+        if resume is not None:
+            spool["resume_from"], validator = resume
+            request.headers[b"Range"] = f"bytes={spool['resume_from']}-"
+            request.headers[b"If-Range"] = validator
+        else:
+            spool.pop("resume_from", None)
+            request.headers.pop(b"Range", None)
+            request.headers.pop(b"If-Range", None)
+        agent = _SpoolingAgent(
+            contextFactory=self._contextFactory,
+            pool=self._pool,
+            maxsize=getattr(spider, "download_maxsize", self._default_maxsize),
+            warnsize=getattr(spider, "download_warnsize", self._default_warnsize),
+            fail_on_dataloss=self._fail_on_dataloss,
+            crawler=self._crawler,
+        )
+        return agent.download_request(request)
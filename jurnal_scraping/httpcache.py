@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import gzip
+import os
+import pickle
+from pathlib import Path
+from time import time
+
+from scrapy.extensions.httpcache import DummyPolicy
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.project import data_path
+from scrapy.utils.python import to_bytes
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:  # optional, gzip is used instead
+        zstd = None
+
+
+class DoajApiCachePolicy(DummyPolicy):
+    """Cache only successful responses of URLs under ``HTTPCACHE_URL_PREFIXES``.
+
+    Landing pages and PDFs are never cached, so the cache holds DOAJ search
+    pages only and large files cannot push them out.
+    """
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.url_prefixes = tuple(
+            settings.getlist("HTTPCACHE_URL_PREFIXES") or ["https://doaj.org/api/"]
+        )
+
+    def should_cache_request(self, request) -> bool:
+        return request.url.startswith(self.url_prefixes) and super().should_cache_request(
+            request
+        )
+
+    def should_cache_response(self, response, request) -> bool:
+        return response.status == 200 and super().should_cache_response(response, request)
+
+
+def _codec(name: str):
+    """``(file suffix, compress)`` for an ``HTTPCACHE_COMPRESSION`` value."""
+    name = (name or "").lower()
+    if name == "zstd" and zstd is not None:
+        return ".zst", zstd.compress
+    if name in ("zstd", "gzip"):
+        return ".gz", gzip.compress
+    return ".bin", bytes
+
+
+_SUFFIXES = (".zst", ".gz", ".bin")
+
+
+class CompressedCacheStorage:
+    """One compressed file per cached response, bounded in total size.
+
+    Entries live in ``<HTTPCACHE_DIR>/<spider>/<fp[:2]>/<fp><suffix>`` (``fp``
+    = request fingerprint, so each query+page is its own entry), compressed
+    with zstd when available, else gzip. Entries older than
+    ``HTTPCACHE_EXPIRATION_SECS`` (0 = never) are treated as missing; when
+    the directory grows past ``HTTPCACHE_MAX_BYTES`` the oldest entries are
+    removed until it is back under 90% of the limit.
+    """
+
+    def __init__(self, settings):
+        self.cachedir = data_path(settings["HTTPCACHE_DIR"])
+        self.expiration_secs = settings.getint("HTTPCACHE_EXPIRATION_SECS")
+        self.max_bytes = settings.getint("HTTPCACHE_MAX_BYTES", 0)
+        self.suffix, self._compress = _codec(
+            settings.get("HTTPCACHE_COMPRESSION", "zstd")
+        )
+        self.total_bytes = 0
+        self._root: Path | None = None
+        self._fingerprinter = None
+        self._stats = None
+
+    def open_spider(self, spider) -> None:
+        self._fingerprinter = spider.crawler.request_fingerprinter
+        self._stats = spider.crawler.stats
+        self._root = Path(self.cachedir, spider.name)
+        self.total_bytes = sum(size for _, size, _ in self._entries())
+
+    def close_spider(self, spider) -> None:
+        if self._stats is not None:
+            self._stats.set_value("jurnal/httpcache/bytes", self.total_bytes)
+
+    def retrieve_response(self, spider, request):
+        path = self._find(request)
+        if path is None:
+            return None
+        try:
+            if 0 < self.expiration_secs < time() - path.stat().st_mtime:
+                return None  # expired
+            data = pickle.loads(_decompressor(path.suffix)(path.read_bytes()))  # nosec
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+        headers = Headers(data["headers"])
+        url = data["response_url"]
+        body = data["body"]
+        respcls = responsetypes.from_args(headers=headers, url=url, body=body)
+        return respcls(url=url, headers=headers, status=data["status"], body=body)
+
+    def store_response(self, spider, request, response) -> None:
+        data = {
+            "url": request.url,
+            "method": request.method,
+            "status": response.status,
+            "response_url": response.url,
+            "headers": {k: v for k, v in response.headers.items()},
+            "body": to_bytes(response.body),
+            "timestamp": time(),
+        }
+        blob = self._compress(pickle.dumps(data, protocol=4))
+        path = self._path(request, self.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        old = self._find(request)
+        if old is not None:
+            self.total_bytes -= old.stat().st_size
+            if old != path:
+                old.unlink()
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+        self.total_bytes += len(blob)
+        if self.max_bytes and self.total_bytes > self.max_bytes:
+            self._evict(int(self.max_bytes * 0.9))
+
+    def _evict(self, target_bytes: int) -> None:
+        evicted = 0
+        for path, size, _ in sorted(self._entries(), key=lambda entry: entry[2]):
+            if self.total_bytes <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.total_bytes -= size
+            evicted += 1
+        if self._stats is not None:
+            self._stats.inc_value("jurnal/httpcache/evicted", evicted)
+
+    def _entries(self):
+        """``(path, size, mtime)`` of every entry under this spider's cache."""
+        if self._root is None or not self._root.is_dir():
+            return
+        for bucket in os.scandir(self._root):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(_SUFFIXES):
+                    st = entry.stat()
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def _path(self, request, suffix: str) -> Path:
+        key = self._fingerprinter.fingerprint(request).hex()
+        return self._root / key[:2] / f"{key}{suffix}"
+
+    def _find(self, request) -> Path | None:
+        # Entries written with another HTTPCACHE_COMPRESSION stay readable.
+        for suffix in (self.suffix, *_SUFFIXES):
+            path = self._path(request, suffix)
+            if path.exists():
+                return path
+        return None
+
+
+def _decompressor(suffix: str):
+    if suffix == ".zst":
+        if zstd is None:
+            raise ValueError("zstd cache entry but no zstd module")
+        return zstd.decompress
+    if suffix == ".gz":
+        return gzip.decompress
+    return bytes
@@ -2,6 +2,7 @@ import scrapy
 
 
 class JournalArticleItem(scrapy.Item):
+    doaj_id = scrapy.Field()
     journal_title = scrapy.Field()
     title = scrapy.Field()
     authors = scrapy.Field()  # comma-separated
@@ -10,9 +11,11 @@ class JournalArticleItem(scrapy.Item):
     pdf_url = scrapy.Field()
     pdf_local_path = scrapy.Field()  # where the downloaded PDF is stored
     landing_url = scrapy.Field()
+    pdf_resolver = scrapy.Field()  # resolver that derived pdf_url from landing_url
     file_urls = scrapy.Field()
     files = scrapy.Field()
     source_url = scrapy.Field()
+    health_keywords = scrapy.Field()  # keywords matched by the spider pre-filter
 
     # Used by Scrapy FilesPipeline
     file_urls = scrapy.Field()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterable
+
+
+class DigestSet:
+    """Exact set of 64-bit digests stored as a sorted ``array('Q')``.
+
+    Costs ~8 bytes per key instead of ~70 for a Python ``set`` of ints.
+    New keys go to a small unsorted tail set that is merged into the array
+    once it grows past a fraction of it, so lookups stay a binary search.
+    The merge works in place, so only the tail is ever held as Python ints.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._sorted = array("Q")
+        self._tail: set[int] = set()
+        self.update(values)
+
+    def __contains__(self, value: int) -> bool:
+        if value in self._tail:
+            return True
+        i = bisect_left(self._sorted, value)
+        return i < len(self._sorted) and self._sorted[i] == value
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._tail)
+
+    def add(self, value: int) -> None:
+        if value in self:
+            return
+        self._tail.add(value)
+        if len(self._tail) > max(4096, len(self._sorted) // 8):
+            self._merge()
+
+    def update(self, values: Iterable[int]) -> None:
+        # Bulk path: keys already in the array are dropped during the merge.
+        values = iter(values)
+        while True:
+            room = max(65536, len(self._sorted) // 8) - len(self._tail)
+            before = len(self._tail)
+            self._tail.update(islice(values, max(1, room)))
+            if len(self._tail) - before < room:
+                break  # input exhausted
+            self._merge()
+        self._merge()
+
+    def _merge(self) -> None:
+        """Merge the tail into the sorted array from the back, in place.
+
+        Old keys move in slices; each new key is placed after a binary
+        search that is first tried over the few keys just below the last
+        position, where it usually lands.
+        """
+        if not self._tail:
+            return
+        pending = sorted(self._tail)
+        self._tail = set()
+        keys = self._sorted
+        if not keys or keys[-1] < pending[0]:
+            keys.extend(pending)
+            return
+        hi = len(keys)  # keys[:hi] are the old keys not yet moved
+        keys.extend(pending)  # room for the new keys; overwritten below
+        end = len(keys)  # keys[end:] are final
+        for left, value in zip(range(len(pending), 0, -1), reversed(pending)):
+            guess = hi - 2 * (hi // left) - 1
+            if guess > 0 and keys[guess] < value:
+                lo = bisect_left(keys, value, guess, hi)
+            else:
+                lo = bisect_left(keys, value, 0, hi)
+            stored = lo < hi and keys[lo] == value
+            if lo < hi:
+                keys[end - (hi - lo) : end] = keys[lo:hi]
+                end -= hi - lo
+                hi = lo
+            if stored:
+                continue
+            end -= 1
+            keys[end] = value
+        if end > hi:
+            # Slots left over by keys that were already stored.
+            del keys[hi:end]
+
+
+class BloomFilter:
+    """Probabilistic set of 64-bit digests with a bounded false-positive rate.
+
+    Sized for ``capacity`` keys at ``fp_rate``; a false positive makes a new
+    article look like a duplicate, so keep the rate low. Bit positions come
+    from double hashing the two 32-bit halves of the digest.
+    """
+
+    def __init__(
+        self, capacity: int = 1_000_000, fp_rate: float = 0.001, values: Iterable[int] = ()
+    ):
+        capacity = max(1, int(capacity))
+        fp_rate = min(max(float(fp_rate), 1e-9), 0.5)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value: int) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def __len__(self) -> int:
+        # Number of keys added (not deduplicated).
+        return self._count
+
+    def add(self, value: int) -> None:
+        for pos in self._positions(value):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def update(self, values: Iterable[int]) -> None:
+        for value in values:
+            self.add(value)
+
+    def _positions(self, value: int):
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+
+def make_key_set(kind: str = "array", *, capacity: int = 1_000_000, fp_rate: float = 0.001):
+    """Build the dedup key store selected by ``DEDUP_KEY_STORE``."""
+    if (kind or "array").lower() == "bloom":
+        return BloomFilter(capacity=capacity, fp_rate=fp_rate)
+    return DigestSet()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing import Iterable
+
+
+DEFAULT_HEALTH_KEYWORDS: tuple[str, ...] = (
+    "kesehatan",
+    "medis",
+    "kedokteran",
+    "keperawatan",
+    "farmasi",
+    "kesehatan masyarakat",
+    "gizi",
+    "klinis",
+    "rumah sakit",
+)
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher over a fixed keyword list.
+
+    Each text is lowercased once and the keywords are looked up in it with
+    ``in``; for a short list that beats a compiled alternation regex (see
+    benchmarks/bench_keywords.py). Overlapping keywords all count:
+    "kesehatan masyarakat" in a text also reports "kesehatan".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        cleaned = (_normalize_keyword(k) for k in keywords or ())
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(k for k in cleaned if k))
+
+    def find(self, *texts: str) -> tuple[str, ...]:
+        """Return the keywords found in any of ``texts``, in list order."""
+        lowered = [text.lower() for text in texts if text]
+        return tuple(k for k in self.keywords if any(k in text for text in lowered))
+
+    def matches(self, *texts: str) -> bool:
+        for text in texts:
+            if text:
+                lowered = text.lower()
+                if any(k in lowered for k in self.keywords):
+                    return True
+        return False
+
+
+@functools.lru_cache(maxsize=8)
+def _get_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str] | None = None) -> KeywordMatcher:
+    """Shared matcher for ``keywords`` (default: the health keyword list)."""
+    return _get_matcher(tuple(keywords or DEFAULT_HEALTH_KEYWORDS))
+
+
+def _normalize_keyword(value: str) -> str:
+    return re.sub(r"\s+", " ", (value or "").strip()).lower()
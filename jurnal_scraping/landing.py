@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import html
+import json
+import os
+import re
+from typing import Any
+
+
+# Tags that can name the PDF of an article landing page (OJS and most other
+# platforms put them in <head>): <meta name="citation_pdf_url" content=...>
+# and <link rel="alternate" type="application/pdf" href=...>.
+_META_PDF_TAG = re.compile(rb"<meta\b[^>]*?citation_pdf_url[^>]*>", re.IGNORECASE)
+_LINK_PDF_TAG = re.compile(rb"<link\b[^>]*?application/pdf[^>]*>", re.IGNORECASE)
+_ATTR = re.compile(
+    rb"""([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))"""
+)
+
+
+def _attrs(tag: bytes) -> dict[bytes, bytes]:
+    attrs: dict[bytes, bytes] = {}
+    for match in _ATTR.finditer(tag):
+        name = match.group(1).lower()
+        if name not in attrs:
+            value = match.group(2)
+            if value is None:
+                value = match.group(3) if match.group(3) is not None else match.group(4)
+            attrs[name] = value
+    return attrs
+
+
+def _text(value: bytes, encoding: str) -> str:
+    return html.unescape(value.decode(encoding or "utf-8", errors="replace")).strip()
+
+
+def scan_pdf_url(body: bytes, limit: int, encoding: str = "utf-8") -> str:
+    """PDF URL (possibly relative) from the first ``limit`` bytes of a landing page.
+
+    Looks only at ``citation_pdf_url`` meta tags and ``<link rel="alternate"
+    type="application/pdf">``, without building a DOM. Returns "" when neither
+    is found, in which case the caller should fall back to full parsing.
+    """
+    head = body[:limit] if limit > 0 else body
+    for match in _META_PDF_TAG.finditer(head):
+        attrs = _attrs(match.group(0))
+        if attrs.get(b"name") == b"citation_pdf_url":
+            url = _text(attrs.get(b"content") or b"", encoding)
+            if url:
+                return url
+    for match in _LINK_PDF_TAG.finditer(head):
+        attrs = _attrs(match.group(0))
+        rels = (attrs.get(b"rel") or b"").lower().split()
+        if b"alternate" in rels and (attrs.get(b"type") or b"").lower() == b"application/pdf":
+            url = _text(attrs.get(b"href") or b"", encoding)
+            if url:
+                return url
+    return ""
+
+
+class LandingRuleCache:
+    """Per-host memory of which landing-page strategy found the PDF link.
+
+    A rule is ``{"strategy": ..., "selector": ..., "hits": n, "misses": m}``;
+    ``selector`` is a CSS selector for the winning ``<a>`` when the strategy
+    is an anchor one. A rule that misses ``max_misses`` pages in a row is
+    dropped so the host is learned again. Persisted as JSON between runs.
+    """
+
+    max_misses = 3
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.rules: dict[str, dict[str, Any]] = {}
+
+    def get(self, host: str) -> dict[str, Any] | None:
+        return self.rules.get(host)
+
+    def learn(self, host: str, strategy: str, selector: str = "") -> None:
+        rule = self.rules.get(host)
+        if rule and rule["strategy"] == strategy and rule.get("selector", "") == selector:
+            self.hit(host)
+            return
+        self.rules[host] = {"strategy": strategy, "selector": selector, "hits": 1, "misses": 0}
+
+    def hit(self, host: str) -> None:
+        rule = self.rules[host]
+        rule["hits"] += 1
+        rule["misses"] = 0
+
+    def miss(self, host: str) -> None:
+        rule = self.rules[host]
+        rule["misses"] = rule.get("misses", 0) + 1
+        if rule["misses"] >= self.max_misses:
+            del self.rules[host]
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for host, rule in data.items():
+            if isinstance(rule, dict) and rule.get("strategy"):
+                self.rules[host] = rule
+
+    def save(self) -> None:
+        if not self.path or not self.rules:
+            return
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.rules, f, ensure_ascii=False, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.path)
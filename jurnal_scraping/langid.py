@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from langdetect import DetectorFactory, LangDetectException, detect, detector_factory
+from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
+
+
+DetectorFactory.seed = 42
+
+
+# Frequent function words that are (nearly) exclusive to one language.
+_ID_STOPWORDS = frozenset(
+    """
+    yang dan di dengan untuk dari dalam pada ini itu adalah tidak atau juga akan
+    ke oleh sebagai dapat karena bahwa telah secara serta antara terhadap lebih
+    memiliki merupakan sebanyak sedangkan menggunakan penelitian hasil tersebut
+    """.split()
+)
+_EN_STOPWORDS = frozenset(
+    """
+    the and of to in is was were with for that this are by on as from an be at
+    which these their between using study results have has been or not it
+    """.split()
+)
+_WORD = re.compile(r"[a-z]+")
+
+
+class LanguageDetector:
+    """``langdetect`` wrapped with a content-hash LRU and a stop-word pre-check.
+
+    Texts are looked up by a 128-bit BLAKE2 digest first. On a miss, a cheap
+    count of Indonesian vs English stop words settles clear-cut texts; only
+    ambiguous ones (few stop words or a mixed ratio, e.g. bilingual abstracts)
+    go to ``langdetect``, whose answers are cached. ``detect`` returns ``""``
+    when ``langdetect`` cannot decide.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_size: int = 20000,
+        cache_path: str | None = None,
+        preclassify: bool = True,
+        min_stopwords: int = 8,
+        min_ratio: float = 0.9,
+        sample_chars: int = 2000,
+    ):
+        self.cache_size = max(0, int(cache_size))
+        self.cache_path = cache_path or None
+        self.preclassify = preclassify
+        self.min_stopwords = min_stopwords
+        self.min_ratio = min_ratio
+        self.sample_chars = sample_chars
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+
+        self.cache_hits = 0
+        self.preclassified = 0
+        self.langdetect_calls = 0
+        self.langdetect_seconds = 0.0
+
+    def detect(self, text: str) -> str:
+        key, lang = self.lookup(text)
+        if lang is None:
+            lang = self.detect_slow(key, text)
+        return lang
+
+    def lookup(self, text: str) -> tuple[bytes, str | None]:
+        """Answer from the cache or the stop-word pre-check if possible.
+
+        Returns the cache key and the language, or ``None`` as the language
+        when ``langdetect`` has to run (see ``detect_slow`` / ``DetectionPool``).
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return key, cached
+
+        if self.preclassify:
+            lang = self.preclassify_text(text)
+            if lang:
+                self.preclassified += 1
+                return key, lang
+
+        return key, None
+
+    def detect_slow(self, key: bytes, text: str) -> str:
+        lang, seconds = _detect_timed(text)
+        self.record_slow(key, lang, seconds)
+        return lang
+
+    def record_slow(self, key: bytes, lang: str, seconds: float) -> None:
+        self.langdetect_calls += 1
+        self.langdetect_seconds += seconds
+        self.remember(key, lang)
+
+    def preclassify_text(self, text: str) -> str:
+        """Return "id"/"en" when stop words make the language obvious, else ""."""
+        id_count = 0
+        en_count = 0
+        for word in _WORD.findall(text[: self.sample_chars].lower()):
+            if word in _ID_STOPWORDS:
+                id_count += 1
+            elif word in _EN_STOPWORDS:
+                en_count += 1
+
+        total = id_count + en_count
+        if total < self.min_stopwords:
+            return ""
+        if id_count / total >= self.min_ratio:
+            return "id"
+        if en_count / total >= self.min_ratio:
+            return "en"
+        return ""
+
+    def remember(self, key: bytes, lang: str) -> None:
+        if not self.cache_size:
+            return
+        self._cache[key] = lang
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def lookups(self) -> int:
+        return self.cache_hits + self.preclassified + self.langdetect_calls
+
+    def seconds_saved(self) -> float:
+        """Estimated langdetect time avoided by the cache and the pre-check."""
+        if not self.langdetect_calls:
+            return 0.0
+        per_call = self.langdetect_seconds / self.langdetect_calls
+        return per_call * (self.cache_hits + self.preclassified)
+
+    def load(self) -> None:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for hex_key, lang in data.items():
+            self.remember(bytes.fromhex(hex_key), lang)
+
+    def save(self) -> None:
+        if not self.cache_path or not self._cache:
+            return
+        parent = os.path.dirname(self.cache_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({k.hex(): v for k, v in self._cache.items()}, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+class DetectionPool:
+    """Run ``langdetect`` for a ``LanguageDetector`` in a worker pool.
+
+    Texts are collected into batches of ``batch_size`` (or whatever arrived
+    within ``batch_delay`` seconds) and detected in a thread pool, or a
+    process pool with ``use_processes=True``, so the reactor thread stays
+    free. ``detect`` returns a Deferred fired on the reactor thread; texts
+    already waiting for a result share it instead of being detected twice.
+
+    Worker processes are spawned, not forked: forking copies the running
+    reactor and its threads into every child. Worker threads share
+    langdetect's profiles, which are loaded here, before the pool starts:
+    threads that load them lazily race and can each build their own copy.
+    """
+
+    def __init__(
+        self,
+        detector: LanguageDetector,
+        *,
+        workers: int = 2,
+        batch_size: int = 16,
+        batch_delay: float = 0.05,
+        use_processes: bool = False,
+    ):
+        from twisted.internet import reactor
+
+        self.detector = detector
+        self.batch_size = max(1, int(batch_size))
+        self.batch_delay = max(0.0, float(batch_delay))
+        workers = max(1, int(workers))
+        if use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            detector_factory.init_factory()
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._reactor = reactor
+        self._batch: list[tuple[bytes, str]] = []
+        self._waiting: dict[bytes, list[Deferred]] = {}
+        self._flush_call = None
+
+    def detect(self, key: bytes, text: str) -> Deferred:
+        d: Deferred = Deferred()
+        waiting = self._waiting.get(key)
+        if waiting is not None:
+            waiting.append(d)
+            return d
+
+        self._waiting[key] = [d]
+        self._batch.append((key, text))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+        elif self._flush_call is None:
+            self._flush_call = self._reactor.callLater(self.batch_delay, self.flush)
+        return d
+
+    def flush(self) -> None:
+        if self._flush_call is not None and self._flush_call.active():
+            self._flush_call.cancel()
+        self._flush_call = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        keys = [key for key, _ in batch]
+        future = self._executor.submit(_detect_batch, [text for _, text in batch])
+        future.add_done_callback(
+            lambda f: self._reactor.callFromThread(self._resolve, keys, f)
+        )
+
+    def close(self) -> None:
+        """Stop the workers without blocking the reactor thread.
+
+        Called from close_spider, when no item is waiting for a result.
+        """
+        self.flush()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _resolve(self, keys: list[bytes], future: Future) -> None:
+        try:
+            results = future.result()
+        except Exception:
+            failure = Failure()
+            for key in keys:
+                for d in self._waiting.pop(key, []):
+                    d.errback(failure)
+            return
+
+        for key, (lang, seconds) in zip(keys, results):
+            self.detector.record_slow(key, lang, seconds)
+            for d in self._waiting.pop(key, []):
+                d.callback(lang)
+
+
+def _detect_timed(text: str) -> tuple[str, float]:
+    started = time.perf_counter()
+    try:
+        lang = detect(text)
+    except LangDetectException:
+        lang = ""
+    return lang, time.perf_counter() - started
+
+
+def _detect_batch(texts: list[str]) -> list[tuple[str, float]]:
+    # Runs inside pool workers; importing this module seeded DetectorFactory.
+    return [_detect_timed(text) for text in texts]
@@ -1,5 +1,8 @@
 import random
 
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.httpobj import urlparse_cached
+
 
 class RandomUserAgentMiddleware:
     """Assigns a random User-Agent per request.
@@ -22,3 +25,70 @@ class RandomUserAgentMiddleware:
             return None
         request.headers[b"User-Agent"] = random.choice(self.user_agents).encode("utf-8")
         return None
+
+
+def _body_size(response) -> int:
+    # Streamed PDFs only keep the head of the body in memory.
+    try:
+        return int(response.headers.get(b"Content-Length") or len(response.body))
+    except ValueError:
+        return len(response.body)
+
+
+class TrafficClassMiddleware:
+    """Gives DOAJ API, landing-page and PDF traffic their own download slots.
+
+    Each request is put in the slot ``<class>:<host>`` (``meta["traffic_class"]``
+    when set, else ``api`` for doaj.org/api and ``landing`` otherwise), and the
+    slot is created with that class's concurrency/delay from
+    ``TRAFFIC_CLASS_SLOTS`` (the downloader's defaults for keys a class
+    leaves out, e.g. CONCURRENT_REQUESTS_PER_DOMAIN). PDF bursts on one host then no longer hold the
+    slots that landing pages or API pagination need. Per-class request,
+    response, byte and latency counts go to ``jurnal/traffic/<class>/*``.
+    """
+
+    def __init__(self, class_slots, stats=None):
+        self.class_slots = {name: dict(conf or {}) for name, conf in (class_slots or {}).items()}
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("TRAFFIC_CLASSES_ENABLED", False):
+            raise NotConfigured
+        return cls(crawler.settings.getdict("TRAFFIC_CLASS_SLOTS"), crawler.stats)
+
+    @staticmethod
+    def traffic_class(request) -> str:
+        traffic_class = request.meta.get("traffic_class")
+        if traffic_class:
+            return traffic_class
+        parsed = urlparse_cached(request)
+        if parsed.hostname == "doaj.org" and parsed.path.startswith("/api/"):
+            return "api"
+        return "landing"
+
+    def process_request(self, request, spider):
+        traffic_class = self.traffic_class(request)
+        if "download_slot" not in request.meta:
+            host = urlparse_cached(request).hostname or ""
+            slot = f"{traffic_class}:{host}"
+            request.meta["download_slot"] = slot
+            conf = self.class_slots.get(traffic_class)
+            if conf:
+                # Read by the downloader when it creates the slot.
+                spider.crawler.engine.downloader.per_slot_settings.setdefault(slot, conf)
+        if self.stats is not None:
+            self.stats.inc_value(f"jurnal/traffic/{traffic_class}/requests")
+        return None
+
+    def process_response(self, request, response, spider):
+        if self.stats is not None:
+            traffic_class = self.traffic_class(request)
+            self.stats.inc_value(f"jurnal/traffic/{traffic_class}/responses")
+            self.stats.inc_value(f"jurnal/traffic/{traffic_class}/bytes", _body_size(response))
+            latency = request.meta.get("download_latency")
+            if latency is not None:
+                self.stats.inc_value(
+                    f"jurnal/traffic/{traffic_class}/latency_seconds", round(latency, 3)
+                )
+        return response
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only needed for the Parquet export
+    pa = None
+    pq = None
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet export requires pyarrow (python -m pip install pyarrow)")
+
+
+def schema_for(fieldnames: list[str]):
+    require_pyarrow()
+    return pa.schema([(name, pa.string()) for name in fieldnames])
+
+
+class ParquetPartWriter:
+    """Write ``part-*.parquet`` files of a dataset directory.
+
+    Rows are buffered and written as one row group per ``row_group_rows``
+    rows. Each part is written under a ``.tmp`` name and renamed once it
+    holds ``part_rows`` rows (and on ``close``), so readers of the directory
+    never see a half-written part and a crash loses at most the open one.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fieldnames: list[str],
+        *,
+        row_group_rows: int = 1000,
+        part_rows: int = 10_000,
+    ):
+        self.directory = Path(directory)
+        self.fieldnames = list(fieldnames)
+        self.row_group_rows = max(1, int(row_group_rows))
+        self.part_rows = max(1, int(part_rows))
+        self.schema = schema_for(self.fieldnames)
+        self.rows_written = 0
+        self.paths: list[Path] = []
+        self._pending: list[dict[str, str]] = []
+        self._writer = None
+        self._part_written = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._prefix = f"part-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.path: Path | None = None
+        self._tmp_path: Path | None = None
+
+    def write(self, row: dict[str, str]) -> None:
+        self._pending.append(row)
+        # Row groups never straddle two parts.
+        if len(self._pending) >= min(self.row_group_rows, self.part_rows - self._part_written):
+            self._write_row_group()
+            if self._part_written >= self.part_rows:
+                self._finish_part()
+
+    def close(self) -> None:
+        self._write_row_group()
+        self._finish_part()
+
+    def _finish_part(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        os.replace(self._tmp_path, self.path)
+        self.paths.append(self.path)
+        self._writer = None
+        self._part_written = 0
+
+    def _write_row_group(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        if self._writer is None:
+            self.path = self.directory / f"{self._prefix}-{len(self.paths):05d}.parquet"
+            self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+            self._writer = pq.ParquetWriter(str(self._tmp_path), self.schema, compression="zstd")
+        table = pa.Table.from_pylist(rows, schema=self.schema)
+        self._writer.write_table(table, row_group_size=len(rows))
+        self.rows_written += len(rows)
+        self._part_written += len(rows)
+
+
+def compact(directory: str, *, row_group_rows: int = 100_000) -> tuple[int, int]:
+    """Merge all parts in ``directory`` into one file with large row groups.
+
+    Returns ``(parts_merged, rows)``. The merged file is renamed into place
+    before the old parts are removed.
+    """
+    require_pyarrow()
+    root = Path(directory)
+    parts = sorted(root.glob("part-*.parquet"))
+    if len(parts) < 2:
+        return 0, sum(pq.ParquetFile(str(p)).metadata.num_rows for p in parts)
+
+    schema = pq.ParquetFile(str(parts[0])).schema_arrow
+    target = root / f"part-{time.strftime('%Y%m%dT%H%M%S')}-compacted.parquet"
+    tmp_target = target.with_name(target.name + ".tmp")
+
+    row_group_rows = max(1, int(row_group_rows))
+    rows = 0
+    pending: list = []
+    pending_rows = 0
+    with pq.ParquetWriter(str(tmp_target), schema, compression="zstd") as writer:
+        for part in parts:
+            table = pq.read_table(str(part), schema=schema)
+            pending.append(table)
+            pending_rows += table.num_rows
+            if pending_rows >= row_group_rows:
+                # Write whole row groups, carry the remainder to the next part.
+                merged = pa.concat_tables(pending)
+                full = merged.num_rows - merged.num_rows % row_group_rows
+                writer.write_table(merged.slice(0, full), row_group_size=row_group_rows)
+                rows += full
+                rest = merged.slice(full)
+                pending, pending_rows = [rest], rest.num_rows
+        if pending_rows:
+            merged = pa.concat_tables(pending)
+            writer.write_table(merged, row_group_size=row_group_rows)
+            rows += merged.num_rows
+
+    os.replace(tmp_target, target)
+    for part in parts:
+        if part != target:
+            part.unlink()
+    return len(parts), rows
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+
+class PdfUrlIndex:
+    """Per-URL facts about stored PDFs, kept as an append-only JSON-lines log.
+
+    Each line is ``{"url": ..., <field>: ...}``; later lines update earlier
+    ones for the same URL, so ``put`` is a single append and ``load`` replays
+    the log. Maps a PDF URL to the file it produced (path, checksum, size) and
+    the ETag/Last-Modified it was served with, for conditional re-fetches.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._file = None
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                url = entry.pop("url", None)
+                if url:
+                    self._entries.setdefault(url, {}).update(entry)
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        return self._entries.get(url)
+
+    def put(self, url: str, **fields: Any) -> None:
+        entry = self._entries.setdefault(url, {})
+        if all(entry.get(k) == v for k, v in fields.items()):
+            return
+        entry.update(fields)
+        if self._file is None:
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({"url": url, **fields}, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
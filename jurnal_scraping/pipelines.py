@@ -2,37 +2,111 @@ from __future__ import annotations
 
 import csv
 import hashlib
+import io
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from langdetect import DetectorFactory, LangDetectException, detect
 from scrapy.pipelines.files import FilesPipeline
 from scrapy.pipelines.files import FileException
-from scrapy import Request
-from scrapy.exceptions import DropItem
+from scrapy import Request, signals
+from scrapy.exceptions import DropItem, NotConfigured, StopDownload
+from scrapy.utils.conf import build_component_list
+from scrapy.utils.misc import load_object
+from twisted.internet import task
 
+from jurnal_scraping.downloadhandlers import (
+    SPOOL_META_KEY,
+    TRANSFER_META_KEY,
+    content_range_start,
+    resume_info_path,
+)
+from jurnal_scraping.keyset import make_key_set
+from jurnal_scraping.keywords import get_matcher
+from jurnal_scraping.langid import DetectionPool, LanguageDetector
+from jurnal_scraping.parquet_store import ParquetPartWriter, require_pyarrow
+from jurnal_scraping.pdf_index import PdfUrlIndex
+from jurnal_scraping.resume_index import (
+    ResumeIndex,
+    dedup_digest,
+    path_digest,
+    source_digest,
+)
+from jurnal_scraping.sqlite_store import ArticleStore
 
-DetectorFactory.seed = 42
 
+# A PDF has its "%PDF-" header within the first 1024 bytes.
+_PDF_MAGIC = b"%PDF-"
+_PDF_SNIFF_BYTES = 1024
 
-_HEALTH_KEYWORDS: tuple[str, ...] = (
-    "kesehatan",
-    "medis",
-    "kedokteran",
-    "keperawatan",
-    "farmasi",
-    "kesehatan masyarakat",
-    "gizi",
-    "klinis",
-    "rumah sakit",
-)
+# Content types that are never a PDF (error/login pages, API errors).
+_NON_PDF_CONTENT_TYPE = re.compile(r"html|json|xml|^text/", re.IGNORECASE)
+
+# Request meta key marking PDF downloads; holds per-download sniffing state.
+PDF_META_KEY = "jurnal_pdf"
+
+# Histogram buckets (upper bound, label) for jurnal/pdf/size_hist and duration_hist.
+_SIZE_BUCKETS = ((1 << 20, "lt_1mb"), (5 << 20, "lt_5mb"), (20 << 20, "lt_20mb"),
+                 (50 << 20, "lt_50mb"), (None, "ge_50mb"))
+_DURATION_BUCKETS = ((1, "lt_1s"), (5, "lt_5s"), (30, "lt_30s"), (120, "lt_120s"),
+                     (None, "ge_120s"))
 
 
 def _normalize_spaces(value: str) -> str:
     return re.sub(r"\s+", " ", (value or "").strip())
 
 
+def _list_store_files(store_root: Path, rel_paths: set[str]) -> set[str]:
+    """Return which of ``rel_paths`` exist, listing each directory once."""
+    by_dir: dict[str, set[str]] = {}
+    for rel_path in rel_paths:
+        parent, _, name = rel_path.rpartition("/")
+        by_dir.setdefault(parent, set()).add(name)
+
+    present: set[str] = set()
+    for parent, names in by_dir.items():
+        try:
+            with os.scandir(store_root / parent) as entries:
+                found = {e.name for e in entries if e.name in names and e.is_file()}
+        except OSError:
+            continue
+        present.update(f"{parent}/{name}" if parent else name for name in found)
+    return present
+
+
+def _present_path_digests(store_root: Path, folder: str = "pdfs") -> set[int]:
+    """``path_digest`` of every file in one FILES_STORE folder (one listing)."""
+    try:
+        with os.scandir(store_root / folder) as entries:
+            return {path_digest(f"{folder}/{e.name}") for e in entries if e.is_file()}
+    except OSError:
+        return set()
+
+
+def _verify_pdfs(store_root: Path, rel_paths: set[str], *, workers: int = 8) -> set[str]:
+    """Keep paths whose file is non-empty and starts like a PDF (in parallel)."""
+
+    def looks_ok(rel_path: str) -> bool:
+        try:
+            with open(store_root / rel_path, "rb") as f:
+                return _PDF_MAGIC in f.read(_PDF_SNIFF_BYTES)
+        except OSError:
+            return False
+
+    paths = sorted(rel_paths)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return {p for p, ok in zip(paths, executor.map(looks_ok, paths)) if ok}
+
+
+def _bucket(value: float, buckets) -> str:
+    for bound, label in buckets:
+        if bound is None or value < bound:
+            return label
+    return buckets[-1][1]
+
+
 def _slugify_filename(value: str, *, maxlen: int = 120) -> str:
     text = (value or "").strip().lower()
     # Keep ASCII letters/digits; replace anything else with hyphen.
@@ -45,11 +119,6 @@ def _slugify_filename(value: str, *, maxlen: int = 120) -> str:
     return text.strip(". ")
 
 
-def _looks_health_related(title: str, abstract: str) -> bool:
-    text = f"{title} {abstract}".lower()
-    return any(k in text for k in _HEALTH_KEYWORDS)
-
-
 class ValidateDedupLimitPipeline:
     """Validate required fields, filter health+Indonesian, deduplicate.
 
@@ -58,30 +127,137 @@ class ValidateDedupLimitPipeline:
     """
 
     def __init__(self):
-        self.seen: set[str] = set()
+        # Dedup key digests; shared with the spider as ``spider.jurnal_seen``.
+        self.seen = make_key_set()
         self.existing_ok = 0
         self._files_store: str | None = None
         self._csv_path: str | None = None
+        self.resume_verify_pdfs = False
+        self.resume_verify_workers = 8
+        self.resume_backend = "csv"
+        self.sqlite_path = "jurnal_kesehatan_indonesia.sqlite3"
+        self.sqlite_pipeline_enabled = False
+        self.health_matcher = get_matcher()
+        self.lang_detector = LanguageDetector()
+        self.lang_pool: DetectionPool | None = None
+        self.lang_workers = 1
+        self.lang_use_processes = False
+        self.lang_batch_size = 16
+        self.lang_batch_delay = 0.05
+        self._stats = None
 
     @classmethod
     def from_crawler(cls, crawler):
         pipeline = cls()
+        pipeline.health_matcher = get_matcher(crawler.settings.getlist("HEALTH_KEYWORDS"))
+        pipeline.lang_detector = LanguageDetector(
+            cache_size=crawler.settings.getint("LANGDETECT_CACHE_SIZE", 20000),
+            cache_path=crawler.settings.get("LANGDETECT_CACHE_PATH"),
+            preclassify=crawler.settings.getbool("LANGDETECT_PRECLASSIFY", True),
+        )
+        pipeline.lang_workers = crawler.settings.getint("LANGDETECT_WORKERS", 1)
+        pipeline.lang_use_processes = (
+            crawler.settings.get("LANGDETECT_EXECUTOR", "thread").lower() == "process"
+        )
+        pipeline.lang_batch_size = crawler.settings.getint("LANGDETECT_BATCH_SIZE", 16)
+        pipeline.lang_batch_delay = crawler.settings.getfloat("LANGDETECT_BATCH_DELAY", 0.05)
+        pipeline.seen = make_key_set(
+            crawler.settings.get("DEDUP_KEY_STORE", "array"),
+            capacity=crawler.settings.getint("DEDUP_BLOOM_CAPACITY", 1_000_000),
+            fp_rate=crawler.settings.getfloat("DEDUP_BLOOM_FP_RATE", 0.001),
+        )
+        pipeline._stats = crawler.stats
         pipeline._files_store = crawler.settings.get("FILES_STORE")
         pipeline._csv_path = crawler.settings.get("CSV_OUTPUT", "jurnal_kesehatan_indonesia.csv")
+        pipeline.resume_verify_pdfs = crawler.settings.getbool("RESUME_VERIFY_PDFS", False)
+        pipeline.resume_verify_workers = crawler.settings.getint("RESUME_VERIFY_WORKERS", 8)
+        pipeline.resume_backend = crawler.settings.get("RESUME_BACKEND", "csv").lower()
+        pipeline.sqlite_path = crawler.settings.get("SQLITE_PATH", pipeline.sqlite_path)
+        pipeline.sqlite_pipeline_enabled = SqliteAppendPipeline in {
+            load_object(path)
+            for path in build_component_list(crawler.settings.getwithbase("ITEM_PIPELINES"))
+        }
         return pipeline
 
     def open_spider(self, spider):
+        try:
+            self.lang_detector.load()
+        except (OSError, ValueError) as e:
+            spider.logger.warning(
+                "Failed loading language cache (%s): %s", self.lang_detector.cache_path, e
+            )
+
+        if self.lang_workers > 0:
+            self.lang_pool = DetectionPool(
+                self.lang_detector,
+                workers=self.lang_workers,
+                batch_size=self.lang_batch_size,
+                batch_delay=self.lang_batch_delay,
+                use_processes=self.lang_use_processes,
+            )
+
+        if self.resume_backend == "sqlite":
+            if not self.sqlite_pipeline_enabled:
+                spider.logger.warning(
+                    "RESUME_BACKEND is 'sqlite' but SqliteAppendPipeline is not in "
+                    "ITEM_PIPELINES: articles of this run are not stored in %s and will be "
+                    "downloaded again next run",
+                    self.sqlite_path,
+                )
+            # One query at startup; lookups during the crawl stay in memory.
+            # As with the CSV index, only rows whose PDF is still on disk count.
+            store_root = Path(self._files_store or "downloaded_pdfs")
+            store = ArticleStore(self.sqlite_path)
+            try:
+                seen, self.existing_ok = store.load(_present_path_digests(store_root))
+            finally:
+                store.close()
+            self.seen.update(seen)
+            spider.jurnal_existing_ok = self.existing_ok
+            spider.jurnal_seen = self.seen
+            spider.logger.info(
+                "Resume state from %s: %d PDFs already on disk", self.sqlite_path, self.existing_ok
+            )
+            return
+
         csv_path = self._csv_path or "jurnal_kesehatan_indonesia.csv"
         if not os.path.exists(csv_path):
             spider.jurnal_existing_ok = 0
-            spider.jurnal_seen = set()
+            spider.jurnal_seen = self.seen
             return
 
+        started = time.perf_counter()
+        index = ResumeIndex(csv_path)
+        # Verification needs each row's PDF path, which only the CSV has.
+        loaded = None
+        if not self.resume_verify_pdfs:
+            # All PDFs live in <FILES_STORE>/pdfs/ (see PdfDownloadPipeline.file_path).
+            store_root = Path(self._files_store or "downloaded_pdfs")
+            loaded = index.load(_present_path_digests(store_root))
+        if loaded is not None:
+            seen, existing_ok = loaded
+            source = "index"
+        else:
+            spider.logger.info("Rebuilding resume index from %s", csv_path)
+            seen, existing_ok = self._scan_csv(csv_path, index, spider)
+            source = "csv"
+        spider.logger.info(
+            "Resume scan (%s): %d PDFs already on disk, took %.2fs",
+            source,
+            existing_ok,
+            time.perf_counter() - started,
+        )
+
+        self.seen.update(seen)
+        self.existing_ok = existing_ok
+        spider.jurnal_existing_ok = existing_ok
+        spider.jurnal_seen = self.seen
+
+    def _scan_csv(self, csv_path: str, index: ResumeIndex, spider) -> tuple[set[int], int]:
         files_store = self._files_store or "downloaded_pdfs"
         store_root = Path(files_store)
 
-        seen: set[str] = set()
-        existing_ok = 0
+        rows: list[tuple[int, int, str]] = []
         try:
             with open(csv_path, "r", encoding="utf-8", newline="") as f:
                 reader = csv.DictReader(f)
@@ -92,20 +268,64 @@ class ValidateDedupLimitPipeline:
                     pdf_local_path = _normalize_spaces(row.get("pdf_local_path", ""))
 
                     if pdf_url or source_url or title:
-                        dedup_key = (pdf_url or source_url or "") + "|" + (title.lower() if title else "")
-                        seen.add(dedup_key)
-
-                    if pdf_local_path:
-                        candidate = store_root / pdf_local_path
-                        if candidate.exists():
-                            existing_ok += 1
+                        digest = dedup_digest(pdf_url, source_url, title)
+                        source = source_digest(source_url, title)
+                        rows.append((digest, source, pdf_local_path.replace("\\", "/")))
         except Exception as e:
             spider.logger.warning("Failed loading existing CSV state (%s): %s", csv_path, e)
+            return set(), 0
 
-        self.seen |= seen
-        self.existing_ok = existing_ok
-        spider.jurnal_existing_ok = existing_ok
-        spider.jurnal_seen = set(self.seen)
+        # One directory listing per PDF folder instead of a stat per row,
+        # which is what makes resume slow on network filesystems.
+        present = _list_store_files(store_root, {path for _, _, path in rows if path})
+        if self.resume_verify_pdfs:
+            present = _verify_pdfs(store_root, present, workers=self.resume_verify_workers)
+
+        records = [(digest, source, path_digest(path)) for digest, source, path in rows]
+        try:
+            index.rebuild(records)
+        except OSError as e:
+            spider.logger.warning("Failed writing resume index (%s): %s", index.path, e)
+        # Only articles whose PDF is still on disk count as harvested; the
+        # others are downloaded again. Several rows can point at one file
+        # (re-downloads, content-addressed store).
+        seen: set[int] = set()
+        for digest, source, path in rows:
+            if path in present:
+                seen.add(digest)
+                if source:
+                    seen.add(source)
+        existing_ok = len({path for _, _, path in rows if path in present})
+        return seen, existing_ok
+
+    def close_spider(self, spider):
+        if self.lang_pool is not None:
+            self.lang_pool.close()
+            self.lang_pool = None
+
+        try:
+            self.lang_detector.save()
+        except OSError as e:
+            spider.logger.warning(
+                "Failed saving language cache (%s): %s", self.lang_detector.cache_path, e
+            )
+
+        if self._stats is not None:
+            detector = self.lang_detector
+            lookups = detector.lookups
+            self._stats.set_value("jurnal/langdetect/cache_hits", detector.cache_hits)
+            self._stats.set_value("jurnal/langdetect/preclassified", detector.preclassified)
+            self._stats.set_value("jurnal/langdetect/langdetect_calls", detector.langdetect_calls)
+            self._stats.set_value(
+                "jurnal/langdetect/cache_hit_rate",
+                round(detector.cache_hits / lookups, 4) if lookups else 0.0,
+            )
+            self._stats.set_value(
+                "jurnal/langdetect/langdetect_seconds", round(detector.langdetect_seconds, 3)
+            )
+            self._stats.set_value(
+                "jurnal/langdetect/seconds_saved_estimate", round(detector.seconds_saved(), 3)
+            )
 
     def process_item(self, item, spider):
         title = _normalize_spaces(item.get("title", ""))
@@ -120,22 +340,39 @@ class ValidateDedupLimitPipeline:
         if not pdf_url:
             raise DropItem("missing_pdf_url")
 
-        if not _looks_health_related(title, abstract):
+        # Reuse the spider's keyword scan when it already ran on this text.
+        health_hits = item.get("health_keywords")
+        if health_hits is None:
+            health_hits = self.health_matcher.find(title, abstract)
+        if not health_hits:
             raise DropItem("non_health_article")
 
-        try:
-            lang = detect(abstract)
-        except LangDetectException:
+        key, lang = self.lang_detector.lookup(abstract)
+        if lang is None:
+            if self.lang_pool is not None:
+                # Detect off the reactor thread; Scrapy waits on the Deferred.
+                d = self.lang_pool.detect(key, abstract)
+                d.addCallback(self._accept_language, item, title, abstract, source_url, pdf_url)
+                return d
+            lang = self.lang_detector.detect_slow(key, abstract)
+
+        return self._accept_language(lang, item, title, abstract, source_url, pdf_url)
+
+    def _accept_language(self, lang, item, title, abstract, source_url, pdf_url):
+        if not lang:
             raise DropItem("langdetect_failed")
 
         if lang != "id":
             raise DropItem(f"non_indonesian_lang:{lang}")
 
-        # Prefer PDF URL for deduplication when available.
-        dedup_key = (pdf_url or source_url or "") + "|" + title.lower()
+        dedup_key = dedup_digest(pdf_url, source_url, title)
         if dedup_key in self.seen:
             raise DropItem("duplicate")
         self.seen.add(dedup_key)
+        # Also lets the spider skip landing fetches for this article.
+        source_key = source_digest(source_url, title)
+        if source_key:
+            self.seen.add(source_key)
 
         item["title"] = title
         item["abstract"] = abstract
@@ -157,6 +394,16 @@ class PdfDownloadPipeline(FilesPipeline):
         self.pdf_filename_by_title = False
         self.pdf_filename_hash_len = 10
         self.pdf_filename_slug_maxlen = 120
+        self.pdf_store_by_content = False
+        self.pdf_stream_to_disk = False
+        self.pdf_max_bytes = 0
+        self.pdf_max_seconds = 0.0
+        self.pdf_conditional_refetch = False
+        self.skipped: dict[str, str] = {}
+        # pdf_urls whose download turned out not to be a PDF.
+        self.not_pdf: set[str] = set()
+        self.url_index: PdfUrlIndex | None = None
+        self._stats = None
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -173,6 +420,21 @@ class PdfDownloadPipeline(FilesPipeline):
         pipeline.pdf_filename_slug_maxlen = crawler.settings.getint(
             "PDF_FILENAME_SLUG_MAXLEN", 120
         )
+        pipeline.pdf_store_by_content = crawler.settings.getbool("PDF_STORE_BY_CONTENT", False)
+        # Streaming needs a local store to move the finished file into.
+        pipeline.pdf_stream_to_disk = crawler.settings.getbool(
+            "PDF_STREAM_TO_DISK", True
+        ) and hasattr(pipeline.store, "basedir")
+        pipeline.pdf_max_bytes = crawler.settings.getint("PDF_MAX_BYTES", 0)
+        pipeline.pdf_max_seconds = crawler.settings.getfloat("PDF_MAX_SECONDS", 0.0)
+        pipeline.pdf_conditional_refetch = crawler.settings.getbool(
+            "PDF_CONDITIONAL_REFETCH", False
+        )
+        files_store = crawler.settings.get("FILES_STORE") or "downloaded_pdfs"
+        pipeline.url_index = PdfUrlIndex(os.path.join(files_store, "pdfs", "url_index.jsonl"))
+        pipeline._stats = crawler.stats
+        crawler.signals.connect(pipeline._on_headers_received, signal=signals.headers_received)
+        crawler.signals.connect(pipeline._on_bytes_received, signal=signals.bytes_received)
         pipeline.downloaded_ok = 0
         pipeline.in_progress = set()
         return pipeline
@@ -180,6 +442,8 @@ class PdfDownloadPipeline(FilesPipeline):
     def open_spider(self, spider):
         super().open_spider(spider)
         self._spider = spider
+        if self.url_index is not None:
+            self.url_index.load()
 
         # Resume support: count PDFs already present from existing CSV rows.
         existing_ok = int(getattr(spider, "jurnal_existing_ok", 0) or 0)
@@ -190,7 +454,8 @@ class PdfDownloadPipeline(FilesPipeline):
             )
 
     def close_spider(self, spider):
-        super().close_spider(spider)
+        if self.url_index is not None:
+            self.url_index.close()
 
     def get_media_requests(self, item, info):
         pdf_url = (item.get("pdf_url") or "").strip()
@@ -201,15 +466,59 @@ class PdfDownloadPipeline(FilesPipeline):
             raise DropItem("pdf_limit_reached")
 
         self.in_progress.add(pdf_url)
+        headers = {"Accept": "application/pdf,*/*;q=0.9"}
+        sniff = {"pdf_url": pdf_url}
+        meta = {
+            PDF_META_KEY: sniff,
+            "traffic_class": "pdf",
+            # Fail (and retry/resume) cut-off bodies instead of accepting them.
+            "download_fail_on_dataloss": True,
+        }
+        if self.pdf_max_seconds:
+            # The budget timer cancels the transfer through the handler, also
+            # while it stalls between bytes (see _start_budget).
+            meta[TRANSFER_META_KEY] = sniff
+        if self.pdf_stream_to_disk:
+            # SpoolingDownloadHandler writes the body to this file as it arrives.
+            # Ask for an unencoded body: the spool is moved into place as-is.
+            meta[SPOOL_META_KEY] = {"path": self._spool_path(pdf_url)}
+            headers["Accept-Encoding"] = "identity"
         # Use GET (not HEAD) because we want the file.
-        yield Request(
-            pdf_url,
-            dont_filter=True,
-            headers={"Accept": "application/pdf,*/*;q=0.9"},
-        )
+        request = Request(pdf_url, dont_filter=True, headers=headers, meta=meta)
+        if self.pdf_conditional_refetch:
+            self._add_validators(request)
+        yield request
+
+    def _add_validators(self, request) -> None:
+        """Make the GET conditional when this URL's stored file is still on disk.
+
+        This runs for every PDF request, before FilesPipeline checks the
+        stored file's age: a file newer than FILES_EXPIRES is not fetched at
+        all, so the validators are only sent for expired files.
+        """
+        known = self.url_index.get(request.url) if self.url_index is not None else None
+        if not known or not known.get("path"):
+            return
+        basedir = getattr(self.store, "basedir", None)
+        if basedir is None or not (Path(basedir) / known["path"]).exists():
+            return
+        if known.get("etag"):
+            request.headers[b"If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            request.headers[b"If-Modified-Since"] = known["last_modified"]
 
     def file_path(self, request, response=None, info=None, *, item=None):
         url = request.url
+
+        if self.pdf_store_by_content:
+            # Before the download, point at the file this URL produced last
+            # time (if any) so an up-to-date copy is not fetched again.
+            if response is not None:
+                return f"pdfs/{self._content_digest(request, response)}.pdf"
+            known = self.url_index.get(url) if self.url_index is not None else None
+            if known and known.get("sha256"):
+                return f"pdfs/{known['sha256']}.pdf"
+
         digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
 
         if self.pdf_filename_by_title and item is not None:
@@ -221,20 +530,292 @@ class PdfDownloadPipeline(FilesPipeline):
 
         return f"pdfs/{digest}.pdf"
 
+    def _on_headers_received(self, headers, body_length, request, spider):
+        sniff = request.meta.get(PDF_META_KEY)
+        if sniff is None or b"Location" in headers or body_length == 0:
+            return  # not a PDF download, a redirect hop or a bodiless 304
+        sniff.update(head=b"", received=0, sniffed=False, headers_at=time.monotonic())
+        if self.pdf_max_seconds:
+            if sniff.get("over_budget"):
+                # The budget ran out between two attempts.
+                self._abort_download(request, sniff, "too_slow", skip=True)
+            self._start_budget(request, sniff)
+        resumed_from = content_range_start(headers)
+        if resumed_from:
+            # Rest of a partial file: its start was sniffed on the first attempt.
+            sniff.update(received=resumed_from, sniffed=True)
+            self._inc_stat("jurnal/pdf/resumed")
+            self._inc_stat("jurnal/pdf/resumed_bytes", resumed_from)
+            if isinstance(body_length, int):
+                body_length += resumed_from
+        ctype = (headers.get(b"Content-Type") or b"").decode("latin-1")
+        if _NON_PDF_CONTENT_TYPE.search(ctype):
+            self._abort_download(request, sniff, f"not_a_pdf_content_type:{ctype}")
+        # Content-Length first: refuse before any of the body is transferred.
+        if (
+            self.pdf_max_bytes
+            and isinstance(body_length, int)
+            and body_length > self.pdf_max_bytes
+        ):
+            self._abort_download(request, sniff, "too_large", skip=True)
+
+    def _on_bytes_received(self, data, request, spider):
+        sniff = request.meta.get(PDF_META_KEY)
+        if not sniff or "headers_at" not in sniff or sniff.get("aborted"):
+            return
+        sniff["received"] += len(data)
+        if self.pdf_max_bytes and sniff["received"] > self.pdf_max_bytes:
+            self._abort_download(request, sniff, "too_large", skip=True)
+        if sniff.get("over_budget"):
+            # Without SpoolingDownloadHandler the timer cannot cancel the transfer.
+            self._abort_download(request, sniff, "too_slow", skip=True)
+        if sniff["sniffed"]:
+            return
+        head = sniff["head"] = sniff["head"] + data[:_PDF_SNIFF_BYTES]
+        if _PDF_MAGIC in head[:_PDF_SNIFF_BYTES]:
+            sniff["sniffed"] = True
+            sniff["head"] = b""
+        elif len(head) >= _PDF_SNIFF_BYTES:
+            self._abort_download(request, sniff, "not_a_pdf_magic")
+
+    def _abort_download(self, request, sniff, reason: str, *, skip: bool = False):
+        """Cancel a download before the rest of it arrives.
+
+        Non-PDFs count as failed downloads; ``skip`` ones (over the size/time
+        budget) are dropped as skipped so they are not reported as errors.
+        """
+        self._record_abort(sniff, reason, skip, self._elapsed(request, sniff))
+        raise StopDownload(fail=True)
+
+    def _record_abort(self, sniff, reason: str, skip: bool, seconds: float) -> None:
+        if self._spider is not None:
+            self._spider.logger.debug("Aborting %s: %s", sniff["pdf_url"], reason)
+        sniff["aborted"] = True
+        if skip:
+            sniff["skip_reason"] = reason
+            self._inc_stat(f"jurnal/pdf/skipped_{reason}")
+        else:
+            self.not_pdf.add(sniff["pdf_url"])
+            self._inc_stat("jurnal/pdf/aborted_non_pdf")
+        self._inc_stat("jurnal/pdf/aborted_bytes", sniff.get("received", 0))
+        self._inc_stat("jurnal/pdf/aborted_seconds", round(seconds, 3))
+
+    def _start_budget(self, request, sniff) -> None:
+        """Start the PDF_MAX_SECONDS timer on the first response of a download.
+
+        Retries share the timer, so the budget covers every attempt; each
+        attempt still has DOWNLOAD_TIMEOUT for stalls. The first attempt's
+        latency counts against the budget.
+        """
+        if "budget_call" in sniff:
+            return
+        from twisted.internet import reactor
+
+        latency = float(request.meta.get("download_latency") or 0.0)
+        delay = max(0.0, self.pdf_max_seconds - latency)
+        sniff["budget_call"] = reactor.callLater(delay, self._over_budget, sniff)
+
+    def _stop_budget(self, sniff) -> None:
+        call = sniff.get("budget_call")
+        if call is not None and call.active():
+            call.cancel()
+
+    def _over_budget(self, sniff) -> None:
+        sniff["over_budget"] = True
+        cancel = sniff.get("cancel")
+        if cancel is not None and not sniff.get("aborted"):
+            self._record_abort(sniff, "too_slow", True, self.pdf_max_seconds)
+            cancel()
+
+    def _inc_stat(self, key: str, count=1) -> None:
+        if self._stats is not None:
+            self._stats.inc_value(key, count)
+
+    @staticmethod
+    def _elapsed(request, sniff) -> float:
+        """Seconds since the request was sent (latency + time since headers)."""
+        latency = float(request.meta.get("download_latency") or 0.0)
+        return latency + time.monotonic() - sniff.get("headers_at", time.monotonic())
+
+    def _record_download(self, request, size: int) -> None:
+        self._inc_stat(f"jurnal/pdf/size_hist/{_bucket(size, _SIZE_BUCKETS)}")
+        sniff = request.meta.get(PDF_META_KEY) or {}
+        if "headers_at" in sniff:
+            seconds = self._elapsed(request, sniff)
+            self._inc_stat(f"jurnal/pdf/duration_hist/{_bucket(seconds, _DURATION_BUCKETS)}")
+
     def media_downloaded(self, response, request, info, *, item=None):
+        sniff = request.meta.get(PDF_META_KEY) or {}
+        self._stop_budget(sniff)
+        spool = request.meta.get(SPOOL_META_KEY) or {}
+        if spool.get("invalid"):
+            self._discard_spool(request)
+            raise FileException(spool["invalid"])
+        if response.status == 304:
+            return self._not_modified(request)
+        if response.status == 206 and self._spooled(request) is not None:
+            # Resumed download: the spool file now holds the whole body.
+            response = response.replace(status=200)
         ctype = (response.headers.get(b"Content-Type") or b"").decode(
             "utf-8", errors="ignore"
         )
         if "pdf" not in ctype.lower() and not request.url.lower().endswith(".pdf"):
+            self._discard_spool(request)
+            self.not_pdf.add(sniff.get("pdf_url", request.url))
             raise FileException(f"not_a_pdf_content_type:{ctype}")
+        if response.status == 200 and _PDF_MAGIC not in response.body[:_PDF_SNIFF_BYTES]:
+            # Short bodies end before the streaming sniff reaches its limit.
+            self._discard_spool(request)
+            self.not_pdf.add(sniff.get("pdf_url", request.url))
+            raise FileException("not_a_pdf_magic")
+        if "dataloss" in response.flags:
+            self._discard_spool(request, keep_resumable=True)
+            raise FileException("incomplete_download")
+        if response.status != 200:
+            self._discard_spool(request, keep_resumable=True)
         return super().media_downloaded(response, request, info, item=item)
 
+    def _not_modified(self, request):
+        """304 to a conditional GET: the stored file is current, nothing was sent."""
+        known = (self.url_index.get(request.url) if self.url_index is not None else None) or {}
+        path = known.get("path")
+        target = Path(getattr(self.store, "basedir", "")) / path if path else None
+        if target is None or not target.exists():
+            raise FileException("not_modified_but_missing")
+        try:
+            # Restart the FILES_EXPIRES clock (the store's age is the mtime),
+            # or every later run would revalidate it again.
+            os.utime(target)
+        except OSError:
+            pass
+        self._inc_stat("jurnal/pdf/not_modified")
+        self._inc_stat("jurnal/pdf/not_modified_bytes_saved", int(known.get("size") or 0))
+        return {
+            "url": request.url,
+            "path": path,
+            "checksum": known.get("checksum"),
+            "status": "uptodate",
+        }
+
+    def media_failed(self, failure, request, info):
+        sniff = request.meta.get(PDF_META_KEY) or {}
+        self._stop_budget(sniff)
+        # Keep what a timed-out/dropped download got so the next run resumes it.
+        self._discard_spool(request, keep_resumable=not sniff.get("aborted"))
+        if sniff.get("skip_reason"):
+            self.skipped[sniff["pdf_url"]] = sniff["skip_reason"]
+        return super().media_failed(failure, request, info)
+
+    def file_downloaded(self, response, request, info, *, item=None):
+        spool = self._spooled(request)
+        if spool is not None:
+            self._inc_stat("jurnal/pdf/streamed_bytes", spool["size"])
+        self._record_download(request, spool["size"] if spool else len(response.body))
+
+        if self.pdf_store_by_content:
+            sha256 = self._content_digest(request, response)
+            path = f"pdfs/{sha256}.pdf"
+            target = Path(getattr(self.store, "basedir", "")) / path
+            if target.exists():
+                # Same bytes already stored (e.g. OJS /view/ vs /download/ URL).
+                self._inc_stat("jurnal/pdf/content_duplicate")
+                self._discard_spool(request)
+            else:
+                self._inc_stat("jurnal/pdf/content_unique")
+                self._store_file(path, response, request, info)
+            self._remember(request, response, path, sha256, sha256=sha256)
+            return sha256
+
+        path = self.file_path(request, response=response, info=info, item=item)
+        if spool is None:
+            checksum = super().file_downloaded(response, request, info, item=item)
+        else:
+            self._store_file(path, response, request, info)
+            checksum = spool["md5"]
+        self._remember(request, response, path, checksum)
+        return checksum
+
+    def _remember(self, request, response, path: str, checksum: str, **fields) -> None:
+        """Record where this URL is stored and its validators for re-fetching."""
+        if self.url_index is None:
+            return
+        spool = self._spooled(request)
+        self.url_index.put(
+            request.url,
+            path=path,
+            checksum=checksum,
+            size=spool["size"] if spool else len(response.body),
+            etag=(response.headers.get(b"ETag") or b"").decode("latin-1"),
+            last_modified=(response.headers.get(b"Last-Modified") or b"").decode("latin-1"),
+            **fields,
+        )
+
+    def _spool_path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.store.basedir, ".partial", f"{digest}.part")
+
+    @staticmethod
+    def _spooled(request) -> dict | None:
+        """Spool info of a body streamed to disk, None if it is in memory."""
+        spool = request.meta.get(SPOOL_META_KEY)
+        return spool if spool and "sha256" in spool else None
+
+    @staticmethod
+    def _discard_spool(request, *, keep_resumable: bool = False) -> None:
+        spool = request.meta.get(SPOOL_META_KEY)
+        if not spool or not spool.get("path"):
+            return
+        info_path = resume_info_path(spool["path"])
+        resumable = os.path.exists(info_path) and os.path.isfile(spool["path"])
+        if keep_resumable and resumable and os.path.getsize(spool["path"]):
+            return
+        for path in (spool["path"], info_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _content_digest(self, request, response) -> str:
+        spool = self._spooled(request)
+        if spool is not None:
+            return spool["sha256"]
+        # Streamed bodies were hashed while spooled; in-memory ones once here.
+        digest = request.meta.get("jurnal_sha256")
+        if digest is None:
+            digest = request.meta["jurnal_sha256"] = hashlib.sha256(response.body).hexdigest()
+        return digest
+
+    def _store_file(self, path: str, response, request, info) -> None:
+        """Write the file atomically; a spooled body is renamed into place."""
+        basedir = getattr(self.store, "basedir", None)
+        if basedir is None:
+            self.store.persist_file(path, io.BytesIO(response.body), info)
+            return
+        target = Path(basedir) / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        spool = self._spooled(request)
+        if spool is not None:
+            os.replace(spool["path"], target)
+            self._discard_spool(request)
+            return
+        tmp_path = target.with_name(target.name + ".tmp")
+        tmp_path.write_bytes(response.body)
+        os.replace(tmp_path, target)
+
     def item_completed(self, results, item, info):
         pdf_url = (item.get("pdf_url") or "").strip()
         if pdf_url in self.in_progress:
             self.in_progress.discard(pdf_url)
 
         ok_files = [x for ok, x in results if ok]
+        skip_reason = self.skipped.pop(pdf_url, None)
+        not_pdf = pdf_url in self.not_pdf
+        self.not_pdf.discard(pdf_url)
+        if not ok_files and skip_reason:
+            raise DropItem(f"pdf_skipped_{skip_reason}")
+        if not ok_files and not_pdf:
+            # The spider may retry a resolver-derived URL via the landing page.
+            raise DropItem("pdf_not_a_pdf")
         if not ok_files:
             raise DropItem("pdf_download_failed")
 
@@ -256,7 +837,13 @@ class PdfDownloadPipeline(FilesPipeline):
 
 
 class CsvAppendPipeline:
-    """Append a stable CSV index after a PDF download succeeds."""
+    """Append a stable CSV index after a PDF download succeeds.
+
+    Rows are buffered and appended in batches (``CSV_FLUSH_ROWS`` rows or
+    ``CSV_FLUSH_SECONDS``, whichever comes first) with one write and an
+    fsync per batch, so a crash loses at most the unflushed batch: up to
+    ``CSV_FLUSH_ROWS`` rows, whose articles are processed again next run.
+    """
 
     fieldnames = [
         "journal_title",
@@ -269,35 +856,273 @@ class CsvAppendPipeline:
         "source_url",
     ]
 
-    def __init__(self, csv_path: str):
+    def __init__(
+        self,
+        csv_path: str,
+        *,
+        flush_rows: int = 50,
+        flush_seconds: float = 5.0,
+        fsync: bool = True,
+        stats=None,
+    ):
         self.csv_path = csv_path
-        self._file = None
-        self._writer: csv.DictWriter | None = None
+        self.flush_rows = max(1, int(flush_rows))
+        self.flush_seconds = max(0.0, float(flush_seconds))
+        self.fsync = fsync
+        self._stats = stats
+        self._fd: int | None = None
+        self._pending: list[dict[str, str]] = []
+        self._pending_since: float | None = None
+        self._last_flush = time.monotonic()
+        self._flush_timer = None
+        self._index: ResumeIndex | None = None
 
     @classmethod
     def from_crawler(cls, crawler):
         csv_path = crawler.settings.get("CSV_OUTPUT", "jurnal_kesehatan_indonesia.csv")
-        return cls(csv_path=csv_path)
+        return cls(
+            csv_path=csv_path,
+            flush_rows=crawler.settings.getint("CSV_FLUSH_ROWS", 50),
+            flush_seconds=crawler.settings.getfloat("CSV_FLUSH_SECONDS", 5.0),
+            fsync=crawler.settings.getbool("CSV_FSYNC", True),
+            stats=crawler.stats,
+        )
 
     def open_spider(self, spider):
-        file_exists = os.path.exists(self.csv_path)
-        self._file = open(self.csv_path, "a", encoding="utf-8", newline="")
-        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        self._fd = os.open(self.csv_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._repair_tail(spider)
 
         # Write header only if the file is new/empty.
-        if (not file_exists) or os.path.getsize(self.csv_path) == 0:
-            self._writer.writeheader()
+        new_file = os.fstat(self._fd).st_size == 0
+        if new_file:
+            self._write(self._render([], header=True))
+
+        # Keep the resume index in step with the rows we append. If it does
+        # not match the CSV we leave it stale, so the next start rebuilds it.
+        index = ResumeIndex(self.csv_path)
+        if new_file:
+            index.rebuild([])
+        if index.is_current():
+            self._index = index
+
+        if self.flush_seconds > 0:
+            # Also flush rows that wait while no new items arrive.
+            self._flush_timer = task.LoopingCall(self._flush_if_due)
+            self._flush_timer.start(self.flush_seconds, now=False)
 
     def close_spider(self, spider):
-        if self._file is not None:
-            self._file.close()
-        self._file = None
-        self._writer = None
+        if self._flush_timer is not None and self._flush_timer.running:
+            self._flush_timer.stop()
+        self._flush_timer = None
+
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+        self._fd = None
+
+        if self._index is not None:
+            self._index.close()
+        self._index = None
 
     def process_item(self, item, spider):
-        if not self._writer:
+        if self._fd is None:
             return item
 
         row = {k: (item.get(k, "") or "") for k in self.fieldnames}
-        self._writer.writerow(row)
+        self._pending.append(row)
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        if len(self._pending) >= self.flush_rows:
+            self.flush()
+        else:
+            self._flush_if_due()
+        return item
+
+    def flush(self) -> None:
+        """Append all pending rows in one write, fsync, then update the index."""
+        if self._fd is None or not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        waited = time.monotonic() - (self._pending_since or time.monotonic())
+        self._pending_since = None
+
+        started = time.perf_counter()
+        self._write(self._render(rows))
+        if self.fsync:
+            os.fsync(self._fd)
+        self._last_flush = time.monotonic()
+
+        # The index only describes rows that are already on disk.
+        if self._index is not None:
+            for row in rows:
+                title = _normalize_spaces(row["title"])
+                source_url = _normalize_spaces(row["source_url"])
+                self._index.append(
+                    dedup_digest(_normalize_spaces(row["pdf_url"]), source_url, title),
+                    source_digest(source_url, title),
+                    path_digest(_normalize_spaces(row["pdf_local_path"])),
+                )
+            self._index.sync()
+
+        if self._stats is not None:
+            elapsed = time.perf_counter() - started
+            self._stats.inc_value("jurnal/csv/flushes")
+            self._stats.inc_value("jurnal/csv/rows_written", len(rows))
+            self._stats.inc_value("jurnal/csv/flush_seconds_total", elapsed)
+            self._stats.max_value("jurnal/csv/flush_seconds_max", elapsed)
+            self._stats.max_value("jurnal/csv/row_wait_seconds_max", waited)
+
+    def _flush_if_due(self) -> None:
+        if self._pending and time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def _render(self, rows: list[dict[str, str]], *, header: bool = False) -> bytes:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self.fieldnames)
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buf.getvalue().encode("utf-8")
+
+    def _write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def _repair_tail(self, spider) -> None:
+        """Drop a half-written last row left behind by a crash mid-append.
+
+        Every row the writer appends ends with a line break and rows never
+        contain one (fields are whitespace-normalized), so anything after the
+        last line break was cut off. It is truncated even when it happens to
+        parse into all columns: a row cut inside its last field still does.
+        """
+        size = os.fstat(self._fd).st_size
+        end = size
+        with open(self.csv_path, "rb") as f:
+            while end > 0:
+                start = max(0, end - (1 << 20))
+                f.seek(start)
+                chunk = f.read(end - start)
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+        if end == size:
+            return
+
+        os.truncate(self.csv_path, end)
+        spider.logger.warning(
+            "Dropped an incomplete trailing row (%d bytes) from %s", size - end, self.csv_path
+        )
+
+
+class ParquetAppendPipeline:
+    """Export the same rows as CsvAppendPipeline to a Parquet dataset.
+
+    Optional (needs pyarrow). Each run adds ``part-*.parquet`` files of
+    ``PARQUET_PART_ROWS`` rows to ``PARQUET_OUTPUT_DIR``, written in row
+    groups of ``PARQUET_ROW_GROUP_ROWS``; ``scrapy compact_parquet`` merges
+    the parts.
+    """
+
+    fieldnames = CsvAppendPipeline.fieldnames
+
+    def __init__(self, output_dir: str, *, row_group_rows: int = 1000, part_rows: int = 10_000):
+        self.output_dir = output_dir
+        self.row_group_rows = row_group_rows
+        self.part_rows = part_rows
+        self._writer: ParquetPartWriter | None = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            raise NotConfigured(str(e))
+        return cls(
+            output_dir=crawler.settings.get(
+                "PARQUET_OUTPUT_DIR", "jurnal_kesehatan_indonesia.parquet"
+            ),
+            row_group_rows=crawler.settings.getint("PARQUET_ROW_GROUP_ROWS", 1000),
+            part_rows=crawler.settings.getint("PARQUET_PART_ROWS", 10_000),
+        )
+
+    def open_spider(self, spider):
+        self._writer = ParquetPartWriter(
+            self.output_dir,
+            self.fieldnames,
+            row_group_rows=self.row_group_rows,
+            part_rows=self.part_rows,
+        )
+
+    def close_spider(self, spider):
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+
+    def process_item(self, item, spider):
+        if self._writer is None:
+            return item
+        self._writer.write({k: str(item.get(k, "") or "") for k in self.fieldnames})
+        return item
+
+
+class SqliteAppendPipeline:
+    """Store accepted articles in SQLite (see ``sqlite_store.ArticleStore``).
+
+    Optional alternative/companion to the CSV index. Rows are committed in
+    transactions of ``SQLITE_BATCH_ROWS`` rows or every
+    ``SQLITE_BATCH_SECONDS``; with ``RESUME_BACKEND = "sqlite"``,
+    ValidateDedupLimitPipeline deduplicates against this database.
+    """
+
+    fieldnames = ["doaj_id", *CsvAppendPipeline.fieldnames]
+
+    def __init__(self, db_path: str, *, batch_rows: int = 100, batch_seconds: float = 5.0):
+        self.db_path = db_path
+        self.batch_rows = max(1, int(batch_rows))
+        self.batch_seconds = max(0.0, float(batch_seconds))
+        self._store: ArticleStore | None = None
+        self._pending: list[dict[str, str]] = []
+        self._flush_timer = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            db_path=crawler.settings.get("SQLITE_PATH", "jurnal_kesehatan_indonesia.sqlite3"),
+            batch_rows=crawler.settings.getint("SQLITE_BATCH_ROWS", 100),
+            batch_seconds=crawler.settings.getfloat("SQLITE_BATCH_SECONDS", 5.0),
+        )
+
+    def open_spider(self, spider):
+        self._store = ArticleStore(self.db_path)
+        if self.batch_seconds > 0:
+            self._flush_timer = task.LoopingCall(self.flush)
+            self._flush_timer.start(self.batch_seconds, now=False)
+
+    def close_spider(self, spider):
+        if self._flush_timer is not None and self._flush_timer.running:
+            self._flush_timer.stop()
+        self._flush_timer = None
+
+        if self._store is not None:
+            self.flush()
+            self._store.close()
+        self._store = None
+
+    def process_item(self, item, spider):
+        if self._store is None:
+            return item
+        self._pending.append({k: (item.get(k, "") or "") for k in self.fieldnames})
+        if len(self._pending) >= self.batch_rows:
+            self.flush()
         return item
+
+    def flush(self) -> None:
+        if self._store is None or not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        self._store.add_rows(rows)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import re
+from typing import Callable, Iterable
+from urllib.parse import urlsplit, urlunsplit
+
+from scrapy.utils.misc import load_object
+
+
+# A resolver maps a fulltext/landing URL to a PDF URL, or returns "" when it
+# does not recognise the URL. They must not do any I/O.
+Resolver = Callable[[str], str]
+
+# OJS 3 ``.../article/view/{submission}/{galley}`` and OJS 2
+# ``.../article/viewFile/{article}/{galley}`` both serve the galley file from
+# ``.../article/download/{id}/{galley}``. ``view/{id}`` alone is the HTML
+# landing page and is left alone.
+_OJS_GALLEY = re.compile(
+    r"^(?P<base>.*/article/)(?:view|viewFile)/(?P<id>\d+)/(?P<galley>[A-Za-z0-9][\w.-]*)"
+    r"(?P<file>/\d+)?/?$"
+)
+
+# DSpace 7 bitstreams: /bitstreams/<uuid>/download or .../content.
+_DSPACE_BITSTREAM = re.compile(
+    r"/bitstreams?/[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12}/(?:download|content)$"
+)
+
+
+def ojs_download_url(url: str) -> str:
+    """OJS 2/3 galley view URL -> direct download URL."""
+    parts = urlsplit(url)
+    match = _OJS_GALLEY.match(parts.path)
+    if not match:
+        return ""
+    path = f"{match['base']}download/{match['id']}/{match['galley']}{match['file'] or ''}"
+    return urlunsplit((parts.scheme, parts.netloc, path, parts.query, ""))
+
+
+def repository_file_url(url: str) -> str:
+    """Repository file links (DSpace, EPrints, ...) that already are the PDF.
+
+    Catches ``.pdf`` paths with a query string (DSpace ``?sequence=1``), which
+    the plain ``endswith(".pdf")`` check misses, and DSpace 7 bitstreams.
+    """
+    path = urlsplit(url).path
+    if path.lower().endswith(".pdf") or _DSPACE_BITSTREAM.search(path):
+        return url
+    return ""
+
+
+DEFAULT_RESOLVERS = (
+    "jurnal_scraping.resolvers.ojs_download_url",
+    "jurnal_scraping.resolvers.repository_file_url",
+)
+
+
+class ResolverRegistry:
+    """Ordered list of resolvers; the first non-empty answer wins."""
+
+    def __init__(self, resolvers: Iterable[Resolver] = ()):
+        self.resolvers: list[Resolver] = list(resolvers)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str | Resolver]) -> ResolverRegistry:
+        return cls(load_object(p) if isinstance(p, str) else p for p in paths)
+
+    def register(self, resolver: Resolver) -> None:
+        self.resolvers.append(resolver)
+
+    def resolve(self, url: str) -> tuple[str, str]:
+        """Return ``(pdf_url, resolver_name)``, or ``("", "")`` if none matched."""
+        if not url:
+            return "", ""
+        for resolver in self.resolvers:
+            pdf_url = resolver(url)
+            if pdf_url:
+                return pdf_url, getattr(resolver, "__name__", type(resolver).__name__)
+        return "", ""
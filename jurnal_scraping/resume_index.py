@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from array import array
+from typing import Container, Iterable
+
+
+# One record per CSV row: 64-bit digests of the dedup key, of the source key
+# and of the row's pdf_local_path (0 = none).
+_RECORD = struct.Struct("<QQQ")
+_VERSION = 3
+
+
+def key_digest(key: str) -> int:
+    """64-bit BLAKE2 digest of a dedup key, as stored in the index."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def dedup_digest(pdf_url: str, source_url: str, title: str) -> int:
+    # Prefer PDF URL for deduplication when available.
+    return key_digest((pdf_url or source_url or "") + "|" + (title.lower() if title else ""))
+
+
+def source_digest(source_url: str, title: str) -> int:
+    """Key known before the PDF URL is resolved (0 without a source URL).
+
+    Lets the spider skip already-harvested articles before fetching their
+    landing page.
+    """
+    if not source_url:
+        return 0
+    return dedup_digest("", source_url, title)
+
+
+def path_digest(rel_path: str) -> int:
+    """Digest of a PDF path relative to FILES_STORE (0 for no path)."""
+    rel_path = (rel_path or "").strip().replace("\\", "/")
+    return key_digest(rel_path) if rel_path else 0
+
+
+class ResumeIndex:
+    """Binary sidecar of the CSV index holding only what resume needs.
+
+    ``<csv>.idx`` is an append-only array of fixed-size records and
+    ``<csv>.idx.json`` records the CSV size the records correspond to. The
+    index is only trusted when both still match; otherwise callers rebuild
+    it from the CSV.
+    """
+
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.path = csv_path + ".idx"
+        self.meta_path = self.path + ".json"
+        self.rows = 0
+        self._file = None
+
+    def is_current(self) -> bool:
+        meta = self._read_meta()
+        if not meta or meta.get("version") != _VERSION:
+            return False
+        try:
+            csv_size = os.path.getsize(self.csv_path)
+            index_size = os.path.getsize(self.path)
+        except OSError:
+            return False
+        rows = int(meta.get("rows", -1))
+        if meta.get("csv_size") != csv_size or index_size != rows * _RECORD.size:
+            return False
+        self.rows = rows
+        return True
+
+    def load(self, present_paths: Container[int]) -> tuple[array, int] | None:
+        """Return ``(digests, downloaded_count)``, or None if missing/stale.
+
+        ``present_paths`` holds the ``path_digest`` of every PDF on disk;
+        ``downloaded_count`` is the number of distinct row paths in it.
+        ``digests`` holds the dedup and source digests of those rows only,
+        so articles whose PDF went missing are harvested again.
+        """
+        if not self.is_current():
+            return None
+        with open(self.path, "rb") as f:
+            data = f.read()
+        digests = array("Q")
+        downloaded: set[int] = set()
+        for digest, source, path in _RECORD.iter_unpack(data):
+            if not path or path not in present_paths:
+                continue
+            digests.append(digest)
+            if source:
+                digests.append(source)
+            downloaded.add(path)
+        return digests, len(downloaded)
+
+    def rebuild(self, records: Iterable[tuple[int, int, int]]) -> None:
+        """Replace the index with ``(digest, source, path_digest)`` records."""
+        self.close()
+        rows = 0
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for digest, source, path in records:
+                f.write(_RECORD.pack(digest, source, path))
+                rows += 1
+        os.replace(tmp_path, self.path)
+        self.rows = rows
+        self.sync()
+
+    def append(self, digest: int, source: int, path: int) -> None:
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(_RECORD.pack(digest, source, path))
+        self.rows += 1
+
+    def sync(self) -> None:
+        """Flush appended records and stamp them with the current CSV size.
+
+        Call only once the CSV rows they describe are on disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+        meta = {
+            "version": _VERSION,
+            "rows": self.rows,
+            "csv_size": os.path.getsize(self.csv_path),
+        }
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+
+    def _read_meta(self) -> dict | None:
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
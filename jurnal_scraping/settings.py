@@ -2,6 +2,7 @@ BOT_NAME = "jurnal_scraping"
 
 SPIDER_MODULES = ["jurnal_scraping.spiders"]
 NEWSPIDER_MODULE = "jurnal_scraping.spiders"
+COMMANDS_MODULE = "jurnal_scraping.commands"
 ROBOTSTXT_OBEY = True
 OFFSITE_ENABLED = False
 
@@ -37,14 +38,119 @@ DOWNLOADER_MIDDLEWARES = {
     "scrapy.downloadermiddlewares.offsite.OffsiteMiddleware": None,
     "scrapy.downloadermiddlewares.useragent.UserAgentMiddleware": None,
     "scrapy.downloadermiddlewares.retry.RetryMiddleware": 550,
+    "jurnal_scraping.middlewares.TrafficClassMiddleware": 100,
 }
 
+# Separate download slots per traffic class and host ("api:doaj.org",
+# "landing:<host>", "pdf:<host>") so PDF bursts cannot starve API paging.
+# Each class gets its own per-host concurrency/delay (DOWNLOAD_SLOTS keys,
+# i.e. concurrency/delay/randomize_delay); CONCURRENT_REQUESTS still caps the
+# total. DOAJ API pages are scheduled with TRAFFIC_API_PRIORITY. A class
+# without "concurrency" gets CONCURRENT_REQUESTS_PER_DOMAIN, as plain slots do:
+# the API class keeps all 8 so a full SEARCH_PAGE_WINDOW can be in flight.
+TRAFFIC_CLASSES_ENABLED = True
+TRAFFIC_CLASS_SLOTS = {
+    "api": {"delay": 0.5},
+    "landing": {"concurrency": 4, "delay": 0.5},
+    "pdf": {"concurrency": 4, "delay": 0.5},
+}
+TRAFFIC_API_PRIORITY = 10
+
+# Landing pages: scan the first N bytes for <meta name="citation_pdf_url"> /
+# <link rel="alternate" type="application/pdf"> before parsing the whole DOM
+# (0 = always parse the DOM).
+LANDING_FASTPATH_BYTES = 65536
+# Stop downloading a landing page after this many bytes and parse what
+# arrived (0 = download it whole).
+LANDING_MAX_BYTES = 131072
+
+# Rewrite rules tried on an article's fulltext URL before its landing page is
+# fetched (OJS 2/3 view -> download, repository file links). Each entry is an
+# import path to a callable(url) -> pdf_url or "" ; the first match wins. If
+# the resolved URL is not a PDF, the landing page is fetched after all.
+PDF_URL_RESOLVERS = [
+    "jurnal_scraping.resolvers.ojs_download_url",
+    "jurnal_scraping.resolvers.repository_file_url",
+]
+
+# Remember per host which landing-page strategy (byte scan, meta tag, anchor
+# CSS selector) found the PDF link, try it first next time, and keep the
+# rules between runs in LANDING_RULES_PATH.
+LANDING_RULES_ENABLED = True
+LANDING_RULES_PATH = "jobstate/landing_rules.json"
+
+# On-disk cache of DOAJ API search pages only (landing pages and PDFs are never
+# cached), one zstd-compressed file per query+page under .scrapy/HTTPCACHE_DIR
+# (gzip when no zstd module is installed). Entries expire after
+# HTTPCACHE_EXPIRATION_SECS (0 = never); the oldest are evicted once the cache
+# exceeds HTTPCACHE_MAX_BYTES. Replay offline with
+# -s HTTPCACHE_IGNORE_MISSING=True -s HTTPCACHE_EXPIRATION_SECS=0.
+HTTPCACHE_ENABLED = True
+HTTPCACHE_POLICY = "jurnal_scraping.httpcache.DoajApiCachePolicy"
+HTTPCACHE_STORAGE = "jurnal_scraping.httpcache.CompressedCacheStorage"
+HTTPCACHE_DIR = "doaj_api_cache"
+HTTPCACHE_URL_PREFIXES = ["https://doaj.org/api/"]
+HTTPCACHE_EXPIRATION_SECS = 24 * 3600
+HTTPCACHE_MAX_BYTES = 256 * 1024 * 1024
+HTTPCACHE_COMPRESSION = "zstd"
+
+# DOAJ search pages per query requested concurrently once the first page
+# reports the result total (1 = fetch pages strictly one after another).
+SEARCH_PAGE_WINDOW = 8
+
+# Parse DOAJ search pages incrementally, yielding each record as soon as it is
+# decoded. When False the whole page is decoded at once (with orjson if it is
+# installed, else the stdlib json module).
+DOAJ_JSON_STREAMING = False
+
+# Title/abstract must contain at least one of these (case-insensitive) for an
+# article to count as health/medical. Used by the spider and the pipeline.
+HEALTH_KEYWORDS = [
+    "kesehatan",
+    "medis",
+    "kedokteran",
+    "keperawatan",
+    "farmasi",
+    "kesehatan masyarakat",
+    "gizi",
+    "klinis",
+    "rumah sakit",
+]
+
+# Language detection: abstracts whose Indonesian/English stop-word counts are
+# clear-cut skip langdetect; langdetect answers are kept in an LRU keyed by a
+# hash of the abstract, optionally persisted to LANGDETECT_CACHE_PATH.
+LANGDETECT_PRECLASSIFY = True
+LANGDETECT_CACHE_SIZE = 20000
+LANGDETECT_CACHE_PATH = "jobstate/langdetect_cache.json"
+# Texts that still need langdetect are detected in batches by a worker pool
+# ("thread" or "process") instead of on the reactor thread; 0 = inline.
+# One thread keeps the reactor responsive; threads share the GIL, so more of
+# them only add latency. "process" spawns workers that detect in parallel on
+# multi-core hosts (see benchmarks/bench_langdetect_pool.py).
+LANGDETECT_WORKERS = 1
+LANGDETECT_EXECUTOR = "thread"
+LANGDETECT_BATCH_SIZE = 16
+LANGDETECT_BATCH_DELAY = 0.05
+
+# In-memory dedup keys (64-bit digests): "array" is exact (~8 bytes/key),
+# "bloom" is smaller but may treat a new article as a duplicate at the given
+# false-positive rate once DEDUP_BLOOM_CAPACITY keys are stored. Memory at 1M
+# keys: benchmarks/bench_keyset_memory.py.
+DEDUP_KEY_STORE = "array"
+DEDUP_BLOOM_CAPACITY = 1_000_000
+DEDUP_BLOOM_FP_RATE = 0.001
+
 MAX_ITEMS = 450
 MAX_PDFS = 450
 ITEM_PIPELINES = {
     "jurnal_scraping.pipelines.ValidateDedupLimitPipeline": 200,
     "jurnal_scraping.pipelines.PdfDownloadPipeline": 300,
     "jurnal_scraping.pipelines.CsvAppendPipeline": 400,
+    # Optional columnar copy of the CSV rows (requires pyarrow):
+    # "jurnal_scraping.pipelines.ParquetAppendPipeline": 410,
+    # Optional SQLite article store (needed for RESUME_BACKEND = "sqlite"):
+    # "jurnal_scraping.pipelines.SqliteAppendPipeline": 420,
 }
 FILES_STORE = "downloaded_pdfs"
 MEDIA_ALLOW_REDIRECTS = True
@@ -56,10 +162,71 @@ PDF_FILENAME_BY_TITLE = True
 PDF_FILENAME_HASH_LEN = 10
 PDF_FILENAME_SLUG_MAXLEN = 120
 
+# Content-addressed store: pdfs/<sha256(content)>.pdf, so the same PDF reached
+# via several URLs is stored once. Overrides PDF_FILENAME_BY_TITLE; the
+# URL -> hash mapping is kept in <FILES_STORE>/pdfs/url_index.jsonl.
+PDF_STORE_BY_CONTENT = False
+
+# Stream PDF bodies to <FILES_STORE>/.partial/ while downloading instead of
+# holding them in memory (needs the spooling handler below).
+PDF_STREAM_TO_DISK = True
+DOWNLOAD_HANDLERS = {
+    "http": "jurnal_scraping.downloadhandlers.SpoolingDownloadHandler",
+    "https": "jurnal_scraping.downloadhandlers.SpoolingDownloadHandler",
+}
+
+# Per-PDF budget (0 = no limit). Content-Length is checked first, then the
+# streamed bytes/elapsed time; over-budget downloads are cancelled and the
+# article is dropped as skipped (pdf_skipped_too_large / pdf_skipped_too_slow).
+# PDF_MAX_SECONDS runs from the first response and covers all retries; a timer
+# cancels the transfer when it runs out, even mid-stall. Each attempt still
+# times out after DOWNLOAD_TIMEOUT and is retried.
+PDF_MAX_BYTES = 100 * 1024 * 1024
+PDF_MAX_SECONDS = 300
+
+# Re-download of a stored PDF (FILES_EXPIRES days old, default 90) is sent as
+# a conditional GET with the ETag/Last-Modified recorded in url_index.jsonl;
+# a 304 reuses the stored file and restarts its FILES_EXPIRES age.
+PDF_CONDITIONAL_REFETCH = True
+
 # Persist scheduler/dupefilter state for resume.
 JOBDIR = "jobstate"
 
 # Where the index CSV is written/appended.
 CSV_OUTPUT = "jurnal_kesehatan_indonesia.csv"
 
+# CSV rows are appended in batches: after CSV_FLUSH_ROWS rows or
+# CSV_FLUSH_SECONDS seconds, whichever comes first, each batch followed by an
+# fsync when CSV_FSYNC is True. A crash loses the rows not yet flushed (up to
+# CSV_FLUSH_ROWS); those articles are processed again on the next run.
+CSV_FLUSH_ROWS = 50
+CSV_FLUSH_SECONDS = 5.0
+CSV_FSYNC = True
+
+# Parquet export (ParquetAppendPipeline): a new part file every
+# PARQUET_PART_ROWS rows (a crash loses at most the part being written), in
+# row groups of PARQUET_ROW_GROUP_ROWS; `scrapy compact_parquet` merges the
+# parts into row groups of PARQUET_COMPACT_ROW_GROUP_ROWS.
+PARQUET_OUTPUT_DIR = "jurnal_kesehatan_indonesia.parquet"
+PARQUET_ROW_GROUP_ROWS = 1000
+PARQUET_PART_ROWS = 10_000
+PARQUET_COMPACT_ROW_GROUP_ROWS = 100_000
+
+# SQLite article store (SqliteAppendPipeline), WAL mode, rows committed in
+# batches. RESUME_BACKEND = "sqlite" makes dedup/resume load the keys of rows
+# whose PDF is on disk from this database instead of the CSV index
+# (SqliteAppendPipeline must be enabled for this run's articles to be
+# stored). Migrate an existing CSV with `scrapy sqlite_import` and get a CSV
+# back with `scrapy sqlite_export`.
+SQLITE_PATH = "jurnal_kesehatan_indonesia.sqlite3"
+SQLITE_BATCH_ROWS = 100
+SQLITE_BATCH_SECONDS = 5.0
+RESUME_BACKEND = "csv"
+
+# On startup, re-read the CSV and check every listed PDF (non-empty, starts
+# with %PDF-) using RESUME_VERIFY_WORKERS threads instead of trusting the
+# resume index.
+RESUME_VERIFY_PDFS = False
+RESUME_VERIFY_WORKERS = 8
+
 LOG_LEVEL = "INFO"
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import json
+import math
 import re
+import time
 from typing import Any
 from urllib.parse import quote_plus
 
 import scrapy
+from scrapy import signals
+from scrapy.exceptions import StopDownload
+from scrapy.utils.httpobj import urlparse_cached
 
+from jurnal_scraping import doaj_json, landing
 from jurnal_scraping.items import JournalArticleItem
+from jurnal_scraping.keywords import DEFAULT_HEALTH_KEYWORDS, get_matcher
+from jurnal_scraping.resolvers import DEFAULT_RESOLVERS, ResolverRegistry
+from jurnal_scraping.resume_index import dedup_digest, source_digest
 
 
 class DoajKesehatanIndonesiaSpider(scrapy.Spider):
@@ -19,18 +27,31 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
     }
 
     page_size = 100
-
-    health_keywords = (
-        "kesehatan",
-        "medis",
-        "kedokteran",
-        "keperawatan",
-        "farmasi",
-        "kesehatan masyarakat",
-        "gizi",
-        "klinis",
-        "rumah sakit",
-    )
+    # How many search pages per query may be in flight at once (1 = serial).
+    search_page_window = 8
+    # Walk search pages record by record instead of decoding them whole.
+    json_streaming = False
+    # Scheduler priority of DOAJ API pages over landing pages, so new records
+    # keep arriving while landing/PDF downloads are queued.
+    api_priority = 10
+    # Bytes of a landing page scanned for the PDF meta/link tags before
+    # falling back to a full DOM parse (0 = always parse the DOM).
+    landing_fastpath_bytes = 65536
+    # Stop reading a landing page after this many bytes (0 = read it whole);
+    # the PDF link is almost always in the head or the first article block.
+    landing_max_bytes = 131072
+
+    # Fulltext URL -> PDF URL rewrites tried before fetching a landing page.
+    url_resolvers = ResolverRegistry.from_paths(DEFAULT_RESOLVERS)
+    # Per-host landing-page strategy that found the PDF link last time.
+    landing_rules: landing.LandingRuleCache | None = None
+
+    # Records skipped because another query already returned the same DOAJ id.
+    duplicate_records_skipped = 0
+    _local_seen_ids: set[str] | None = None
+
+    health_keywords = DEFAULT_HEALTH_KEYWORDS
+    health_matcher = get_matcher(DEFAULT_HEALTH_KEYWORDS)
 
     keyword_queries = (
         "kesehatan",
@@ -44,11 +65,48 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
         '"rumah sakit"',
     )
 
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        spider.search_page_window = max(
+            1, crawler.settings.getint("SEARCH_PAGE_WINDOW", cls.search_page_window)
+        )
+        spider.json_streaming = crawler.settings.getbool("DOAJ_JSON_STREAMING", cls.json_streaming)
+        spider.api_priority = crawler.settings.getint("TRAFFIC_API_PRIORITY", cls.api_priority)
+        spider.landing_fastpath_bytes = crawler.settings.getint(
+            "LANDING_FASTPATH_BYTES", cls.landing_fastpath_bytes
+        )
+        spider.landing_max_bytes = crawler.settings.getint(
+            "LANDING_MAX_BYTES", cls.landing_max_bytes
+        )
+        resolver_paths = crawler.settings.getlist("PDF_URL_RESOLVERS", list(DEFAULT_RESOLVERS))
+        if crawler.settings.getbool("LANDING_RULES_ENABLED", True):
+            rules_path = crawler.settings.get("LANDING_RULES_PATH")
+            spider.landing_rules = landing.LandingRuleCache(rules_path)
+            try:
+                spider.landing_rules.load()
+            except (OSError, ValueError) as e:
+                spider.logger.warning(
+                    "Failed loading landing rules (%s): %s", spider.landing_rules.path, e
+                )
+        spider.url_resolvers = ResolverRegistry.from_paths(resolver_paths)
+        crawler.signals.connect(spider._on_item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(spider._on_item_dropped, signal=signals.item_dropped)
+        if spider.landing_max_bytes > 0:
+            crawler.signals.connect(spider._on_headers_received, signal=signals.headers_received)
+            crawler.signals.connect(spider._on_bytes_received, signal=signals.bytes_received)
+        keywords = crawler.settings.getlist("HEALTH_KEYWORDS") or cls.health_keywords
+        spider.health_keywords = tuple(keywords)
+        spider.health_matcher = get_matcher(keywords)
+        return spider
+
     def start_requests(self):
         for query in self.keyword_queries:
             yield self._make_search_request(query=query, page=1)
 
-    def _make_search_request(self, query: str, page: int) -> scrapy.Request:
+    def _make_search_request(
+        self, query: str, page: int, last_page: int | None = None
+    ) -> scrapy.Request:
         url = (
             "https://doaj.org/api/v2/search/articles/"
             + quote_plus(query)
@@ -57,10 +115,13 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
         return scrapy.Request(
             url,
             callback=self.parse_search,
-            errback=self.errback_log,
+            errback=self.errback_search,
+            priority=self.api_priority,
             meta={
+                "traffic_class": "api",
                 "query": query,
                 "page": page,
+                "last_page": last_page,
                 # Let callback see non-200 so we can log status/body.
                 "handle_httpstatus_list": [400, 401, 403, 404, 429, 500, 502, 503, 504],
             },
@@ -77,46 +138,241 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
                 response.url,
                 body_prefix,
             )
+            yield from self._skip_failed_search_page(response.meta)
             return
 
-        try:
-            payload = json.loads(response.text)
-        except json.JSONDecodeError:
-            self.logger.warning("JSON decode failed for %s", response.url)
+        query = response.meta.get("query")
+        page = int(response.meta.get("page") or 1)
+        last_page = response.meta.get("last_page")
+
+        seen_ids = self._seen_record_ids()
+        if not self.json_streaming:
+            try:
+                payload = doaj_json.loads(response.body)
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                self.logger.warning("JSON decode failed for %s", response.url)
+                return
+            results = payload.get("results")
+            results = results if isinstance(results, list) else []
+            if query and (results or self._pagination_known(page, last_page, payload)):
+                yield from self._next_search_requests(query, page, last_page, payload)
+            for record in results:
+                if isinstance(record, dict):
+                    yield from self._handle_record(record, seen_ids)
             return
 
-        results = payload.get("results") or []
-        if not results:
+        # Top-level members seen so far. DOAJ sends ``total`` ahead of
+        # ``results``, so follow-up pages usually go out before any record;
+        # without it they are scheduled once the page turned out non-empty.
+        payload: dict[str, Any] = {}
+        scheduled_next = not query
+        had_results = False
+        members = doaj_json.iter_members(response.body, streaming=True)
+        while True:
+            try:
+                key, value = next(members)
+            except StopIteration:
+                break
+            except ValueError:
+                self.logger.warning("JSON decode failed for %s", response.url)
+                return
+
+            if key == "results":
+                had_results = True
+                if isinstance(value, dict):
+                    yield from self._handle_record(value, seen_ids)
+                continue
+
+            payload[key] = value
+            if not scheduled_next and self._pagination_known(page, last_page, payload):
+                scheduled_next = True
+                yield from self._next_search_requests(query, page, last_page, payload)
+
+        if not scheduled_next and had_results:
+            yield from self._next_search_requests(query, page, last_page, payload)
+
+    def _handle_record(self, record: dict[str, Any], seen_ids: set[str]):
+        record_id = str(record.get("id") or "")
+        if record_id:
+            if record_id in seen_ids or record_id in self._stored_record_ids():
+                self.duplicate_records_skipped += 1
+                self.crawler.stats.inc_value("jurnal/doaj_records_duplicate_skipped")
+                return
+            seen_ids.add(record_id)
+
+        item = self._record_to_item(record)
+        if not item:
             return
 
-        query = response.meta.get("query")
-        page = int(response.meta.get("page") or 1)
-        if query:
+        pdf_url = (item.get("pdf_url") or "").strip()
+        if self._already_harvested(item, pdf_url):
+            self.crawler.stats.inc_value("jurnal/already_harvested_skipped")
+            return
+
+        if pdf_url and pdf_url.lower().endswith(".pdf"):
+            item["pdf_url"] = pdf_url
+            item["file_urls"] = [pdf_url]
+            yield item
+            return
+
+        landing_url = (item.get("landing_url") or "").strip()
+        resolved_url, resolver_name = self.url_resolvers.resolve(landing_url)
+        if resolved_url:
+            # PDF URL derived from the fulltext link; no landing page needed.
+            self.crawler.stats.inc_value("jurnal/resolver/resolved")
+            self.crawler.stats.inc_value(f"jurnal/resolver/resolved/{resolver_name}")
+            if self._already_harvested(item, resolved_url):
+                self.crawler.stats.inc_value("jurnal/already_harvested_skipped")
+                return
+            item["pdf_url"] = resolved_url
+            item["file_urls"] = [resolved_url]
+            # Lets _on_item_dropped fall back to the landing page.
+            item["pdf_resolver"] = resolver_name
+            yield item
+            return
+
+        if landing_url:
+            self.crawler.stats.inc_value("jurnal/resolver/landing_fetch")
+            yield self._landing_request(landing_url, item)
+
+    def _landing_request(self, landing_url: str, item: JournalArticleItem) -> scrapy.Request:
+        return scrapy.Request(
+            landing_url,
+            callback=self.parse_landing,
+            errback=self.errback_log,
+            meta={
+                "traffic_class": "landing",
+                "landing_download": {},
+                "item": item,
+                "handle_httpstatus_list": [400, 401, 403, 404, 429, 500, 502, 503, 504],
+            },
+        )
+
+    def _already_harvested(self, item: JournalArticleItem, pdf_url: str) -> bool:
+        """Check the dedup keys published by ValidateDedupLimitPipeline.
+
+        ``jurnal_seen`` holds the keys of resume CSV rows whose PDF is still
+        on disk and of items accepted during this run, so known articles are
+        dropped here, before a landing page is fetched or their language is
+        detected.
+        """
+        seen = getattr(self, "jurnal_seen", None)
+        if seen is None:
+            return False
+        title = item.get("title") or ""
+        source_url = item.get("source_url") or ""
+        if pdf_url and dedup_digest(pdf_url, source_url, title) in seen:
+            return True
+        source_key = source_digest(source_url, title)
+        return bool(source_key) and source_key in seen
+
+    def _seen_record_ids(self) -> set[str]:
+        """DOAJ record ids already handled in this crawl, shared by all queries."""
+        if self._local_seen_ids is None:
+            self._local_seen_ids = set()
+        return self._local_seen_ids
+
+    def _stored_record_ids(self) -> set[str]:
+        """DOAJ record ids whose article made it through every pipeline.
+
+        With ``JOBDIR`` set, Scrapy's SpiderState extension pickles
+        ``self.state`` next to the scheduler queue, so the ids survive a
+        resumed run. Records dropped on the way (PDF limit, failed download)
+        are not in here and are tried again next run.
+        """
+        state = getattr(self, "state", None)
+        if isinstance(state, dict):
+            return state.setdefault("doaj_seen_ids", set())
+        return set()
+
+    def _on_item_scraped(self, item, response, spider):
+        record_id = item.get("doaj_id")
+        if record_id:
+            self._stored_record_ids().add(record_id)
+
+    def _on_item_dropped(self, item, response, exception, spider):
+        """Fetch the landing page after all when a resolved URL was not a PDF.
+
+        Resolvers guess the PDF URL from the fulltext link; when the guess
+        turns out to be an HTML page (PdfDownloadPipeline drops the item as
+        ``pdf_not_a_pdf``), the landing page may still link the real PDF.
+        """
+        resolver_name = item.get("pdf_resolver")
+        if not resolver_name or str(exception) != "pdf_not_a_pdf":
+            return
+        stats = self.crawler.stats
+        stats.inc_value("jurnal/resolver/not_a_pdf")
+        stats.inc_value(f"jurnal/resolver/not_a_pdf/{resolver_name}")
+        landing_url = (item.get("landing_url") or "").strip()
+        if not landing_url:
+            return
+        fallback = item.copy()
+        fallback.pop("pdf_resolver")
+        fallback["pdf_url"] = ""
+        fallback["file_urls"] = []
+        stats.inc_value("jurnal/resolver/landing_fallback")
+        self.crawler.engine.crawl(self._landing_request(landing_url, fallback))
+
+    def _next_search_requests(
+        self, query: str, page: int, last_page: int | None, payload: dict[str, Any]
+    ):
+        """Schedule follow-up search pages for ``query``.
+
+        Page 1 reads ``total`` and fans out pages 2..1+window at once; every
+        later page then tops the window up by scheduling ``page + window``, so
+        each remaining page is requested exactly once and at most ``window``
+        pages per query are in flight. Without a usable ``total`` we fall back
+        to walking the pages one by one until an empty page comes back.
+        """
+        window = self.search_page_window
+
+        if page == 1:
+            total = self._payload_total(payload)
+            if total <= 0:
+                yield self._make_search_request(query=query, page=2)
+                return
+            last_page = math.ceil(total / self.page_size)
+            for next_page in range(2, min(last_page, 1 + window) + 1):
+                yield self._make_search_request(query=query, page=next_page, last_page=last_page)
+            return
+
+        if last_page is None:
             yield self._make_search_request(query=query, page=page + 1)
+            return
 
-        for record in results:
-            item = self._record_to_item(record)
-            if not item:
-                continue
+        next_page = page + window
+        if next_page <= last_page:
+            yield self._make_search_request(query=query, page=next_page, last_page=last_page)
+
+    def _skip_failed_search_page(self, meta: dict[str, Any]):
+        """Keep the page window of a query going past a page that failed.
+
+        Each later page is the only one that schedules ``page + window``, so
+        a lost page would otherwise silently drop every window-th page after
+        it. Before ``last_page`` is known there is nothing to continue.
+        """
+        query = meta.get("query")
+        page = int(meta.get("page") or 1)
+        last_page = meta.get("last_page")
+        if not query or page == 1 or last_page is None:
+            return
+        self.crawler.stats.inc_value("jurnal/search_pages_failed")
+        yield from self._next_search_requests(query, page, last_page, {})
 
-            pdf_url = (item.get("pdf_url") or "").strip()
-            if pdf_url and pdf_url.lower().endswith(".pdf"):
-                item["pdf_url"] = pdf_url
-                item["file_urls"] = [pdf_url]
-                yield item
-                continue
+    def _pagination_known(
+        self, page: int, last_page: int | None, payload: dict[str, Any]
+    ) -> bool:
+        """Whether follow-up pages can be scheduled without seeing any record."""
+        return last_page is not None or (page == 1 and self._payload_total(payload) > 0)
 
-            landing_url = (item.get("landing_url") or "").strip()
-            if landing_url:
-                yield scrapy.Request(
-                    landing_url,
-                    callback=self.parse_landing,
-                    errback=self.errback_log,
-                    meta={
-                        "item": item,
-                        "handle_httpstatus_list": [400, 401, 403, 404, 429, 500, 502, 503, 504],
-                    },
-                )
+    @staticmethod
+    def _payload_total(payload: dict[str, Any]) -> int:
+        try:
+            return int(payload.get("total") or 0)
+        except (TypeError, ValueError):
+            return 0
 
     def _record_to_item(self, record: dict[str, Any]) -> JournalArticleItem | None:
         bib = record.get("bibjson") or {}
@@ -127,9 +383,10 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
         if not title or not abstract:
             return None
 
-        # lightweight pre-filter to reduce downstream work
-        haystack = f"{title} {abstract}".lower()
-        if not any(k in haystack for k in self.health_keywords):
+        # lightweight pre-filter to reduce downstream work; the hits travel
+        # with the item so the validation pipeline does not rescan the text.
+        health_hits = self.health_matcher.find(title, abstract)
+        if not health_hits:
             return None
 
         journal = bib.get("journal") or {}
@@ -152,6 +409,7 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
         source_url = self._extract_source_url(record, links)
 
         item = JournalArticleItem(
+            doaj_id=str(record.get("id") or ""),
             journal_title=(journal_title or ""),
             title=title,
             authors=", ".join(self._dedup_keep_order(authors)),
@@ -161,6 +419,7 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
             landing_url=landing_url or "",
             file_urls=[pdf_url] if (pdf_url or "").lower().endswith(".pdf") else [],
             source_url=source_url or "",
+            health_keywords=list(health_hits),
         )
         return item
 
@@ -186,6 +445,58 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
 
         yield item
 
+    def _on_headers_received(self, headers, body_length, request, spider):
+        state = request.meta.get("landing_download")
+        if state is None:
+            return
+        state.clear()
+        state.update(
+            expected=body_length if isinstance(body_length, int) else -1,
+            received=0,
+            headers_at=time.monotonic(),
+        )
+
+    def _on_bytes_received(self, data, request, spider):
+        state = request.meta.get("landing_download")
+        if not state:
+            return
+        state["received"] += len(data)
+        if state["received"] < self.landing_max_bytes:
+            return
+        # Enough HTML: deliver what arrived as a normal (truncated) response.
+        stats = self.crawler.stats
+        stats.inc_value("jurnal/landing/truncated")
+        stats.inc_value("jurnal/landing/truncated_bytes_read", state["received"])
+        remaining = state["expected"] - state["received"]
+        if remaining > 0:
+            # Seconds saved estimated from this page's own transfer rate.
+            elapsed = time.monotonic() - state["headers_at"]
+            stats.inc_value("jurnal/landing/truncated_bytes_saved", remaining)
+            stats.inc_value(
+                "jurnal/landing/truncated_seconds_saved",
+                round(elapsed * remaining / state["received"], 3),
+            )
+        raise StopDownload(fail=False)
+
+    def closed(self, reason):
+        stats = self.crawler.stats
+        resolved = stats.get_value("jurnal/resolver/resolved", 0)
+        total = resolved + stats.get_value("jurnal/resolver/landing_fetch", 0)
+        if total:
+            stats.set_value("jurnal/resolver/resolved_ratio", round(resolved / total, 4))
+        if self.landing_rules is not None:
+            stats.set_value("jurnal/landing/learned_hosts", len(self.landing_rules.rules))
+            try:
+                self.landing_rules.save()
+            except OSError as e:
+                self.logger.warning(
+                    "Failed saving landing rules (%s): %s", self.landing_rules.path, e
+                )
+
+    def errback_search(self, failure):
+        self.errback_log(failure)
+        yield from self._skip_failed_search_page(failure.request.meta)
+
     def errback_log(self, failure):
         response = getattr(failure.value, "response", None)
         if response is not None:
@@ -241,26 +552,94 @@ class DoajKesehatanIndonesiaSpider(scrapy.Spider):
                 return url
         return ""
 
-    @staticmethod
-    def _find_pdf_url_in_landing(response: scrapy.http.Response) -> str:
+    def _find_pdf_url_in_landing(self, response: scrapy.http.Response) -> str:
+        host = urlparse_cached(response).hostname or ""
+        rules = self.landing_rules
+        rule = rules.get(host) if rules is not None else None
+        if rule:
+            pdf_url = self._apply_landing_rule(response, rule)
+            if pdf_url:
+                rules.hit(host)
+                self.crawler.stats.inc_value("jurnal/landing/learned_hit")
+                return response.urljoin(pdf_url)
+            rules.miss(host)
+            self.crawler.stats.inc_value("jurnal/landing/learned_miss")
+
+        pdf_url, strategy, selector = self._find_pdf_link(response)
+        if not pdf_url:
+            return ""
+        if rules is not None and rules.get(host) is None:
+            # A rule that only missed a few pages is kept until it is dropped.
+            rules.learn(host, strategy, selector)
+        return response.urljoin(pdf_url)
+
+    def _find_pdf_link(self, response: scrapy.http.Response) -> tuple[str, str, str]:
+        """Generic search: ``(href, strategy, anchor selector)`` or empty strings."""
+        if self.landing_fastpath_bytes > 0:
+            pdf_url = landing.scan_pdf_url(
+                response.body, self.landing_fastpath_bytes, getattr(response, "encoding", "utf-8")
+            )
+            if pdf_url:
+                self.crawler.stats.inc_value("jurnal/landing/fastpath_hit")
+                return pdf_url, "fastpath", ""
+            self.crawler.stats.inc_value("jurnal/landing/dom_fallback")
+
         meta_pdf = response.css('meta[name="citation_pdf_url"]::attr(content)').get()
         if meta_pdf and meta_pdf.strip():
-            return response.urljoin(meta_pdf.strip())
-
-        hrefs = response.css("a::attr(href)").getall()
-        hrefs = [h.strip() for h in hrefs if h and h.strip() and not h.strip().lower().startswith("javascript:")]
+            return meta_pdf.strip(), "meta", ""
 
-        for h in hrefs:
+        anchors = self._landing_anchors(response)
+        for anchor, h in anchors:
             if ".pdf" in h.lower():
-                return response.urljoin(h)
+                return h, "anchor_pdf", self._anchor_selector(response, anchor, h)
 
-        for h in hrefs:
+        for anchor, h in anchors:
             hl = h.lower()
             if "pdf" in hl or "download" in hl:
-                return response.urljoin(h)
+                return h, "anchor_download", self._anchor_selector(response, anchor, h)
+
+        return "", "", ""
 
+    def _apply_landing_rule(self, response: scrapy.http.Response, rule: dict[str, Any]) -> str:
+        strategy = rule.get("strategy")
+        if strategy == "fastpath":
+            return landing.scan_pdf_url(
+                response.body, self.landing_fastpath_bytes, getattr(response, "encoding", "utf-8")
+            )
+        if strategy == "meta":
+            meta_pdf = response.css('meta[name="citation_pdf_url"]::attr(content)').get()
+            return (meta_pdf or "").strip()
+        if rule.get("selector"):
+            return (response.css(f"{rule['selector']}::attr(href)").get() or "").strip()
+        needles = (".pdf",) if strategy == "anchor_pdf" else ("pdf", "download")
+        for _, h in self._landing_anchors(response):
+            if any(n in h.lower() for n in needles):
+                return h
         return ""
 
+    @staticmethod
+    def _landing_anchors(response: scrapy.http.Response) -> list[tuple[Any, str]]:
+        anchors = []
+        for anchor in response.css("a[href]"):
+            h = (anchor.attrib.get("href") or "").strip()
+            if h and not h.lower().startswith("javascript:"):
+                anchors.append((anchor, h))
+        return anchors
+
+    @staticmethod
+    def _anchor_selector(response: scrapy.http.Response, anchor: Any, href: str) -> str:
+        """CSS selector (by class) that picks this anchor first, or ""."""
+        classes = [
+            c
+            for c in (anchor.attrib.get("class") or "").split()
+            if re.fullmatch(r"[A-Za-z_][\w-]*", c)
+        ]
+        if not classes:
+            return ""
+        selector = "a." + ".".join(classes)
+        first = (response.css(f"{selector}::attr(href)").get() or "").strip()
+        return selector if first == href else ""
+
     @staticmethod
     def _extract_source_url(record: dict[str, Any], links: list[dict[str, Any]]) -> str:
         # Prefer DOAJ record url if present, else fallback to first link
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from array import array
+from typing import Container, Iterable, Iterator
+
+from jurnal_scraping.resume_index import dedup_digest, path_digest, source_digest
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    doaj_id TEXT NOT NULL DEFAULT '',
+    journal_title TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    authors TEXT NOT NULL DEFAULT '',
+    affiliation TEXT NOT NULL DEFAULT '',
+    abstract TEXT NOT NULL DEFAULT '',
+    pdf_url TEXT NOT NULL DEFAULT '',
+    pdf_local_path TEXT NOT NULL DEFAULT '',
+    source_url TEXT NOT NULL DEFAULT '',
+    dedup_key INTEGER NOT NULL,
+    source_key INTEGER NOT NULL DEFAULT 0,
+    downloaded INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS articles_dedup_key ON articles (dedup_key);
+CREATE INDEX IF NOT EXISTS articles_source_key ON articles (source_key);
+CREATE INDEX IF NOT EXISTS articles_doaj_id ON articles (doaj_id);
+CREATE INDEX IF NOT EXISTS articles_downloaded ON articles (downloaded);
+"""
+
+_COLUMNS = (
+    "doaj_id",
+    "journal_title",
+    "title",
+    "authors",
+    "affiliation",
+    "abstract",
+    "pdf_url",
+    "pdf_local_path",
+    "source_url",
+)
+
+
+_DIGEST_MASK = (1 << 64) - 1
+
+
+def _signed(digest: int) -> int:
+    # SQLite integers are signed 64-bit.
+    return digest - (1 << 64) if digest >= (1 << 63) else digest
+
+
+def doaj_id_from_source_url(source_url: str) -> str:
+    prefix = "https://doaj.org/article/"
+    return source_url[len(prefix):] if source_url.startswith(prefix) else ""
+
+
+class ArticleStore:
+    """SQLite (WAL mode) table of harvested articles keyed by dedup digest.
+
+    Rows carry the same dedup/source digests as the CSV resume index, so
+    resume loads them with one query (``load``) instead of parsing the CSV.
+    ``add_rows`` writes a whole batch in one transaction; rows whose dedup
+    key is already stored are ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def add_rows(self, rows: Iterable[dict[str, str]]) -> int:
+        now = time.time()
+        params = []
+        for row in rows:
+            # Same whitespace normalization as the dedup keys in the pipelines.
+            title = " ".join((row.get("title") or "").split())
+            source_url = " ".join((row.get("source_url") or "").split())
+            pdf_url = " ".join((row.get("pdf_url") or "").split())
+            values = {k: str(row.get(k) or "") for k in _COLUMNS}
+            values["doaj_id"] = values["doaj_id"] or doaj_id_from_source_url(source_url)
+            params.append(
+                (
+                    *(values[k] for k in _COLUMNS),
+                    _signed(dedup_digest(pdf_url, source_url, title)),
+                    _signed(source_digest(source_url, title)),
+                    1 if row.get("downloaded", values["pdf_local_path"]) else 0,
+                    now,
+                )
+            )
+        if not params:
+            return 0
+        placeholders = ", ".join("?" for _ in range(len(_COLUMNS) + 4))
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"INSERT OR IGNORE INTO articles ({', '.join(_COLUMNS)}, dedup_key, source_key,"
+                f" downloaded, created_at) VALUES ({placeholders})",
+                params,
+            )
+        return cursor.rowcount
+
+    def load(self, present_paths: Container[int]) -> tuple[array, int]:
+        """Return ``(digests, downloaded_count)`` like ``ResumeIndex.load``.
+
+        ``present_paths`` holds the ``path_digest`` of every PDF on disk;
+        only rows whose ``pdf_local_path`` is among them count, so articles
+        whose PDF went missing are harvested again. ``downloaded_count`` is
+        the number of distinct files.
+        """
+        cursor = self.conn.execute(
+            "SELECT dedup_key, source_key, pdf_local_path FROM articles"
+            " WHERE downloaded = 1 AND pdf_local_path != ''"
+        )
+        digests = array("Q")
+        downloaded: set[int] = set()
+        for dedup_key, source_key, pdf_local_path in cursor:
+            path = path_digest(" ".join(pdf_local_path.split()).replace("\\", "/"))
+            if path not in present_paths:
+                continue
+            digests.append(dedup_key & _DIGEST_MASK)
+            if source_key:
+                digests.append(source_key & _DIGEST_MASK)
+            downloaded.add(path)
+        return digests, len(downloaded)
+
+    def iter_rows(self, fieldnames: list[str]) -> Iterator[dict[str, str]]:
+        columns = [name for name in fieldnames if name in _COLUMNS]
+        cursor = self.conn.execute(f"SELECT {', '.join(columns)} FROM articles ORDER BY id")
+        for values in cursor:
+            row = dict.fromkeys(fieldnames, "")
+            row.update(zip(columns, values))
+            yield row
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,143 @@
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from scrapy.utils.test import get_crawler
+
+from jurnal_scraping.spiders.doaj_kesehatan_id import DoajKesehatanIndonesiaSpider
+
+
+@pytest.fixture
+def make_spider(tmp_path):
+    """Build the spider through a crawler with ``settings`` overrides."""
+
+    def make(**settings):
+        settings.setdefault("LANDING_RULES_PATH", str(tmp_path / "landing_rules.json"))
+        crawler = get_crawler(DoajKesehatanIndonesiaSpider, settings)
+        crawler.spider = crawler._create_spider()
+        return crawler.spider
+
+    return make
+
+
+@pytest.fixture
+def make_row():
+    """Build the output row of article ``n``; ``fields`` override columns."""
+
+    def make(n, **fields):
+        row = {
+            "journal_title": "Jurnal Kesehatan",
+            "title": f"Artikel {n}",
+            "authors": "A; B",
+            "affiliation": "Universitas",
+            "abstract": "Abstrak",
+            "pdf_url": f"https://ojs.example.id/{n}.pdf",
+            "pdf_local_path": f"pdfs/{n}.pdf",
+            "source_url": f"https://doaj.org/article/{n}",
+        }
+        row.update(fields)
+        return row
+
+    return make
+
+
+@pytest.fixture
+def run_pipeline():
+    """Open ``pipeline``, pass ``rows`` through it and close it again."""
+
+    def run(pipeline, spider, rows):
+        pipeline.open_spider(spider)
+        for row in rows:
+            pipeline.process_item(row, spider)
+        pipeline.close_spider(spider)
+        return pipeline
+
+    return run
+
+
+class PdfServer(ThreadingHTTPServer):
+    """Serves ``pdf`` at ``/paper.pdf`` with an ETag and byte-range support.
+
+    ``drop_after`` cuts the next full (non-range) response off after that
+    many bytes; ``stall_for`` then keeps the connection open that many
+    seconds without sending more. Headers of every PDF request are kept in
+    ``requests``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, pdf: bytes):
+        super().__init__(("127.0.0.1", 0), _PdfHandler)
+        self.pdf = pdf
+        self.drop_after: int | None = None
+        self.stall_for = 0.0
+        self.requests: list[dict[str, str]] = []
+
+    @property
+    def etag(self) -> str:
+        return '"%s"' % hashlib.md5(self.pdf).hexdigest()
+
+    @property
+    def pdf_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/paper.pdf"
+
+
+class _PdfHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        if self.path != "/paper.pdf":
+            self._send(200, b"<html></html>", {"Content-Type": "text/html"})
+            return
+        server.requests.append(dict(self.headers))
+        pdf = server.pdf
+        headers = {
+            "Content-Type": "application/pdf",
+            "Accept-Ranges": "bytes",
+            "ETag": server.etag,
+        }
+        match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        if match and self.headers.get("If-Range") == server.etag:
+            start = int(match.group(1))
+            headers["Content-Range"] = f"bytes {start}-{len(pdf) - 1}/{len(pdf)}"
+            self._send(206, pdf[start:], headers)
+            return
+        if server.drop_after is not None:
+            cut, server.drop_after = server.drop_after, None
+            headers["Content-Length"] = str(len(pdf))
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(pdf[:cut])
+            self.wfile.flush()
+            time.sleep(server.stall_for)
+            self.close_connection = True
+            return
+        self._send(200, pdf, headers)
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def pdf_server():
+    """Start a ``PdfServer`` in a thread; set ``.pdf`` before crawling."""
+    server = PdfServer(b"%PDF-1.4\n")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,97 @@
+"""Download one PDF with PdfDownloadPipeline in a fresh process.
+
+    python tests/pdf_crawl.py <pdf_url> <files_store> <result.json> [NAME=VALUE ...]
+
+Used by the streaming/resume tests: a Twisted reactor cannot be restarted
+inside the pytest process. Writes the stored items, the reasons items were
+dropped for, the ``len(response.body)`` of every PDF response, the ``jurnal/``
+stats and the traced memory peak of the crawl to ``result.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tracemalloc
+
+import scrapy
+from scrapy import signals
+from scrapy.crawler import CrawlerProcess
+
+
+class OnePdfSpider(scrapy.Spider):
+    name = "one_pdf"
+
+    def __init__(self, pdf_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.pdf_url = pdf_url
+        self.items = []
+        self.dropped = []
+        self.body_lengths = []
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        crawler.signals.connect(spider.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(spider.item_dropped, signal=signals.item_dropped)
+        crawler.signals.connect(spider.response_received, signal=signals.response_received)
+        return spider
+
+    def start_requests(self):
+        # Any page will do; the item only needs the PDF URL.
+        yield scrapy.Request(self.pdf_url.rsplit("/", 1)[0] + "/", dont_filter=True)
+
+    def parse(self, response):
+        yield {"title": "Artikel", "pdf_url": self.pdf_url}
+
+    def item_scraped(self, item, response, spider):
+        self.items.append({"pdf_local_path": item.get("pdf_local_path"), "files": item["files"]})
+
+    def item_dropped(self, item, response, exception, spider):
+        self.dropped.append(str(exception))
+
+    def response_received(self, response, request, spider):
+        if request.url == self.pdf_url:
+            self.body_lengths.append(len(response.body))
+
+
+def main(argv):
+    pdf_url, files_store, result_path, *overrides = argv
+    settings = {
+        "ITEM_PIPELINES": {"jurnal_scraping.pipelines.PdfDownloadPipeline": 300},
+        "DOWNLOAD_HANDLERS": {
+            "http": "jurnal_scraping.downloadhandlers.SpoolingDownloadHandler",
+        },
+        "FILES_STORE": files_store,
+        "HTTPPROXY_ENABLED": False,
+        "ROBOTSTXT_OBEY": False,
+        "TELNETCONSOLE_ENABLED": False,
+        "LOG_LEVEL": "WARNING",
+    }
+    for override in overrides:
+        name, _, value = override.partition("=")
+        settings[name] = value
+
+    process = CrawlerProcess(settings)
+    crawler = process.create_crawler(OnePdfSpider)
+    tracemalloc.start()
+    process.crawl(crawler, pdf_url=pdf_url)
+    process.start()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    spider = crawler.spider
+    stats = {k: v for k, v in crawler.stats.get_stats().items() if k.startswith("jurnal/")}
+    result = {
+        "items": spider.items,
+        "dropped": spider.dropped,
+        "body_lengths": spider.body_lengths,
+        "stats": stats,
+        "peak": peak,
+    }
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,47 @@
+import csv
+
+import pytest
+
+from jurnal_scraping.pipelines import CsvAppendPipeline
+
+
+def _csv_pipeline(csv_path):
+    return CsvAppendPipeline(str(csv_path), flush_seconds=0)
+
+
+def _titles(csv_path):
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return [row["title"] for row in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize("cut", [1, 2, 10])
+def test_torn_last_row_is_dropped(tmp_path, make_spider, make_row, run_pipeline, cut):
+    # cut=1 and cut=2 leave a row that still parses into all columns.
+    spider = make_spider()
+    csv_path = tmp_path / "index.csv"
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1), make_row(2)])
+    data = csv_path.read_bytes()
+    csv_path.write_bytes(data[:-cut])
+
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(3)])
+
+    assert _titles(csv_path) == ["Artikel 1", "Artikel 3"]
+
+
+def test_torn_header_starts_a_new_file(tmp_path, make_spider, make_row, run_pipeline):
+    spider = make_spider()
+    csv_path = tmp_path / "index.csv"
+    csv_path.write_bytes(b"journal_title,title,auth")
+
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1)])
+
+    assert _titles(csv_path) == ["Artikel 1"]
+
+
+def test_complete_file_is_left_alone(tmp_path, make_spider, make_row, run_pipeline):
+    spider = make_spider()
+    csv_path = tmp_path / "index.csv"
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1)])
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(2)])
+
+    assert _titles(csv_path) == ["Artikel 1", "Artikel 2"]
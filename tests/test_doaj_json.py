@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from jurnal_scraping import doaj_json
+
+PAGE = json.dumps(
+    {
+        "total": 2,
+        "page": 1,
+        "results": [{"id": "a", "bibjson": {"title": "x"}}, {"id": "b"}],
+        "last": "https://doaj.org/api/v2/search/articles/x?page=1",
+    }
+).encode("utf-8")
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_iter_members_yields_array_elements_one_by_one(streaming):
+    members = list(doaj_json.iter_members(PAGE, streaming=streaming))
+    assert members == [
+        ("total", 2),
+        ("page", 1),
+        ("results", {"id": "a", "bibjson": {"title": "x"}}),
+        ("results", {"id": "b"}),
+        ("last", "https://doaj.org/api/v2/search/articles/x?page=1"),
+    ]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_iter_members_handles_empty_object_and_array(streaming):
+    assert list(doaj_json.iter_members(b"{}", streaming=streaming)) == []
+    assert list(doaj_json.iter_members(b' { "results" : [ ] } ', streaming=streaming)) == []
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_iter_members_rejects_malformed_input(streaming):
+    with pytest.raises(ValueError):
+        list(doaj_json.iter_members(b'{"total": 1, "results": [{"id": ', streaming=streaming))
+    with pytest.raises(ValueError):
+        list(doaj_json.iter_members(b"[1, 2]", streaming=streaming))
+
+
+def test_streaming_yields_records_before_the_rest_is_parsed():
+    members = doaj_json.iter_members(b'{"results": [{"id": "a"}, {"id": ', streaming=True)
+    assert next(members) == ("results", {"id": "a"})
+    with pytest.raises(ValueError):
+        next(members)
@@ -0,0 +1,90 @@
+import os
+import time
+
+import pytest
+from scrapy import Request
+from scrapy.http import TextResponse
+
+from jurnal_scraping import httpcache
+from jurnal_scraping.httpcache import CompressedCacheStorage
+
+API_URL = "https://doaj.org/api/v2/search/articles/gizi?page={}"
+
+
+@pytest.fixture
+def make_storage(tmp_path, make_spider):
+    """Open a ``CompressedCacheStorage`` on ``tmp_path`` with ``settings``."""
+
+    def make(**settings):
+        settings.setdefault("HTTPCACHE_DIR", str(tmp_path / "cache"))
+        spider = make_spider(**settings)
+        storage = CompressedCacheStorage(spider.crawler.settings)
+        storage.open_spider(spider)
+        return spider, storage
+
+    return make
+
+
+def _store(spider, storage, page, body=b'{"results": []}'):
+    request = Request(API_URL.format(page))
+    response = TextResponse(
+        request.url, body=body, headers={"Content-Type": "application/json"}
+    )
+    storage.store_response(spider, request, response)
+    return request
+
+
+def test_entries_expire_after_httpcache_expiration_secs(make_storage):
+    spider, storage = make_storage(HTTPCACHE_EXPIRATION_SECS=60)
+    request = _store(spider, storage, 1)
+
+    cached = storage.retrieve_response(spider, request)
+    assert cached.status == 200 and cached.body == b'{"results": []}'
+    assert cached.url == request.url
+
+    path = storage._find(request)
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert storage.retrieve_response(spider, request) is None
+    assert storage.retrieve_response(spider, Request(API_URL.format(2))) is None
+
+
+def test_oldest_entries_are_evicted_down_to_90_percent(make_storage):
+    # Random bodies do not compress: every entry is a bit over 2000 bytes.
+    spider, storage = make_storage(HTTPCACHE_MAX_BYTES=10_000, HTTPCACHE_COMPRESSION="gzip")
+    requests = []
+    for page in range(1, 6):
+        requests.append(_store(spider, storage, page, os.urandom(2000)))
+        # Distinct mtimes so the eviction order is the storage order.
+        stamp = time.time() - 100 + page
+        os.utime(storage._find(requests[-1]), (stamp, stamp))
+
+    assert storage.total_bytes <= 9_000
+    assert storage._find(requests[0]) is None
+    assert storage._find(requests[-1]) is not None
+    kept = [r for r in requests if storage._find(r) is not None]
+    assert storage.total_bytes == sum(storage._find(r).stat().st_size for r in kept)
+    evicted = spider.crawler.stats.get_value("jurnal/httpcache/evicted")
+    assert evicted == len(requests) - len(kept)
+
+    # A new run counts what is already on disk.
+    _, reopened = make_storage(HTTPCACHE_MAX_BYTES=10_000)
+    assert reopened.total_bytes == storage.total_bytes
+
+
+@pytest.mark.skipif(httpcache.zstd is None, reason="needs a zstd module")
+def test_entries_written_with_another_codec_stay_readable(make_storage):
+    spider, gzip_storage = make_storage(HTTPCACHE_COMPRESSION="gzip")
+    request = _store(spider, gzip_storage, 1)
+    assert gzip_storage._find(request).suffix == ".gz"
+
+    spider, zstd_storage = make_storage(HTTPCACHE_COMPRESSION="zstd")
+    assert zstd_storage.retrieve_response(spider, request).body == b'{"results": []}'
+
+    # Storing it again replaces the gzip entry instead of keeping both.
+    _store(spider, zstd_storage, 1, b'{"results": [1]}')
+    path = zstd_storage._find(request)
+    assert path.suffix == ".zst"
+    assert not path.with_suffix(".gz").exists()
+    assert zstd_storage.total_bytes == path.stat().st_size
+    assert gzip_storage.retrieve_response(spider, request).body == b'{"results": [1]}'
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from jurnal_scraping.keyset import BloomFilter, DigestSet, make_key_set
+
+
+def _digests(count, seed=7):
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+def test_digest_set_is_exact():
+    values = _digests(20_000)
+    store = DigestSet(values[:5_000])
+    store.update(values)
+    for value in values[::3]:
+        store.add(value)
+    assert len(store) == len(set(values))
+    assert all(value in store for value in values)
+    assert not any(value in store for value in _digests(1_000, seed=8))
+
+
+@pytest.mark.parametrize("count", [0, 1, 5_000, 70_000])
+def test_merges_keep_the_array_sorted_and_unique(count):
+    values = _digests(count) + [0, 1, 2**64 - 1]
+    store = DigestSet(values[: count // 2])
+    for value in _digests(10_000, seed=9) + values:
+        store.add(value)
+    store.update(values)
+    store._merge()
+    expected = sorted(set(values) | set(_digests(10_000, seed=9)))
+    assert list(store._sorted) == expected
+    assert len(store) == len(expected)
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    values = _digests(10_000)
+    bloom = BloomFilter(capacity=10_000, fp_rate=0.01, values=values)
+    assert all(value in bloom for value in values)
+    false_positives = sum(value in bloom for value in _digests(10_000, seed=8))
+    assert false_positives < 300
+
+
+def test_make_key_set_kinds():
+    assert isinstance(make_key_set(), DigestSet)
+    assert isinstance(make_key_set("BLOOM", capacity=10), BloomFilter)
@@ -0,0 +1,29 @@
+from jurnal_scraping.keywords import DEFAULT_HEALTH_KEYWORDS, KeywordMatcher, get_matcher
+
+
+def test_find_reports_hits_in_list_order_case_insensitively():
+    matcher = KeywordMatcher(["gizi", "Rumah  Sakit", "medis"])
+    assert matcher.keywords == ("gizi", "rumah sakit", "medis")
+    assert matcher.find("Layanan MEDIS di rumah sakit", "status Gizi") == (
+        "gizi",
+        "rumah sakit",
+        "medis",
+    )
+
+
+def test_longer_keyword_also_reports_the_keywords_it_contains():
+    matcher = KeywordMatcher(["kesehatan", "kesehatan masyarakat"])
+    assert matcher.find("Jurnal Kesehatan Masyarakat") == ("kesehatan", "kesehatan masyarakat")
+
+
+def test_no_hits_and_empty_keyword_list():
+    assert KeywordMatcher(["gizi"]).find("ekonomi", "") == ()
+    assert not KeywordMatcher(["gizi"]).matches("ekonomi")
+    assert KeywordMatcher([]).find("gizi") == ()
+    assert not KeywordMatcher([" ", ""]).matches("gizi")
+
+
+def test_matcher_is_shared_per_keyword_list():
+    assert get_matcher() is get_matcher(DEFAULT_HEALTH_KEYWORDS)
+    assert get_matcher(["gizi"]) is get_matcher(["gizi"])
+    assert get_matcher(["gizi"]) is not get_matcher()
@@ -0,0 +1,59 @@
+from jurnal_scraping.landing import LandingRuleCache, scan_pdf_url
+
+
+def test_finds_citation_pdf_url_meta_tag():
+    body = (
+        b"<html><head><meta name='citation_title' content='Judul'>"
+        b'<meta content="https://ojs.example.id/index.php/j/article/download/1/2?a=1&amp;b=2"'
+        b' name="citation_pdf_url"/></head><body>...</body></html>'
+    )
+    assert (
+        scan_pdf_url(body, 4096)
+        == "https://ojs.example.id/index.php/j/article/download/1/2?a=1&b=2"
+    )
+
+
+def test_finds_alternate_pdf_link_and_keeps_it_relative():
+    body = b'<HEAD><LINK REL="alternate" TYPE="application/pdf" HREF=/files/1.pdf></HEAD>'
+    assert scan_pdf_url(body, 4096) == "/files/1.pdf"
+
+
+def test_ignores_other_links_and_empty_values():
+    body = (
+        b'<meta name="citation_pdf_url" content="">'
+        b'<link rel="stylesheet" type="application/pdf" href="/not-alternate.pdf">'
+        b'<meta name="DC.citation_pdf_url_note" content="/x.pdf">'
+    )
+    assert scan_pdf_url(body, 4096) == ""
+
+
+def test_only_scans_the_first_limit_bytes():
+    body = b"<head>" + b" " * 5000 + b'<meta name="citation_pdf_url" content="/1.pdf">'
+    assert scan_pdf_url(body, 4096) == ""
+    assert scan_pdf_url(body, 0) == "/1.pdf"
+
+
+def test_decodes_with_the_page_encoding():
+    body = '<meta name="citation_pdf_url" content="/berkas/gizi-é.pdf">'.encode("latin-1")
+    assert scan_pdf_url(body, 4096, encoding="latin-1") == "/berkas/gizi-é.pdf"
+
+
+def test_rule_is_forgotten_after_max_misses_and_persisted(tmp_path):
+    path = str(tmp_path / "rules" / "landing.json")
+    cache = LandingRuleCache(path)
+    cache.learn("ojs.example.id", "anchor_text", "a.pdf")
+    cache.learn("ojs.example.id", "anchor_text", "a.pdf")
+    assert cache.get("ojs.example.id")["hits"] == 2
+
+    cache.learn("jurnal.example.ac.id", "meta")
+    for _ in range(LandingRuleCache.max_misses - 1):
+        cache.miss("jurnal.example.ac.id")
+    cache.hit("jurnal.example.ac.id")
+    for _ in range(LandingRuleCache.max_misses):
+        cache.miss("jurnal.example.ac.id")
+    assert cache.get("jurnal.example.ac.id") is None
+
+    cache.save()
+    loaded = LandingRuleCache(path)
+    loaded.load()
+    assert loaded.rules == cache.rules
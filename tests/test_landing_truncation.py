@@ -0,0 +1,52 @@
+import pytest
+from scrapy import Request
+from scrapy.exceptions import StopDownload
+from scrapy.http import Headers
+
+
+def _landing_request():
+    return Request("https://ojs.example.id/article/view/1", meta={"landing_download": {}})
+
+
+def _receive(spider, request, body_length, chunks):
+    headers = Headers({"Content-Type": "text/html"})
+    spider._on_headers_received(headers, body_length, request, spider)
+    for chunk in chunks:
+        spider._on_bytes_received(chunk, request, spider)
+
+
+def test_landing_page_is_cut_off_after_landing_max_bytes(make_spider):
+    spider = make_spider(LANDING_MAX_BYTES=1000)
+    request = _landing_request()
+
+    _receive(spider, request, 5000, [b"x" * 600])
+    with pytest.raises(StopDownload) as excinfo:
+        spider._on_bytes_received(b"x" * 600, request, spider)
+
+    # fail=False: Scrapy delivers the bytes so far as a normal response.
+    assert excinfo.value.fail is False
+    stats = spider.crawler.stats
+    assert stats.get_value("jurnal/landing/truncated") == 1
+    assert stats.get_value("jurnal/landing/truncated_bytes_read") == 1200
+    assert stats.get_value("jurnal/landing/truncated_bytes_saved") == 3800
+    assert stats.get_value("jurnal/landing/truncated_seconds_saved") is not None
+
+
+def test_unknown_length_is_cut_off_without_a_savings_estimate(make_spider):
+    spider = make_spider(LANDING_MAX_BYTES=1000)
+
+    with pytest.raises(StopDownload):
+        _receive(spider, _landing_request(), None, [b"x" * 1000])
+
+    stats = spider.crawler.stats
+    assert stats.get_value("jurnal/landing/truncated_bytes_read") == 1000
+    assert stats.get_value("jurnal/landing/truncated_bytes_saved") is None
+
+
+def test_other_requests_are_not_cut_off(make_spider):
+    spider = make_spider(LANDING_MAX_BYTES=1000)
+    pdf_request = Request("https://ojs.example.id/1.pdf")
+
+    _receive(spider, pdf_request, 5000, [b"x" * 5000])
+
+    assert spider.crawler.stats.get_value("jurnal/landing/truncated") is None
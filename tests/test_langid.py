@@ -0,0 +1,86 @@
+from langdetect import detector_factory
+
+from jurnal_scraping.langid import DetectionPool, LanguageDetector
+
+ID_TEXT = (
+    "Penelitian ini bertujuan untuk mengetahui hubungan antara pengetahuan ibu dan "
+    "status gizi balita yang ada di wilayah kerja puskesmas. Hasil penelitian "
+    "menunjukkan bahwa terdapat hubungan yang signifikan dengan status gizi dari "
+    "balita tersebut dan juga akan digunakan sebagai dasar intervensi."
+)
+EN_TEXT = (
+    "The aim of this study was to assess the relationship between maternal knowledge "
+    "and the nutritional status of children in the area. The results of the study "
+    "show that there is a significant association with the status of these children "
+    "and it has been used as a basis for intervention by the health office."
+)
+# Too few stop words for the pre-check: langdetect decides.
+SHORT_TEXT = "Status gizi balita stunting puskesmas kabupaten"
+
+
+def test_preclassifier_settles_clear_cut_texts_without_langdetect():
+    detector = LanguageDetector()
+    assert detector.detect(ID_TEXT) == "id"
+    assert detector.detect(EN_TEXT) == "en"
+    assert detector.preclassified == 2
+    assert detector.langdetect_calls == 0
+
+
+def test_mixed_or_short_texts_go_to_langdetect_and_are_cached():
+    detector = LanguageDetector()
+    bilingual = f"{ID_TEXT} {EN_TEXT}"
+    assert detector.preclassify_text(bilingual) == ""
+    assert detector.preclassify_text(SHORT_TEXT) == ""
+
+    first = detector.detect(SHORT_TEXT)
+    assert detector.detect(SHORT_TEXT) == first
+    assert (detector.langdetect_calls, detector.cache_hits) == (1, 1)
+    assert detector.lookups == 2
+
+
+def test_preclassifier_can_be_disabled():
+    detector = LanguageDetector(preclassify=False)
+    assert detector.detect(ID_TEXT) == "id"
+    assert (detector.preclassified, detector.langdetect_calls) == (0, 1)
+
+
+def test_cache_is_a_bounded_lru():
+    detector = LanguageDetector(cache_size=2)
+    keys = [detector.lookup(text)[0] for text in ("a", "b", "c")]
+    detector.remember(keys[0], "id")
+    detector.remember(keys[1], "en")
+    assert detector.lookup("a") == (keys[0], "id")  # "a" is now the newest
+    detector.remember(keys[2], "id")
+
+    assert detector.lookup("b") == (keys[1], None)
+    assert detector.lookup("a")[1] == "id"
+    assert detector.lookup("c")[1] == "id"
+
+
+def test_cache_is_saved_and_loaded(tmp_path):
+    path = str(tmp_path / "cache" / "langdetect.json")
+    detector = LanguageDetector(cache_path=path, preclassify=False)
+    lang = detector.detect(SHORT_TEXT)
+    detector.save()
+
+    restored = LanguageDetector(cache_path=path, preclassify=False)
+    restored.load()
+    assert restored.detect(SHORT_TEXT) == lang
+    assert (restored.cache_hits, restored.langdetect_calls) == (1, 0)
+
+
+def test_missing_cache_file_and_empty_cache_are_no_ops(tmp_path):
+    path = tmp_path / "langdetect.json"
+    detector = LanguageDetector(cache_path=str(path))
+    detector.load()
+    detector.save()
+    assert not path.exists()
+
+
+def test_thread_pool_loads_profiles_before_starting_workers(monkeypatch):
+    monkeypatch.setattr(detector_factory, "_factory", None)
+    pool = DetectionPool(LanguageDetector(), workers=2)
+    try:
+        assert detector_factory._factory is not None
+    finally:
+        pool.close()
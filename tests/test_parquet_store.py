@@ -0,0 +1,53 @@
+import pytest
+
+from jurnal_scraping.parquet_store import ParquetPartWriter, compact
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+FIELDS = ["title", "pdf_url"]
+
+
+def _rows(count):
+    return [
+        {"title": f"Artikel {n}", "pdf_url": f"https://ojs.example.id/{n}.pdf"}
+        for n in range(count)
+    ]
+
+
+def _finished(directory):
+    return sorted(directory.glob("part-*.parquet"))
+
+
+def test_parts_are_finished_every_part_rows(tmp_path):
+    writer = ParquetPartWriter(str(tmp_path), FIELDS, row_group_rows=3, part_rows=4)
+    for row in _rows(11):
+        writer.write(row)
+
+    # Two full parts are readable before close; the third is still open.
+    parts = _finished(tmp_path)
+    assert [pq.ParquetFile(str(p)).metadata.num_rows for p in parts] == [4, 4]
+    assert [pq.ParquetFile(str(p)).metadata.num_row_groups for p in parts] == [2, 2]
+    assert len(list(tmp_path.glob("*.tmp"))) == 1
+
+    writer.close()
+    parts = _finished(tmp_path)
+    assert writer.paths == parts
+    assert [pq.ParquetFile(str(p)).metadata.num_rows for p in parts] == [4, 4, 3]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_crash_loses_only_the_open_part(tmp_path):
+    writer = ParquetPartWriter(str(tmp_path), FIELDS, row_group_rows=2, part_rows=5)
+    for row in _rows(12):
+        writer.write(row)
+    # No close(): the process died.
+
+    assert compact(str(tmp_path)) == (2, 10)
+    titles = pq.read_table(str(_finished(tmp_path)[0])).column("title").to_pylist()
+    assert titles == [row["title"] for row in _rows(10)]
+
+
+def test_close_without_rows_writes_nothing(tmp_path):
+    writer = ParquetPartWriter(str(tmp_path), FIELDS)
+    writer.close()
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from scrapy import Request
+from scrapy.http import TextResponse
+
+from jurnal_scraping.items import JournalArticleItem
+
+
+def _response(payload, page=1, last_page=None):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    request = Request(
+        f"https://doaj.org/api/v2/search/articles/gizi?page={page}",
+        meta={"query": "gizi", "page": page, "last_page": last_page},
+    )
+    return TextResponse(request.url, body=body, encoding="utf-8", request=request)
+
+
+def _record(record_id):
+    return {
+        "id": record_id,
+        "bibjson": {
+            "title": f"Status gizi {record_id}",
+            "abstract": "Penelitian kesehatan tentang gizi balita.",
+            "link": [{"type": "fulltext", "url": f"https://ojs.example.id/{record_id}.pdf"}],
+        },
+    }
+
+
+def _split(output):
+    pages = [r.meta["page"] for r in output if isinstance(r, Request)]
+    items = [i for i in output if isinstance(i, JournalArticleItem)]
+    return pages, items
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_total_after_results_still_fans_out(make_spider, streaming):
+    spider = make_spider(DOAJ_JSON_STREAMING=streaming, SEARCH_PAGE_WINDOW=2)
+    payload = {"results": [_record("a"), _record("b")], "total": 500}
+    pages, items = _split(list(spider.parse_search(_response(payload))))
+    assert pages == [2, 3]
+    assert len(items) == 2
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_empty_page_without_total_stops_paging(make_spider, streaming):
+    spider = make_spider(DOAJ_JSON_STREAMING=streaming)
+    assert list(spider.parse_search(_response({"results": []}, page=4))) == []
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_record_errors_are_not_reported_as_json_errors(make_spider, monkeypatch, streaming):
+    spider = make_spider(DOAJ_JSON_STREAMING=streaming)
+
+    def broken(record, seen_ids):
+        raise ValueError("not a JSON problem")
+        yield
+
+    monkeypatch.setattr(spider, "_handle_record", broken)
+    with pytest.raises(ValueError, match="not a JSON problem"):
+        list(spider.parse_search(_response({"total": 1, "results": [_record("a")]})))
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_truncated_body_is_logged_and_skipped(make_spider, streaming, caplog):
+    spider = make_spider(DOAJ_JSON_STREAMING=streaming)
+    list(spider.parse_search(_response(b'{"total": 1, "results": [{"id": ')))
+    assert "JSON decode failed" in caplog.text
@@ -0,0 +1,66 @@
+import hashlib
+import os
+import time
+
+from scrapy import Request
+from scrapy.http import Response
+
+from jurnal_scraping.pipelines import PdfDownloadPipeline
+
+BODY = b"%PDF-1.4\n" + b"isi artikel " * 1000
+
+
+def _pipeline(make_spider, tmp_path, **settings):
+    spider = make_spider(FILES_STORE=str(tmp_path / "store"), **settings)
+    pipeline = PdfDownloadPipeline.from_crawler(spider.crawler)
+    pipeline.open_spider(spider)
+    return pipeline, spider
+
+
+def _download(pipeline, spider, url, body=BODY):
+    request = Request(url)
+    response = Response(url, body=body, headers={"Content-Type": "application/pdf"})
+    info = pipeline.spiderinfo
+    checksum = pipeline.file_downloaded(response, request, info)
+    return checksum, pipeline.file_path(request, response=response, info=info)
+
+
+def test_same_bytes_from_two_urls_are_stored_once(tmp_path, make_spider):
+    pipeline, spider = _pipeline(make_spider, tmp_path, PDF_STORE_BY_CONTENT=True)
+    sha256 = hashlib.sha256(BODY).hexdigest()
+
+    first = _download(pipeline, spider, "https://ojs.example.id/article/view/1/2")
+    second = _download(pipeline, spider, "https://ojs.example.id/article/download/1/2")
+
+    assert first == second == (sha256, f"pdfs/{sha256}.pdf")
+    assert (tmp_path / "store" / "pdfs" / f"{sha256}.pdf").read_bytes() == BODY
+    stats = spider.crawler.stats
+    assert stats.get_value("jurnal/pdf/content_unique") == 1
+    assert stats.get_value("jurnal/pdf/content_duplicate") == 1
+
+
+def test_works_without_stats(tmp_path, make_spider):
+    pipeline, spider = _pipeline(make_spider, tmp_path, PDF_STORE_BY_CONTENT=True)
+    pipeline._stats = None
+
+    checksum, path = _download(pipeline, spider, "https://ojs.example.id/1.pdf")
+
+    assert (tmp_path / "store" / path).read_bytes() == BODY
+    assert checksum == hashlib.sha256(BODY).hexdigest()
+
+
+def test_not_modified_restarts_the_stored_files_age(tmp_path, make_spider):
+    pipeline, spider = _pipeline(make_spider, tmp_path, PDF_CONDITIONAL_REFETCH=True)
+    url = "https://ojs.example.id/1.pdf"
+    _, path = _download(pipeline, spider, url)
+    stored = tmp_path / "store" / path
+    os.utime(stored, (1_000_000, 1_000_000))
+
+    request = Request(url)
+    pipeline._add_validators(request)
+    response = Response(url, status=304, request=request)
+    result = pipeline.media_downloaded(response, request, pipeline.spiderinfo)
+
+    assert result["status"] == "uptodate" and result["path"] == path
+    assert stored.stat().st_mtime > time.time() - 60
+    assert spider.crawler.stats.get_value("jurnal/pdf/not_modified") == 1
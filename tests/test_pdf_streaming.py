@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from jurnal_scraping.downloadhandlers import SPOOL_HEAD_BYTES, _SpoolBuffer, resume_info_path
+
+CRAWL = Path(__file__).with_name("pdf_crawl.py")
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def crawl_pdf(tmp_path, pdf_url, *settings):
+    """Run tests/pdf_crawl.py against ``pdf_url``; returns its result dict."""
+    result = tmp_path / "result.json"
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    subprocess.run(
+        [sys.executable, str(CRAWL), pdf_url, str(tmp_path / "store"), str(result), *settings],
+        check=True,
+        cwd=tmp_path,
+        env=env,
+        timeout=120,
+    )
+    return json.loads(result.read_text())
+
+
+def _big_pdf(size):
+    return b"%PDF-1.4\n" + bytes(range(256)) * (size // 256)
+
+
+def test_large_pdf_is_spooled_to_disk_not_memory(tmp_path, pdf_server):
+    pdf_server.pdf = _big_pdf(32 << 20)
+
+    result = crawl_pdf(tmp_path, pdf_server.pdf_url, "DOWNLOAD_WARNSIZE=0")
+
+    (item,) = result["items"]
+    stored = tmp_path / "store" / item["pdf_local_path"]
+    assert hashlib.md5(stored.read_bytes()).hexdigest() == item["files"][0]["checksum"]
+    assert stored.read_bytes() == pdf_server.pdf
+    # Only the head reached response.body, and the body never sat in memory
+    # (the peak is the crawl's own ~13 MB, whatever the file size).
+    assert result["body_lengths"] == [SPOOL_HEAD_BYTES]
+    assert result["peak"] < len(pdf_server.pdf) // 2
+    assert not list((tmp_path / "store" / ".partial").iterdir())
+
+
+def test_in_memory_download_without_streaming(tmp_path, pdf_server):
+    pdf_server.pdf = _big_pdf(1 << 20)
+
+    result = crawl_pdf(tmp_path, pdf_server.pdf_url, "PDF_STREAM_TO_DISK=False")
+
+    (item,) = result["items"]
+    assert (tmp_path / "store" / item["pdf_local_path"]).read_bytes() == pdf_server.pdf
+    assert result["body_lengths"] == [len(pdf_server.pdf)]
+
+
+def test_empty_body_leaves_no_spool_file(tmp_path):
+    spool = {"path": str(tmp_path / ".partial" / "x.part")}
+    Path(resume_info_path(spool["path"])).parent.mkdir()
+    Path(resume_info_path(spool["path"])).write_text("{}")
+
+    buffer = _SpoolBuffer(spool)
+    assert buffer.getvalue() == b""
+
+    assert spool["size"] == 0
+    assert not list((tmp_path / ".partial").iterdir())
+
+
+def test_stalled_download_is_cut_off_after_pdf_max_seconds(tmp_path, pdf_server):
+    pdf_server.pdf = _big_pdf(1 << 20)
+    pdf_server.drop_after, pdf_server.stall_for = 4096, 30
+
+    started = time.monotonic()
+    result = crawl_pdf(tmp_path, pdf_server.pdf_url, "PDF_MAX_SECONDS=1", "RETRY_ENABLED=False")
+
+    assert time.monotonic() - started < 20
+    assert result["items"] == []
+    assert result["dropped"] == ["pdf_skipped_too_slow"]
+    assert result["stats"]["jurnal/pdf/skipped_too_slow"] == 1
+
+
+def test_stall_times_out_after_download_timeout_and_is_retried(tmp_path, pdf_server):
+    pdf_server.pdf = _big_pdf(1 << 20)
+    pdf_server.drop_after, pdf_server.stall_for = 4096, 30
+
+    started = time.monotonic()
+    result = crawl_pdf(tmp_path, pdf_server.pdf_url, "DOWNLOAD_TIMEOUT=1", "PDF_MAX_SECONDS=60")
+
+    assert time.monotonic() - started < 20
+    (item,) = result["items"]
+    assert (tmp_path / "store" / item["pdf_local_path"]).read_bytes() == pdf_server.pdf
+    assert pdf_server.requests[-1]["Range"] == "bytes=4096-"
+    assert "jurnal/pdf/skipped_too_slow" not in result["stats"]
+
+
+def test_dropped_download_is_resumed_by_the_next_run(tmp_path, pdf_server):
+    pdf_server.pdf = _big_pdf(4 << 20)
+    pdf_server.drop_after = 1 << 20
+
+    first = crawl_pdf(tmp_path, pdf_server.pdf_url, "RETRY_ENABLED=False")
+
+    assert first["items"] == []
+    (partial,) = (tmp_path / "store" / ".partial").glob("*.part")
+    assert partial.read_bytes() == pdf_server.pdf[: 1 << 20]
+
+    second = crawl_pdf(tmp_path, pdf_server.pdf_url, "RETRY_ENABLED=False")
+
+    assert pdf_server.requests[-1]["Range"] == f"bytes={1 << 20}-"
+    assert pdf_server.requests[-1]["If-Range"] == pdf_server.etag
+    assert second["stats"]["jurnal/pdf/resumed_bytes"] == 1 << 20
+    (item,) = second["items"]
+    stored = (tmp_path / "store" / item["pdf_local_path"]).read_bytes()
+    assert hashlib.md5(stored).hexdigest() == hashlib.md5(pdf_server.pdf).hexdigest()
+    assert item["files"][0]["checksum"] == hashlib.md5(pdf_server.pdf).hexdigest()
+    assert not list((tmp_path / "store" / ".partial").iterdir())
+
+
+def test_html_at_a_pdf_url_is_aborted_after_the_first_bytes(tmp_path, pdf_server):
+    # Served as application/pdf: only sniffing the body can tell.
+    pdf_server.pdf = b"<!DOCTYPE html><html>" + b" " * (4 << 20)
+
+    result = crawl_pdf(tmp_path, pdf_server.pdf_url, "RETRY_ENABLED=False")
+
+    assert result["items"] == []
+    assert result["dropped"] == ["pdf_not_a_pdf"]
+    assert result["body_lengths"] == []
+    assert result["stats"]["jurnal/pdf/aborted_non_pdf"] == 1
+    assert result["stats"]["jurnal/pdf/aborted_bytes"] < 1 << 20
+    assert not list((tmp_path / "store" / ".partial").iterdir())
+
+
+def test_html_content_type_is_aborted_before_the_body(tmp_path, pdf_server):
+    html_url = pdf_server.pdf_url.replace("paper.pdf", "article.pdf")
+
+    result = crawl_pdf(tmp_path, html_url, "RETRY_ENABLED=False")
+
+    assert result["items"] == []
+    assert result["dropped"] == ["pdf_not_a_pdf"]
+    assert result["stats"]["jurnal/pdf/aborted_non_pdf"] == 1
+    assert result["stats"]["jurnal/pdf/aborted_bytes"] == 0
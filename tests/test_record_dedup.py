@@ -0,0 +1,34 @@
+def _record(record_id, title="Status gizi balita"):
+    return {
+        "id": record_id,
+        "bibjson": {
+            "title": title,
+            "abstract": "Penelitian kesehatan tentang gizi balita di puskesmas.",
+            "link": [{"type": "fulltext", "url": f"https://ojs.example.id/{record_id}.pdf"}],
+        },
+    }
+
+
+def test_repeated_record_is_skipped_within_a_run(make_spider):
+    spider = make_spider()
+    seen = spider._seen_record_ids()
+    assert len(list(spider._handle_record(_record("a1"), seen))) == 1
+    assert list(spider._handle_record(_record("a1"), seen)) == []
+    assert spider.crawler.stats.get_value("jurnal/doaj_records_duplicate_skipped") == 1
+
+
+def test_only_stored_records_are_persisted(make_spider):
+    spider = make_spider()
+    spider.state = {}
+    seen = spider._seen_record_ids()
+    (stored,) = spider._handle_record(_record("a1"), seen)
+    (dropped,) = spider._handle_record(_record("a2", title="Gizi ibu hamil"), seen)
+    spider._on_item_scraped(stored, None, spider)
+    assert spider.state["doaj_seen_ids"] == {"a1"}
+
+    # Resumed run: the stored record is skipped, the dropped one is retried.
+    resumed = make_spider()
+    resumed.state = spider.state
+    seen = resumed._seen_record_ids()
+    assert list(resumed._handle_record(_record("a1"), seen)) == []
+    assert len(list(resumed._handle_record(_record("a2", title="Gizi ibu hamil"), seen))) == 1
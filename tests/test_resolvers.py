@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import pytest
+from scrapy.exceptions import DropItem
+
+from jurnal_scraping.resolvers import (
+    DEFAULT_RESOLVERS,
+    ResolverRegistry,
+    ojs_download_url,
+    repository_file_url,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://ojs.example.id/index.php/gizi/article/view/123/456",
+            "https://ojs.example.id/index.php/gizi/article/download/123/456",
+        ),
+        (
+            "http://jurnal.example.ac.id/index.php/kes/article/viewFile/77/pdf_12/",
+            "http://jurnal.example.ac.id/index.php/kes/article/download/77/pdf_12",
+        ),
+        (
+            "https://ojs.example.id/article/view/1/2/3?lang=id#page=1",
+            "https://ojs.example.id/article/download/1/2/3?lang=id",
+        ),
+        # The HTML landing page, not a galley.
+        ("https://ojs.example.id/index.php/gizi/article/view/123", ""),
+        ("https://ojs.example.id/index.php/gizi/issue/view/12/34", ""),
+    ],
+)
+def test_ojs_download_url(url, expected):
+    assert ojs_download_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url, expected_match",
+    [
+        ("https://repository.example.ac.id/bitstream/123/4/Artikel.PDF?sequence=1", True),
+        (
+            "https://repo.example.id/server/api/core/bitstreams/"
+            "0f1e2d3c-4b5a-6978-8695-a4b3c2d1e0f9/content",
+            True,
+        ),
+        ("https://repo.example.id/bitstreams/not-a-uuid/download", False),
+        ("https://repository.example.ac.id/handle/123/4", False),
+    ],
+)
+def test_repository_file_url(url, expected_match):
+    assert repository_file_url(url) == (url if expected_match else "")
+
+
+def test_registry_returns_first_match_and_its_name():
+    registry = ResolverRegistry.from_paths(DEFAULT_RESOLVERS)
+    assert registry.resolve("https://ojs.example.id/article/view/1/2") == (
+        "https://ojs.example.id/article/download/1/2",
+        "ojs_download_url",
+    )
+    assert registry.resolve("https://repo.example.id/files/1.pdf") == (
+        "https://repo.example.id/files/1.pdf",
+        "repository_file_url",
+    )
+    assert registry.resolve("https://doaj.org/article/abc") == ("", "")
+    assert registry.resolve("") == ("", "")
+
+
+def test_registered_resolvers_run_after_the_configured_ones():
+    registry = ResolverRegistry.from_paths(["jurnal_scraping.resolvers.repository_file_url"])
+    registry.register(lambda url: url + "/pdf" if "garuda" in url else "")
+
+    assert registry.resolve("https://garuda.example.id/documents/detail/1") == (
+        "https://garuda.example.id/documents/detail/1/pdf",
+        "<lambda>",
+    )
+    assert registry.resolve("https://garuda.example.id/1.pdf")[1] == "repository_file_url"
+
+
+def _resolved_item(make_spider):
+    spider = make_spider()
+    record = {
+        "id": "abc",
+        "bibjson": {
+            "title": "Status gizi balita",
+            "abstract": "Abstrak",
+            "link": [
+                {"type": "fulltext", "url": "https://ojs.example.id/article/view/1/2"},
+            ],
+        },
+    }
+    (item,) = spider._handle_record(record, set())
+    return spider, item
+
+
+def test_not_a_pdf_resolved_url_falls_back_to_the_landing_page(make_spider):
+    spider, item = _resolved_item(make_spider)
+    assert item["pdf_url"] == "https://ojs.example.id/article/download/1/2"
+    assert item["pdf_resolver"] == "ojs_download_url"
+    scheduled = []
+    spider.crawler.engine = SimpleNamespace(crawl=scheduled.append)
+
+    spider._on_item_dropped(item, None, DropItem("pdf_not_a_pdf"), spider)
+
+    (request,) = scheduled
+    assert request.url == "https://ojs.example.id/article/view/1/2"
+    assert request.callback == spider.parse_landing
+    fallback = request.meta["item"]
+    assert "pdf_resolver" not in fallback
+    assert fallback["pdf_url"] == "" and fallback["title"] == item["title"]
+    stats = spider.crawler.stats
+    assert stats.get_value("jurnal/resolver/not_a_pdf/ojs_download_url") == 1
+    assert stats.get_value("jurnal/resolver/landing_fallback") == 1
+
+
+def test_other_drops_do_not_fall_back(make_spider):
+    spider, item = _resolved_item(make_spider)
+    scheduled = []
+    spider.crawler.engine = SimpleNamespace(crawl=scheduled.append)
+
+    spider._on_item_dropped(item, None, DropItem("pdf_download_failed"), spider)
+    del item["pdf_resolver"]
+    spider._on_item_dropped(item, None, DropItem("pdf_not_a_pdf"), spider)
+
+    assert scheduled == []
+    assert spider.crawler.stats.get_value("jurnal/resolver/landing_fallback") is None
@@ -0,0 +1,74 @@
+from jurnal_scraping.pipelines import CsvAppendPipeline, ValidateDedupLimitPipeline
+from jurnal_scraping.resume_index import ResumeIndex
+
+
+def _csv_pipeline(csv_path):
+    return CsvAppendPipeline(str(csv_path), flush_seconds=0)
+
+
+def _resume(csv_path, store, spider, **attrs):
+    pipeline = ValidateDedupLimitPipeline()
+    pipeline._csv_path = str(csv_path)
+    pipeline._files_store = str(store)
+    for name, value in attrs.items():
+        setattr(pipeline, name, value)
+    pipeline.open_spider(spider)
+    return pipeline
+
+
+def test_index_counts_only_pdfs_on_disk(tmp_path, make_spider, make_row, run_pipeline):
+    spider = make_spider()
+    csv_path, store = tmp_path / "index.csv", tmp_path / "store"
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1), make_row(2), make_row(3)])
+    assert ResumeIndex(str(csv_path)).is_current()
+
+    assert _resume(csv_path, store, spider).existing_ok == 0
+
+    (store / "pdfs").mkdir(parents=True)
+    (store / "pdfs" / "2.pdf").write_bytes(b"%PDF-1.4")
+    assert _resume(csv_path, store, spider).existing_ok == 1
+
+
+def test_index_and_csv_scan_agree(tmp_path, make_spider, make_row, run_pipeline):
+    spider = make_spider()
+    csv_path, store = tmp_path / "index.csv", tmp_path / "store"
+    (store / "pdfs").mkdir(parents=True)
+    for n in (1, 3):
+        (store / "pdfs" / f"{n}.pdf").write_bytes(b"%PDF-1.4")
+    # Row 3 twice: a re-download of the same file counts once.
+    rows = [make_row(1), make_row(2), make_row(3), make_row(3)]
+    run_pipeline(_csv_pipeline(csv_path), spider, rows)
+
+    from_index = _resume(csv_path, store, spider)
+    from_csv = _resume(csv_path, store, spider, resume_verify_pdfs=True)
+    assert from_index.existing_ok == from_csv.existing_ok == 2
+
+
+def test_stale_index_is_rebuilt_from_csv(tmp_path, make_spider, make_row, run_pipeline):
+    spider = make_spider()
+    csv_path, store = tmp_path / "index.csv", tmp_path / "store"
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1)])
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("J,Artikel 2,,,Abstrak,https://ojs.example.id/2.pdf,pdfs/2.pdf,\r\n")
+    assert not ResumeIndex(str(csv_path)).is_current()
+
+    _resume(csv_path, store, spider)
+    index = ResumeIndex(str(csv_path))
+    assert index.is_current() and index.rows == 2
+
+
+def test_articles_with_missing_pdfs_are_harvested_again(
+    tmp_path, make_spider, make_row, run_pipeline
+):
+    spider = make_spider()
+    csv_path, store = tmp_path / "index.csv", tmp_path / "store"
+    (store / "pdfs").mkdir(parents=True)
+    (store / "pdfs" / "1.pdf").write_bytes(b"%PDF-1.4")
+    run_pipeline(_csv_pipeline(csv_path), spider, [make_row(1), make_row(2)])
+
+    for verify in (False, True):
+        _resume(csv_path, store, spider, resume_verify_pdfs=verify)
+        on_disk, missing = make_row(1), make_row(2)
+        assert spider._already_harvested(on_disk, on_disk["pdf_url"])
+        assert not spider._already_harvested(missing, missing["pdf_url"])
+        assert not spider._already_harvested(missing, "")
@@ -0,0 +1,69 @@
+from scrapy.http import HtmlResponse
+from twisted.python.failure import Failure
+
+from jurnal_scraping.spiders.doaj_kesehatan_id import DoajKesehatanIndonesiaSpider
+
+
+def _pages(requests):
+    return [r.meta["page"] for r in requests]
+
+
+def _spider(window=3):
+    spider = DoajKesehatanIndonesiaSpider()
+    spider.search_page_window = window
+    return spider
+
+
+def test_first_page_fans_out_up_to_the_window():
+    spider = _spider(window=3)
+    requests = list(spider._next_search_requests("gizi", 1, None, {"total": 950}))
+    assert _pages(requests) == [2, 3, 4]
+    assert {r.meta["last_page"] for r in requests} == {10}
+    assert all(r.meta["traffic_class"] == "api" for r in requests)
+
+
+def test_first_page_fan_out_stops_at_last_page():
+    spider = _spider(window=8)
+    requests = list(spider._next_search_requests("gizi", 1, None, {"total": 250}))
+    assert _pages(requests) == [2, 3]
+
+
+def test_later_pages_top_up_the_window_once():
+    spider = _spider(window=3)
+    # Pages 2..4 are in flight; each one schedules the page ``window`` ahead.
+    follow_ups = [
+        _pages(spider._next_search_requests("gizi", page, 10, {})) for page in range(2, 11)
+    ]
+    assert follow_ups == [[5], [6], [7], [8], [9], [10], [], [], []]
+
+
+def test_missing_total_walks_pages_serially():
+    spider = _spider(window=3)
+    assert _pages(spider._next_search_requests("gizi", 1, None, {})) == [2]
+    assert _pages(spider._next_search_requests("gizi", 2, None, {})) == [3]
+
+
+def _failed_page(spider, page, last_page, status=429):
+    request = spider._make_search_request("gizi", page, last_page=last_page)
+    return HtmlResponse(request.url, status=status, body=b"Too Many Requests", request=request)
+
+
+def test_failed_page_still_tops_up_the_window(make_spider):
+    spider = make_spider(SEARCH_PAGE_WINDOW=3)
+    response = _failed_page(spider, 4, 10)
+
+    assert _pages(spider.parse_search(response)) == [7]
+    assert spider.crawler.stats.get_value("jurnal/search_pages_failed") == 1
+
+
+def test_errback_still_tops_up_the_window(make_spider):
+    spider = make_spider(SEARCH_PAGE_WINDOW=3)
+    request = spider._make_search_request("gizi", 5, last_page=10)
+    failure = Failure(TimeoutError("took too long"))
+    failure.request = request
+
+    assert _pages(request.errback(failure)) == [8]
+    # Before the page count is known there is nothing to continue.
+    first = spider._make_search_request("gizi", 1)
+    failure.request = first
+    assert _pages(first.errback(failure)) == []
@@ -0,0 +1,71 @@
+import logging
+
+from jurnal_scraping.pipelines import SqliteAppendPipeline, ValidateDedupLimitPipeline
+from jurnal_scraping.resume_index import dedup_digest, source_digest
+
+PIPELINES = "jurnal_scraping.pipelines"
+
+
+def _sqlite_pipeline(db_path):
+    return SqliteAppendPipeline(str(db_path), batch_seconds=0)
+
+
+def _resume(make_spider, db_path, pipelines, store=None):
+    spider = make_spider(
+        RESUME_BACKEND="sqlite",
+        SQLITE_PATH=str(db_path),
+        ITEM_PIPELINES=pipelines,
+        FILES_STORE=str(store or db_path.parent / "store"),
+    )
+    pipeline = ValidateDedupLimitPipeline.from_crawler(spider.crawler)
+    pipeline.open_spider(spider)
+    return pipeline
+
+
+def _keys(row):
+    return (
+        dedup_digest(row["pdf_url"], row["source_url"], row["title"]),
+        source_digest(row["source_url"], row["title"]),
+    )
+
+
+def test_only_rows_with_pdfs_on_disk_are_loaded(tmp_path, make_spider, make_row, run_pipeline):
+    db_path, store = tmp_path / "articles.sqlite3", tmp_path / "store"
+    (store / "pdfs").mkdir(parents=True)
+    (store / "pdfs" / "1.pdf").write_bytes(b"%PDF-1.4")
+    on_disk = make_row(1)
+    # Same file as row 1 (content-addressed store): counts once.
+    same_file = make_row(4, pdf_local_path="pdfs/1.pdf")
+    no_pdf, missing = make_row(2, pdf_local_path=""), make_row(3)
+    rows = [on_disk, same_file, no_pdf, missing]
+    run_pipeline(_sqlite_pipeline(db_path), make_spider(), rows)
+
+    pipeline = _resume(make_spider, db_path, {f"{PIPELINES}.SqliteAppendPipeline": 420}, store)
+
+    for row in (on_disk, same_file):
+        assert all(key in pipeline.seen for key in _keys(row))
+    for row in (no_pdf, missing):
+        assert not any(key in pipeline.seen for key in _keys(row))
+    assert pipeline.existing_ok == 1
+
+
+def test_nothing_counts_without_the_pdf_folder(tmp_path, make_spider, make_row, run_pipeline):
+    db_path = tmp_path / "articles.sqlite3"
+    run_pipeline(_sqlite_pipeline(db_path), make_spider(), [make_row(1)])
+
+    pipeline = _resume(make_spider, db_path, {f"{PIPELINES}.SqliteAppendPipeline": 420})
+
+    assert pipeline.existing_ok == 0
+    assert not any(key in pipeline.seen for key in _keys(make_row(1)))
+
+
+def test_warns_when_the_sqlite_pipeline_is_not_enabled(tmp_path, make_spider, caplog):
+    db_path = tmp_path / "articles.sqlite3"
+    with caplog.at_level(logging.WARNING):
+        _resume(make_spider, db_path, {f"{PIPELINES}.CsvAppendPipeline": 400})
+    assert "SqliteAppendPipeline is not in ITEM_PIPELINES" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        _resume(make_spider, db_path, {f"{PIPELINES}.SqliteAppendPipeline": 420})
+    assert "SqliteAppendPipeline is not in ITEM_PIPELINES" not in caplog.text
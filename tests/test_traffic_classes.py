@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from scrapy import Request
+from scrapy.core.downloader import Downloader
+
+from jurnal_scraping import settings as project_settings
+from jurnal_scraping.middlewares import TrafficClassMiddleware
+
+
+def _setup(make_spider):
+    spider = make_spider(
+        TRAFFIC_CLASSES_ENABLED=True,
+        TRAFFIC_CLASS_SLOTS=project_settings.TRAFFIC_CLASS_SLOTS,
+        CONCURRENT_REQUESTS_PER_DOMAIN=project_settings.CONCURRENT_REQUESTS_PER_DOMAIN,
+    )
+    downloader = Downloader(spider.crawler)
+    spider.crawler.engine = SimpleNamespace(downloader=downloader)
+    return spider, downloader, TrafficClassMiddleware.from_crawler(spider.crawler)
+
+
+def test_requests_get_a_slot_per_class_and_host(make_spider):
+    spider, downloader, middleware = _setup(make_spider)
+    requests = {
+        "api:doaj.org": Request("https://doaj.org/api/v2/search/articles/gizi?page=2"),
+        "landing:doaj.org": Request("https://doaj.org/article/abc"),
+        "pdf:ojs.example.id": Request(
+            "https://ojs.example.id/1.pdf", meta={"traffic_class": "pdf"}
+        ),
+    }
+    for slot, request in requests.items():
+        middleware.process_request(request, spider)
+        assert request.meta["download_slot"] == slot
+        assert downloader.get_slot_key(request) == slot
+
+    own_slot = Request("https://doaj.org/article/x", meta={"download_slot": "custom"})
+    middleware.process_request(own_slot, spider)
+    assert own_slot.meta["download_slot"] == "custom"
+    assert "custom" not in downloader.per_slot_settings
+
+    stats = spider.crawler.stats
+    assert stats.get_value("jurnal/traffic/api/requests") == 1
+    assert stats.get_value("jurnal/traffic/landing/requests") == 2
+
+
+def test_slots_are_created_with_their_class_settings(make_spider):
+    spider, downloader, middleware = _setup(make_spider)
+    api = Request("https://doaj.org/api/v2/search/articles/gizi?page=2")
+    pdf = Request("https://ojs.example.id/1.pdf", meta={"traffic_class": "pdf"})
+    for request in (api, pdf):
+        middleware.process_request(request, spider)
+
+    assert downloader.per_slot_settings["pdf:ojs.example.id"] == {"concurrency": 4, "delay": 0.5}
+    _, pdf_slot = downloader._get_slot(pdf, spider)
+    assert pdf_slot.concurrency == 4
+    # The API class has no concurrency of its own: a full search window fits.
+    _, api_slot = downloader._get_slot(api, spider)
+    assert api_slot.concurrency == project_settings.CONCURRENT_REQUESTS_PER_DOMAIN
+    assert api_slot.concurrency >= project_settings.SEARCH_PAGE_WINDOW
+    assert api_slot.delay == 0.5